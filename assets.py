@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+import pygame
+
+
+class Asset_loader:
+    """
+    Loads the game's images and sounds in the background.
+
+    A worker thread decodes the files while the menu keeps animating. Images have to
+    be converted to the display format on the main thread, so the decoded images wait
+    until finalize() converts them, a few at a time, between two frames of the menu.
+    Files that were not preloaded (or are requested before the worker reached them)
+    are simply loaded on the spot.
+
+    Attributes:
+        images (dict): A dictionary mapping image paths to converted surfaces.
+        sounds (dict): A dictionary mapping sound paths to loaded sounds.
+        decoded (list): The (path, surface) images decoded by the worker, waiting to be converted.
+        pending (int): The number of queued files not finalized yet.
+        total (int): The number of files queued by the last call to start().
+        worker (Thread): The worker thread decoding the files.
+        lock (Lock): Guards the list of decoded images.
+        decode_time (float): The time in seconds the worker spent decoding files.
+        convert_time (float): The time in seconds the main thread spent converting images.
+
+    Methods:
+        start(images, sounds): Starts decoding the given files on the worker thread.
+        finalize(budget): Converts decoded images until the time budget runs out.
+        done(): Returns whether every queued file is ready to use.
+        progress(): Returns the fraction of the queued files that are ready to use.
+        load_image(path): Returns the converted image, loading it now if needed.
+        load_sound(path): Returns the sound, loading it now if needed.
+        release_image(path): Drops a converted image.
+        release_sound(path): Drops a loaded sound.
+        stats(): Returns the counters and timings of the loader.
+    """
+
+    images = {}
+    sounds = {}
+    decoded = []
+    pending = 0
+    total = 0
+    worker = None
+    lock = threading.Lock()
+    decode_time = 0.0
+    convert_time = 0.0
+
+    @classmethod
+    def start(cls, images, sounds):
+        images = [path for path in images if path not in cls.images]
+        sounds = [path for path in sounds if path not in cls.sounds]
+        cls.pending = cls.total = len(images) + len(sounds)
+        cls.worker = threading.Thread(
+            target=cls.decode, args=(images, sounds), daemon=True
+        )
+        cls.worker.start()
+
+    @classmethod
+    def decode(cls, images, sounds):
+        # Runs on the worker thread, nothing here may touch the display
+        for path in images + sounds:
+            start = time.perf_counter()
+            try:
+                if path in images:
+                    loaded = pygame.image.load(path)
+                else:
+                    loaded = pygame.mixer.Sound(path)
+            except (pygame.error, OSError):
+                # Left to load_image/load_sound, which report the error where it matters
+                loaded = None
+            cls.decode_time += time.perf_counter() - start
+            with cls.lock:
+                if loaded is None or path in sounds:
+                    if loaded is not None:
+                        cls.sounds.setdefault(path, loaded)
+                    cls.pending -= 1
+                else:
+                    cls.decoded.append((path, loaded))
+
+    @classmethod
+    def finalize(cls, budget=0.004):
+        # Converts images on the main thread for at most budget seconds
+        start = time.perf_counter()
+        while time.perf_counter() - start < budget:
+            with cls.lock:
+                waiting = not cls.decoded
+                if not waiting:
+                    path, surface = cls.decoded.pop(0)
+                    cls.pending -= 1
+            if waiting:
+                # Give the worker the rest of the budget instead of spinning
+                if cls.worker is None or not cls.worker.is_alive():
+                    return
+                time.sleep(0.001)
+                continue
+            if path not in cls.images:
+                converting = time.perf_counter()
+                cls.images[path] = surface.convert()
+                cls.convert_time += time.perf_counter() - converting
+
+    @classmethod
+    def done(cls):
+        return cls.pending == 0
+
+    @classmethod
+    def progress(cls):
+        if not cls.total:
+            return 1
+        return (cls.total - cls.pending) / cls.total
+
+    @classmethod
+    def load_image(cls, path):
+        image = cls.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert()
+            cls.images[path] = image
+        return image
+
+    @classmethod
+    def load_sound(cls, path):
+        sound = cls.sounds.get(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            cls.sounds[path] = sound
+        return sound
+
+    @classmethod
+    def release_image(cls, path):
+        cls.images.pop(path, None)
+
+    @classmethod
+    def release_sound(cls, path):
+        cls.sounds.pop(path, None)
+
+    @classmethod
+    def stats(cls):
+        return {
+            "images": len(cls.images),
+            "sounds": len(cls.sounds),
+            "pending": cls.pending,
+            "decode_time": round(cls.decode_time, 3),
+            "convert_time": round(cls.convert_time, 3),
+        }
+
+
+def image_files(directory="images", skip=()):
+    # Every image under the directory, except the given paths and directories
+    files = []
+    for root, directories, names in os.walk(directory):
+        directories[:] = sorted(
+            name
+            for name in directories
+            if os.path.join(root, name).replace(os.sep, "/") not in skip
+        )
+        for name in sorted(names):
+            path = os.path.join(root, name).replace(os.sep, "/")
+            if name.endswith((".png", ".jpg")) and path not in skip:
+                files.append(path)
+    return files
@@ -0,0 +1,264 @@
+import json
+import os
+import random
+import pygame
+from assets import Asset_loader
+
+# Where the atlas builder writes the packed pages and their index
+ATLAS_DIRECTORY = "images/atlas"
+ATLAS_INDEX = os.path.join(ATLAS_DIRECTORY, "atlas.json")
+ATLAS_PAGE_SIZE = 2048
+
+
+def frame_key(file, x, y, width, height):
+    # Key of a spritesheet rectangle in the atlas index
+    return f"{file}|{int(x)},{int(y)},{int(width)},{int(height)}"
+
+
+class Atlas:
+    """
+    The runtime loader of the packed texture atlas.
+
+    The index is read the first time a sprite is requested and the atlas pages are
+    taken from the asset loader, which usually decoded them while the menu was shown.
+    Every frame found in the index is then returned as a subsurface of its page, so
+    no pixels are copied and the original spritesheets are never opened.
+
+    Attributes:
+        enabled (bool): Whether spritesheet lookups should go through the atlas.
+        loaded (bool): Whether loading the atlas has already been attempted.
+        page_files (list): The file paths of the atlas pages.
+        sources (list): The file paths of the spritesheets packed into the atlas.
+        pages (list): The converted atlas page surfaces.
+        frames (dict): A dictionary mapping frame keys to (page, x, y) in the atlas.
+        hits (int): The number of sprites served from the atlas.
+        misses (int): The number of sprites that had to be cut from their spritesheet.
+
+    Methods:
+        load(index_path): Loads the atlas index.
+        files(): Returns the atlas pages to preload and the spritesheets they replace.
+        get_frame(file, x, y, width, height): Returns the atlas view of a sprite, if any.
+        stats(): Returns the hit/miss counters and the number of pages and frames.
+    """
+
+    enabled = True
+    loaded = False
+    page_files = []
+    sources = []
+    pages = []
+    frames = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def load(cls, index_path=ATLAS_INDEX):
+        cls.loaded = True
+        cls.page_files = []
+        cls.sources = []
+        cls.pages = []
+        cls.frames = {}
+        if not cls.enabled or not os.path.exists(index_path):
+            return False
+        with open(index_path) as file:
+            index = json.load(file)
+        # Ignore an atlas built from older versions of the spritesheets
+        built = os.path.getmtime(index_path)
+        for source in index["sources"]:
+            if os.path.exists(source) and os.path.getmtime(source) > built:
+                print(f"Texture atlas is older than {source}, run atlas.py again")
+                return False
+        directory = os.path.dirname(index_path)
+        cls.page_files = [os.path.join(directory, page) for page in index["pages"]]
+        cls.sources = index["sources"]
+        cls.frames = {key: tuple(value) for key, value in index["frames"].items()}
+        return True
+
+    @classmethod
+    def files(cls):
+        if not cls.loaded:
+            cls.load()
+        return cls.page_files, cls.sources
+
+    @classmethod
+    def get_frame(cls, file, x, y, width, height):
+        if not cls.loaded:
+            cls.load()
+        if not cls.frames:
+            return None
+        location = cls.frames.get(frame_key(file, x, y, width, height))
+        if location is None:
+            cls.misses += 1
+            return None
+        if not cls.pages:
+            cls.pages = [Asset_loader.load_image(page) for page in cls.page_files]
+        cls.hits += 1
+        page, atlas_x, atlas_y = location
+        return cls.pages[page].subsurface((atlas_x, atlas_y, int(width), int(height)))
+
+    @classmethod
+    def stats(cls):
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "pages": len(cls.page_files),
+            "frames": len(cls.frames),
+        }
+
+
+def request_every_frame():
+    """
+    Boots the game and requests every frame it can show.
+
+    Builds the whole map without the menu, wakes every streamed chunk and loads every
+    zone so that all enemy archetypes are seen, then fires every tier of the player's
+    attacks and the attacks of every enemy archetype. Used by the atlas builder and
+    by `python frame_cache.py`.
+
+    Returns:
+        Game: The booted game.
+    """
+    from main import Game
+    from entities import Attack, Ultimate_attack, Enemy_attack, Boss, Boss_attack
+
+    # Enemies face a random direction, a fixed seed keeps builds identical
+    random.seed(0)
+    game = Game(show_intro=False)
+    game.new()
+    # Enemies are only created near the player, every archetype has to be seen
+    for chunk in list(game.stream.dormant):
+        game.stream.activate(chunk)
+    # Enemies of the far zones only get their frames once their zone is loaded
+    for zone in range(len(game.zones.archetypes)):
+        game.zones.load(zone)
+    player = game.player
+    for level in range(0, 15, 3):
+        player.basic_attack_level = level
+        player.prepare_attacks()
+        Attack.launch(game, player.rect.x, player.rect.y)
+    for level in range(0, 12, 3):
+        player.ultimate_attack_level = level
+        player.prepare_attacks()
+        Ultimate_attack.launch(game, player.rect.x, player.rect.y)
+    names = set()
+    for enemy in game.enemies:
+        if enemy.name in names:
+            continue
+        names.add(enemy.name)
+        Enemy_attack.launch(game, enemy.rect.x, enemy.rect.y, enemy)
+        if isinstance(enemy, Boss):
+            Boss_attack.launch(game, enemy.rect.x, enemy.rect.y, enemy)
+    return game
+
+
+def collect_frames():
+    """
+    Finds every spritesheet rectangle the game slices.
+
+    Runs request_every_frame while the spritesheets record the rectangles requested
+    from them.
+
+    Returns:
+        list: The unique (file, x, y, width, height) rectangles, in request order.
+    """
+    from frame_cache import Frame_cache
+    from entities import Spritesheet
+
+    Atlas.enabled = False
+    # Frames found in the frame cache are never sliced, so they would not be recorded
+    frame_cache_enabled = Frame_cache.enabled
+    Frame_cache.enabled = False
+    Spritesheet.recorder = []
+    try:
+        request_every_frame()
+
+        frames = []
+        keys = set()
+        for file, x, y, width, height in Spritesheet.recorder:
+            key = frame_key(file, x, y, width, height)
+            if key not in keys:
+                keys.add(key)
+                frames.append((file, int(x), int(y), int(width), int(height)))
+    finally:
+        Spritesheet.recorder = None
+        Frame_cache.enabled = frame_cache_enabled
+    return frames
+
+
+def pack(sizes, page_size=ATLAS_PAGE_SIZE):
+    """
+    Packs rectangles into pages with a shelf packer.
+
+    Args:
+        sizes (list): The (width, height) of every rectangle.
+        page_size (int): The width and maximum height of a page.
+
+    Returns:
+        tuple: The (page, x, y) of every rectangle and the (width, height) of every page.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    locations = [None] * len(sizes)
+    pages = [[0, 0]]
+    x, y, shelf_height = 0, 0, 0
+    for i in order:
+        width, height = sizes[i]
+        if x + width > page_size:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        if y + height > page_size:
+            pages.append([0, 0])
+            x, y, shelf_height = 0, 0, 0
+        locations[i] = (len(pages) - 1, x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        pages[-1][0] = max(pages[-1][0], x)
+        pages[-1][1] = max(pages[-1][1], y + height)
+    return locations, pages
+
+
+def build_atlas(frames, directory=ATLAS_DIRECTORY):
+    """
+    Cuts the given frames from their spritesheets and writes the atlas pages and index.
+
+    Args:
+        frames (list): The (file, x, y, width, height) rectangles to pack.
+        directory (str): The directory the atlas is written to.
+
+    Returns:
+        dict: The written index.
+    """
+    os.makedirs(directory, exist_ok=True)
+    sheets = {}
+    sprites = []
+    for file, x, y, width, height in frames:
+        if file not in sheets:
+            sheets[file] = pygame.image.load(file).convert()
+        # Cut exactly like Spritesheet.get_sprite, including the black padding
+        # of rectangles reaching past the edge of the image
+        sprite = pygame.Surface([width, height])
+        sprite.blit(sheets[file], (0, 0), (x, y, width, height))
+        sprites.append(sprite)
+
+    locations, page_sizes = pack([sprite.get_size() for sprite in sprites])
+    pages = [pygame.Surface(size) for size in page_sizes]
+    index = {"pages": [], "sources": sorted(sheets), "frames": {}}
+    for frame, sprite, (page, x, y) in zip(frames, sprites, locations):
+        pages[page].blit(sprite, (x, y))
+        index["frames"][frame_key(*frame)] = [page, x, y]
+    for i, page in enumerate(pages):
+        name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(directory, name))
+        index["pages"].append(name)
+    with open(os.path.join(directory, "atlas.json"), "w") as file:
+        json.dump(index, file, separators=(",", ":"))
+    return index
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    frames = collect_frames()
+    index = build_atlas(frames)
+    print(
+        f"Packed {len(frames)} frames from {len(index['sources'])} spritesheets "
+        f"into {len(index['pages'])} page(s) in {ATLAS_DIRECTORY}"
+    )
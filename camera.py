@@ -0,0 +1,141 @@
+import itertools
+import pygame
+from config import *
+from world import Spatial_hash
+
+
+class Culled_group(pygame.sprite.LayeredUpdates):
+    """
+    A layered group that can tell which of its sprites are in view.
+
+    The sprites are kept in a spatial hash. Sprites only move while they update, so
+    the group moves them in the hash right after their update, and the camera asks
+    for the sprites in the view instead of going through the whole group. Dormant
+    sprites are still drawn but not updated, see Enemy_activation.
+
+    Attributes:
+        index (Spatial_hash): The spatial hash of the sprites.
+        order (dict): A dictionary mapping sprites to the order they were added in.
+        unplaced (set): The sprites added since the last update, which may not have a
+            rectangle yet when they join the group.
+        dormant (set): The sprites that are not updated.
+        drawn (int): The number of sprites in view the last time it was asked.
+        culled (int): The number of sprites out of view the last time it was asked.
+
+    Methods:
+        place(): Adds the sprites that joined the group to the spatial hash.
+        visible(rect): Returns the sprites overlapping a rectangle, in drawing order.
+    """
+
+    def __init__(self, *sprites):
+        self.index = Spatial_hash()
+        self.order = {}
+        self.unplaced = set()
+        self.dormant = set()
+        self.counter = itertools.count()
+        self.drawn = 0
+        self.culled = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.order[sprite] = next(self.counter)
+        self.unplaced.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.order[sprite]
+        self.unplaced.discard(sprite)
+        self.dormant.discard(sprite)
+        self.index.remove(sprite)
+
+    def place(self):
+        for sprite in self.unplaced:
+            self.index.move(sprite)
+        self.unplaced.clear()
+
+    def update(self, *args, **kwargs):
+        self.place()
+        dormant = self.dormant
+        for sprite in self.sprites():
+            # Sprites woken up during the update of another sprite are updated too
+            if sprite in dormant:
+                continue
+            sprite.update(*args, **kwargs)
+            # Sprites that killed themselves have already left the hash
+            if sprite in self.order and sprite not in self.unplaced:
+                self.index.move(sprite)
+
+    def visible(self, rect):
+        self.place()
+        sprites = self.index.overlapping(rect)
+        # Same order as LayeredUpdates.draw: by layer, then in the order they were added
+        sprites.sort(
+            key=lambda sprite: (self.get_layer_of_sprite(sprite), self.order[sprite])
+        )
+        self.drawn = len(sprites)
+        self.culled = len(self) - self.drawn
+        return sprites
+
+
+class Camera:
+    """
+    The view of the world shown on the screen.
+
+    Sprites keep their position in world coordinates and the camera only offsets
+    them when they are drawn, so moving the player costs the same however many
+    sprites the map holds. The camera follows a target and keeps it where it stood
+    on the screen when the camera started following it. Groups that can tell which
+    of their sprites are in view only have those drawn.
+
+    Attributes:
+        x (int): The world x-coordinate of the top-left corner of the screen.
+        y (int): The world y-coordinate of the top-left corner of the screen.
+        target (Sprite): The sprite the camera follows, or None.
+        anchor (tuple): The screen position the target is kept at.
+
+    Methods:
+        follow(target): Starts following a sprite from its current screen position.
+        update(): Moves the camera with its target.
+        to_screen(position): Converts a world position to a screen position.
+        to_world(position): Converts a screen position to a world position.
+        view(surface): Returns the part of the world drawn on a surface, with a margin.
+        draw(group, surface): Draws the sprites of a group that are in view.
+    """
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.target = None
+        self.anchor = (0, 0)
+
+    def follow(self, target):
+        self.target = target
+        self.anchor = self.to_screen(target.rect.topleft)
+
+    def update(self):
+        if self.target is not None:
+            self.x = self.target.rect.x - self.anchor[0]
+            self.y = self.target.rect.y - self.anchor[1]
+
+    def to_screen(self, position):
+        return position[0] - self.x, position[1] - self.y
+
+    def to_world(self, position):
+        return position[0] + self.x, position[1] + self.y
+
+    def view(self, surface):
+        return pygame.Rect((self.x, self.y), surface.get_size()).inflate(
+            CULL_MARGIN * 2, CULL_MARGIN * 2
+        )
+
+    def draw(self, group, surface):
+        # Sprites are returned in layer order, so the layers stack as before
+        if isinstance(group, Culled_group):
+            sprites = group.visible(self.view(surface))
+        else:
+            sprites = group.sprites()
+        offset = (-self.x, -self.y)
+        surface.blits(
+            [(sprite.image, sprite.rect.move(offset)) for sprite in sprites], False
+        )
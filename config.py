@@ -25,6 +25,49 @@ BLOCK_LAYER = 2
 GROUND_LAYER = 1
 
 PLAYER_SPEED = 4
+# The enemies' projectiles hit the player's rectangle shrunk by this many pixels on
+# every side
+PLAYER_HITBOX_MARGIN = 0
+# Frames the player can not be hurt again for after a hit (0: every hit counts)
+PLAYER_INVINCIBILITY_FRAMES = 0
+# Angular resolution in degrees of the cached projectile rotations (should divide 360)
+PROJECTILE_ROTATION_STEP = 5
+# Seconds spent loading the game between two frames of the menu
+LOADING_BUDGET = 0.008
+# Zones of the map, in the order they are visited
+ZONES = ("mouse", "desert", "burnt", "dragon")
+# Zones up to this many zones away from the player's zone keep their assets loaded
+ZONE_PREFETCH_DISTANCE = 1
+# Size in tiles of the chunks the static terrain is baked into
+CHUNK_SIZE = 8
+# Number of baked chunks kept, the least recently drawn ones are baked again when needed
+CHUNK_CACHE_SIZE = 48
+# Size in pixels of the cells of the spatial hash holding the moving sprites
+SPATIAL_CELL_SIZE = TILESIZE * 4
+# Sprites this many pixels off the screen are still drawn (parts of them may show)
+CULL_MARGIN = TILESIZE
+# Enemies and other entities are only instantiated in the chunks up to this many
+# chunks away from the player's chunk. It covers the screen with room for the widest
+# bosses and the distance the dragon reacts to the player from (1200 pixels)
+STREAM_RADIUS = (
+    max(WIDTH // 2 + TILESIZE * 4, HEIGHT // 2 + TILESIZE * 4, 1200)
+    // (CHUNK_SIZE * TILESIZE)
+    + 1
+)
+# Update the enemies all at once from arrays instead of one by one, see simulation.py
+ENEMY_SIMULATION = True
+# Awake enemies near the player step away from the enemies less than this many pixels
+# from their center, so they spread around the player instead of piling up, and dead
+# enemies wait for their respawn point to be free, e.g. TILESIZE // 4 (0: off)
+ENEMY_SEPARATION = 0
+# Idle enemies fall asleep when the player is this many pixels beyond their reach and
+# wake up when the player comes back within the smaller wake margin, see world.py
+ENEMY_SLEEP_MARGIN = TILESIZE * 3
+ENEMY_WAKE_MARGIN = TILESIZE
+# The font of every text in the game
+FONT_FILE = "font/pixel_font.ttf"
+# Number of rendered text surfaces kept by the text cache
+TEXT_CACHE_SIZE = 256
 # MAP  150x100
 tilemap = """
 BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB
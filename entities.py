@@ -4,28 +4,53 @@ from config import *
 import math
 import random
 from text import *
+from atlas import Atlas
+from assets import Asset_loader
+from frame_cache import Frame_cache
 
 
 class Spritesheet:
     """
     A class representing a spritesheet.
 
+    The image is only decoded the first time a sprite has to be cut from it, so a
+    spritesheet whose frames are all served by the texture atlas is never opened.
+
     Attributes:
-        sheet (pygame.Surface): The spritesheet image.
+        file (str): The file path of the spritesheet image.
+        sheet (pygame.Surface): The spritesheet image, loaded on first use.
+        recorder (list): When set to a list, every requested sprite is appended to it
+            as (file, x, y, width, height). Used by the atlas builder.
 
     Methods:
         __init__(self, file): Initializes the Spritesheet object.
         get_sprite(self, x, y, width, height, colorkey): Extracts a sprite from the spritesheet.
+        release(self): Drops the decoded image, it is decoded again if needed.
 
     """
 
+    recorder = None
+
     def __init__(self, file):
-        self.sheet = pygame.image.load(file).convert()
+        self.file = file
+        self._sheet = None
+
+    @property
+    def sheet(self):
+        if self._sheet is None:
+            Spritesheet_registry.loads[self.file] = (
+                Spritesheet_registry.loads.get(self.file, 0) + 1
+            )
+            self._sheet = Asset_loader.load_image(self.file)
+        return self._sheet
 
     def get_sprite(self, x, y, width, height, colorkey):
         """
         Extracts a sprite from the spritesheet.
 
+        The sprite is a subsurface of the texture atlas when the atlas holds it,
+        otherwise it is cut from the spritesheet image.
+
         Args:
             x (int): The x-coordinate of the top-left corner of the sprite.
             y (int): The y-coordinate of the top-left corner of the sprite.
@@ -37,11 +62,304 @@ class Spritesheet:
             pygame.Surface: The extracted sprite.
 
         """
-        sprite = pygame.Surface([width, height])
+        if Spritesheet.recorder is not None:
+            Spritesheet.recorder.append((self.file, x, y, width, height))
+        Frame_cache.record(self.file)
+        sprite = Atlas.get_frame(self.file, x, y, width, height)
+        if sprite is None:
+            sprite = pygame.Surface([width, height])
+            sprite.blit(self.sheet, (0, 0), (x, y, width, height))
         sprite.set_colorkey(colorkey)
-        sprite.blit(self.sheet, (0, 0), (x, y, width, height))
         return sprite
 
+    def release(self):
+        self._sheet = None
+        Asset_loader.release_image(self.file)
+
+
+class Spritesheet_registry:
+    """
+    A process-wide registry of spritesheets keyed by file path.
+
+    Every image is decoded and converted at most once; later requests for the same
+    path return the already loaded Spritesheet.
+
+    Attributes:
+        sheets (dict): A dictionary mapping file paths to loaded spritesheets.
+        loads (dict): A dictionary mapping file paths to how many times they were decoded.
+        hits (int): The number of requests served from the registry.
+        misses (int): The number of requests that had to create the spritesheet.
+
+    Methods:
+        get(path): Returns the spritesheet for the given path, loading it if needed.
+        stats(): Returns the hit/miss counters and the number of loaded files.
+        clear(): Drops every loaded spritesheet and resets the counters.
+    """
+
+    sheets = {}
+    loads = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, path):
+        sheet = cls.sheets.get(path)
+        if sheet is None:
+            cls.misses += 1
+            sheet = Spritesheet(path)
+            cls.sheets[path] = sheet
+        else:
+            cls.hits += 1
+        return sheet
+
+    @classmethod
+    def stats(cls):
+        return {"hits": cls.hits, "misses": cls.misses, "files": len(cls.sheets)}
+
+    @classmethod
+    def clear(cls):
+        cls.sheets = {}
+        cls.loads = {}
+        cls.hits = 0
+        cls.misses = 0
+
+
+class Tile_registry:
+    """
+    A process-wide registry of the tile surfaces, one per kind of tile.
+
+    A kind of tile is a rectangle of a spritesheet scaled to a size. It is cut and
+    scaled the first time it is requested, and every Block and Ground of that kind
+    then shares the same surface instead of holding its own copy.
+
+    Attributes:
+        tiles (dict): A dictionary mapping (file, rect, colorkey, size) to tile surfaces.
+        hits (int): The number of requests served from the registry.
+        misses (int): The number of tile surfaces that had to be made.
+
+    Methods:
+        get(file, rect, colorkey, size): Returns the surface of a kind of tile.
+        stats(): Returns the hit/miss counters and the megabytes of tile pixels.
+        clear(): Drops every tile surface and resets the counters.
+    """
+
+    tiles = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, file, rect, colorkey, size):
+        key = (file, tuple(rect), tuple(colorkey), tuple(size))
+        tile = cls.tiles.get(key)
+        if tile is None:
+            cls.misses += 1
+            sprite = Spritesheet_registry.get(file).get_sprite(*rect, colorkey)
+            tile = pygame.transform.scale(sprite, size)
+            cls.tiles[key] = tile
+        else:
+            cls.hits += 1
+        return tile
+
+    @classmethod
+    def stats(cls):
+        pixels = sum(
+            tile.get_width() * tile.get_height() * tile.get_bytesize()
+            for tile in cls.tiles.values()
+        )
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "kinds": len(cls.tiles),
+            "MB": round(pixels / 2**20, 2),
+        }
+
+    @classmethod
+    def clear(cls):
+        cls.tiles = {}
+        cls.hits = 0
+        cls.misses = 0
+
+
+class Animation_bank:
+    """
+    A process-wide store of enemy animation frames keyed by archetype name.
+
+    The frames of an archetype are sliced (and scaled) once, the first time an enemy
+    of that archetype is created, or read back from the frame cache on disk. Every
+    later enemy only takes a reference to the shared, read-only tuples, so spawning
+    does not allocate any Surfaces.
+
+    Attributes:
+        banks (dict): A dictionary mapping archetype names to their animation frames.
+
+    Methods:
+        get(name, spritesheet): Returns the animations of an archetype, building them if needed.
+        build(name, spritesheet): Slices the animations of an archetype from its spritesheet.
+        release(name): Drops the animations of an archetype.
+        stats(): Returns the number of banks and frames held.
+    """
+
+    banks = {}
+
+    @classmethod
+    def get(cls, name, spritesheet):
+        bank = cls.banks.get(name)
+        if bank is None:
+            bank = Frame_cache.get(
+                ("Animation_bank", name), lambda: cls.build(name, spritesheet)
+            )
+            cls.banks[name] = bank
+        return bank
+
+    @staticmethod
+    def build(name, spritesheet):
+        """
+        Slices the animations of an archetype from its spritesheet.
+
+        Args:
+            name (str): The name of the enemy archetype.
+            spritesheet (Spritesheet): The spritesheet of the enemy.
+
+        Returns:
+            dict: The "idle" frame (which sets the size of the enemy's rect), the
+            initial "image" and the "up", "down", "left" and "right" animations.
+        """
+        # Rows of the spritesheet used for each direction
+        rows = {"up": 0, "down": 128, "right": 192, "left": 64}
+        width, height = TILESIZE, TILESIZE
+        count = 9
+        colorkey = WHITE
+        scale = None
+
+        if name == "Desert Wolf":
+            rows = {"up": 0, "down": 140, "right": 223, "left": 64}
+            width = TILESIZE * 2
+        elif name[:5] == "Burnt":
+            width = TILESIZE * 2
+        elif name == "Desert Boss":
+            scale = (128, 128)
+        elif name == "Dragon":
+            rows = {"up": 0, "right": 128, "down": 256, "left": 384}
+            width, height = 144, 128
+            count = 3
+            colorkey = BLACK
+            scale = (288, 256)
+
+        bank = {"idle": spritesheet.get_sprite(1, 128, TILESIZE, TILESIZE, WHITE)}
+        for direction, row in rows.items():
+            frames = [
+                spritesheet.get_sprite(width * i, row, width, height, colorkey)
+                for i in range(count)
+            ]
+            if scale:
+                frames = [pygame.transform.scale(frame, scale) for frame in frames]
+            bank[direction] = tuple(frames)
+        # Wide enemies start with their first up-facing frame
+        if width == TILESIZE * 2:
+            bank["image"] = bank["up"][0]
+        else:
+            bank["image"] = bank["idle"]
+        return bank
+
+    @classmethod
+    def release(cls, name):
+        cls.banks.pop(name, None)
+
+    @classmethod
+    def stats(cls):
+        frames = sum(
+            len(bank[direction])
+            for bank in cls.banks.values()
+            for direction in ("up", "down", "left", "right")
+        )
+        return {"banks": len(cls.banks), "frames": frames}
+
+
+class Rotation_cache:
+    """
+    A process-wide cache of rotated projectile frames.
+
+    Rotation angles are quantized to buckets of PROJECTILE_ROTATION_STEP degrees and
+    the rotated frames are keyed by (archetype, frame, bucket). The base frames of an
+    archetype are registered once and warm() prepares every bucket up front, so
+    firing a projectile only looks its frames up.
+
+    Attributes:
+        resolution (float): The size of an angle bucket in degrees.
+        bases (dict): A dictionary mapping (archetype, frame) to the base frame and
+            the size it is scaled to after rotating (or None).
+        rotations (dict): A dictionary mapping (archetype, frame, bucket) to the rotated frame.
+        hits (int): The number of rotations served from the cache.
+        misses (int): The number of rotations that had to be computed on demand.
+
+    Methods:
+        register(archetype, frame, surface, scale): Registers a base frame.
+        bucket(angle): Returns the bucket of a rotation angle.
+        get(archetype, frame, angle): Returns a frame rotated by the bucketed angle.
+        warm(archetype): Prepares every bucket of every frame of an archetype.
+        release(archetype): Drops the base frames and rotations of an archetype.
+        stats(): Returns the hit/miss counters and the number of cached rotations.
+    """
+
+    resolution = PROJECTILE_ROTATION_STEP
+    bases = {}
+    rotations = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def register(cls, archetype, frame, surface, scale=None):
+        cls.bases[(archetype, frame)] = (surface, scale)
+
+    @classmethod
+    def bucket(cls, angle):
+        return round(angle / cls.resolution) % round(360 / cls.resolution)
+
+    @classmethod
+    def rotate(cls, archetype, frame, bucket):
+        surface, scale = cls.bases[(archetype, frame)]
+        rotated = pygame.transform.rotate(surface, bucket * cls.resolution)
+        if scale:
+            rotated = pygame.transform.scale(rotated, scale)
+        return rotated
+
+    @classmethod
+    def get(cls, archetype, frame, angle):
+        key = (archetype, frame, cls.bucket(angle))
+        rotated = cls.rotations.get(key)
+        if rotated is None:
+            cls.misses += 1
+            rotated = cls.rotate(*key)
+            cls.rotations[key] = rotated
+        else:
+            cls.hits += 1
+        return rotated
+
+    @classmethod
+    def warm(cls, archetype):
+        for name, frame in list(cls.bases):
+            if name != archetype:
+                continue
+            for bucket in range(round(360 / cls.resolution)):
+                key = (archetype, frame, bucket)
+                if key not in cls.rotations:
+                    cls.rotations[key] = cls.rotate(*key)
+
+    @classmethod
+    def release(cls, archetype):
+        cls.bases = {
+            key: base for key, base in cls.bases.items() if key[0] != archetype
+        }
+        cls.rotations = {
+            key: rotated
+            for key, rotated in cls.rotations.items()
+            if key[0] != archetype
+        }
+
+    @classmethod
+    def stats(cls):
+        return {"hits": cls.hits, "misses": cls.misses, "rotations": len(cls.rotations)}
+
 
 class Player(pygame.sprite.Sprite):
     """
@@ -53,7 +371,7 @@ class Player(pygame.sprite.Sprite):
         y (int): The y-coordinate of the player's position.
         width (int): The width of the player's sprite.
         height (int): The height of the player's sprite.
-        absolute_sprite_moved_value (tuple): The absolute value of the player's sprite movement.
+        zone (int): The zone the player is in, None until the first update.
         x_change (int): The change in x-coordinate of the player's position.
         y_change (int): The change in y-coordinate of the player's position.
         facing (str): The direction the player is facing.
@@ -72,12 +390,18 @@ class Player(pygame.sprite.Sprite):
         down_animations (list): The list of down-facing animation frames.
         right_animations (list): The list of right-facing animation frames.
         left_animations (list): The list of left-facing animation frames.
+        attack_animations (tuple): The animation frames of the current basic attack tier.
+        ultimate_attack_animations (tuple): The animation frames of the current ultimate attack tier.
+        invincible (int): The number of frames the player can not be hurt for.
     Methods:
         update(self): Updates the player's position and sprite.
         movement(self, keys): Moves the player based on the keys pressed.
         collide(self, direction): Checks for collisions with blocks.
         animate(self): Animates the player's sprite based on the direction they are facing.
         get_center(self): Returns the center of the player's sprite.
+        prepare_attacks(self): Prepares the attack animations of the current levels.
+        hitbox(self): Returns the rectangle the enemies' projectiles hit.
+        hurt(self, damage): Hurts the player unless they are invincible.
     """
 
     def __init__(self, game, x: int, y: int):
@@ -89,10 +413,10 @@ class Player(pygame.sprite.Sprite):
         self.y = y * TILESIZE
         self.width = TILESIZE
         self.height = TILESIZE
-        self.absolute_sprite_moved_value = (0, 0)
-        self.music = [0, 0, 0, 0]
+        self.zone = None
         self.x_change = 0
         self.y_change = 0
+        self.invincible = 0
 
         self.facing = "down"
 
@@ -116,6 +440,9 @@ class Player(pygame.sprite.Sprite):
         self.rect.x = self.x
         self.rect.y = self.y
         self.player_speed = PLAYER_SPEED + self.speed_level // 4
+        self.prepare_attacks()
+        # The player keeps their spawn position on the screen
+        self.game.camera.follow(self)
         # Animations
         self.up_animations = [
             self.game.character_spritesheet.get_sprite(
@@ -226,54 +553,24 @@ class Player(pygame.sprite.Sprite):
         ]
 
     def change_music(self):
-        if (
-            self.music[0] == 0
-            and self.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.absolute_sprite_moved_value[1] / 69268 // 16 > -37
-        ):
-            pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-            self.game.music.play_music("level_1")
-            pygame.mixer.music.set_volume(0.08)
-            self.music[0], self.music[1], self.music[2], self.music[3] = 1, 0, 0, 0
-
-        elif (
-            self.music[1] == 0
-            and self.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.absolute_sprite_moved_value[1] / 69268 // 16 < -36
-            and self.absolute_sprite_moved_value[1] / 69268 // 16 > -54
-        ):
-            pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-            self.game.music.play_music("level_2")
-            pygame.mixer.music.set_volume(0.08)
-            self.music[0], self.music[1], self.music[2], self.music[3] = 0, 1, 0, 0
-
-        elif (
-            self.music[2] == 0
-            and self.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.absolute_sprite_moved_value[1] / 69268 // 16 < -54
-        ):
-
-            pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-            self.game.music.play_music("level_3")
-            pygame.mixer.music.set_volume(0.08)
-            self.music[0], self.music[1], self.music[2], self.music[3] = 0, 0, 1, 0
-        elif (
-            self.music[3] == 0
-            and self.absolute_sprite_moved_value[0] / 69268 // 16 < -80
-        ):
+        # Switch the music and the loaded assets when the player enters another zone
+        zone = self.game.zone_map.zone_at(self.rect.center)
+        if zone != self.zone:
+            self.zone = zone
             pygame.mixer.music.stop()
             pygame.mixer.music.unload()
-            self.game.music.play_music("boss_room")
+            self.game.music.play_music(Zone_assets.music[zone])
             pygame.mixer.music.set_volume(0.08)
-            self.music[0], self.music[1], self.music[2], self.music[3] = 0, 0, 0, 1
+            self.game.zones.enter(zone)
+            # Other enemies act in this zone, the sleeping ones look again
+            self.game.activation.wake_all()
 
     def update(self):
         """
         Updates the player's position and sprite.
         """
+        if self.invincible > 0:
+            self.invincible -= 1
         self.change_music()
         keys = pygame.key.get_pressed()
         if keys:
@@ -284,13 +581,15 @@ class Player(pygame.sprite.Sprite):
             self.collide("x")
             self.rect.y += self.y_change
             self.collide("y")
+            # The sprites stay where they are, only the camera follows the player
+            self.game.camera.update()
 
             self.x_change = 0
             self.y_change = 0
 
     def movement(self, keys):
         """
-        Move the player and update the sprite positions based on the keys pressed.
+        Move the player based on the keys pressed.
 
         Args:
             keys (dict): A dictionary containing the state of all keyboard keys.
@@ -300,60 +599,18 @@ class Player(pygame.sprite.Sprite):
         """
 
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            for sprite in self.game.all_sprites:
-                sprite.rect.x += self.player_speed
-                # Update the absolute value of the player's sprite movement
-                self.absolute_sprite_moved_value = (
-                    self.absolute_sprite_moved_value[0] + self.player_speed,
-                    self.absolute_sprite_moved_value[1],
-                )
-
-            for sprite in self.game.attacks:
-                sprite.rect.x += self.player_speed
-
             self.x_change -= self.player_speed
             self.facing = "left"
 
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            # Move all the sprites to the left
-            for sprite in self.game.all_sprites:
-                sprite.rect.x -= self.player_speed
-                self.absolute_sprite_moved_value = (
-                    self.absolute_sprite_moved_value[0] - self.player_speed,
-                    self.absolute_sprite_moved_value[1],
-                )
-            # Move the attacks relative to the player
-            for sprite in self.game.attacks:
-                sprite.rect.x -= self.player_speed
-            # Update the player's x-coordinate by sprite movement
             self.x_change += self.player_speed
             self.facing = "right"
 
         if keys[pygame.K_UP] or keys[pygame.K_w]:
-            for sprite in self.game.all_sprites:
-                sprite.rect.y += self.player_speed
-                self.absolute_sprite_moved_value = (
-                    self.absolute_sprite_moved_value[0],
-                    self.absolute_sprite_moved_value[1] + self.player_speed,
-                )
-
-            for sprite in self.game.attacks:
-                sprite.rect.y += self.player_speed
-
             self.y_change -= self.player_speed
             self.facing = "up"
 
         if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            for sprite in self.game.all_sprites:
-                sprite.rect.y -= self.player_speed
-                self.absolute_sprite_moved_value = (
-                    self.absolute_sprite_moved_value[0],
-                    self.absolute_sprite_moved_value[1] - self.player_speed,
-                )
-
-            for sprite in self.game.attacks:
-                sprite.rect.y -= self.player_speed
-
             self.y_change += self.player_speed
             self.facing = "down"
 
@@ -367,60 +624,24 @@ class Player(pygame.sprite.Sprite):
         """
         # Check for collisions with blocks on x-axis
         if direction == "x":
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+            hits = self.game.collision_map.hits(self.rect)
             if hits:
                 # If the player is moving to the right
                 if self.x_change > 0:
-                    for sprite in self.game.all_sprites:
-                        sprite.rect.x += self.player_speed
-                        # Update the absolute value of the player's sprite movement when colliding with blocks
-                        self.absolute_sprite_moved_value = (
-                            self.absolute_sprite_moved_value[0] + self.player_speed,
-                            self.absolute_sprite_moved_value[1],
-                        )
-                    for sprite in self.game.attacks:
-                        sprite.rect.x += self.player_speed
-                    self.rect.x = hits[0].rect.left - self.rect.width
-
+                    self.rect.x = hits[0].left - self.rect.width
                 # If the player is moving to the left
                 if self.x_change < 0:
-
-                    for sprite in self.game.all_sprites:
-                        sprite.rect.x -= self.player_speed
-                        self.absolute_sprite_moved_value = (
-                            self.absolute_sprite_moved_value[0] - self.player_speed,
-                            self.absolute_sprite_moved_value[1],
-                        )
-                    for sprite in self.game.attacks:
-                        sprite.rect.x -= self.player_speed
-                    self.rect.x = hits[0].rect.right
+                    self.rect.x = hits[0].right
         # Check for collisions with blocks on y-axis
         if direction == "y":
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+            hits = self.game.collision_map.hits(self.rect)
             if hits:
                 # If the player is moving down
                 if self.y_change > 0:
-                    for sprite in self.game.all_sprites:
-                        sprite.rect.y += self.player_speed
-
-                        self.absolute_sprite_moved_value = (
-                            self.absolute_sprite_moved_value[0],
-                            self.absolute_sprite_moved_value[1] + self.player_speed,
-                        )
-                    for sprite in self.game.attacks:
-                        sprite.rect.y += self.player_speed
-                    self.rect.y = hits[0].rect.top - self.rect.height
+                    self.rect.y = hits[0].top - self.rect.height
                 # If the player is moving up
                 if self.y_change < 0:
-                    for sprite in self.game.all_sprites:
-                        sprite.rect.y -= self.player_speed
-                        self.absolute_sprite_moved_value = (
-                            self.absolute_sprite_moved_value[0],
-                            self.absolute_sprite_moved_value[1] - self.player_speed,
-                        )
-                    for sprite in self.game.attacks:
-                        sprite.rect.y -= self.player_speed
-                    self.rect.y = hits[0].rect.bottom
+                    self.rect.y = hits[0].bottom
 
     def animate(self):
         """
@@ -465,7 +686,33 @@ class Player(pygame.sprite.Sprite):
                     self.animation_loop = 1
 
     def get_center(self):
-        return self.x + self.width / 2, self.y + self.height / 2
+        # The player moves by its rect, x and y stay on the spawn tile
+        return self.rect.center
+
+    def hitbox(self):
+        return self.rect.inflate(-PLAYER_HITBOX_MARGIN * 2, -PLAYER_HITBOX_MARGIN * 2)
+
+    def hurt(self, damage):
+        # The enemies' projectiles fly through the player while they are invincible
+        if self.invincible:
+            return False
+        self.game.music.play_sound("player_hurt")
+        self.game.health_bar.lose(damage)
+        self.invincible = PLAYER_INVINCIBILITY_FRAMES
+        return True
+
+    def prepare_attacks(self):
+        # Called whenever an attack or speed level changes, so firing an attack
+        # only has to reference the frames of the current tiers
+        # (the speed level repeats the animation, making the attack travel further)
+        repeats = self.speed_level + 1
+        self.attack_animations = (
+            Attack.tier_animations(self.game, self.basic_attack_level // 3) * repeats
+        )
+        self.ultimate_attack_animations = (
+            Ultimate_attack.tier_animations(self.game, self.ultimate_attack_level // 3)
+            * repeats
+        )
 
 
 # BLOCKS
@@ -477,11 +724,11 @@ class Block(pygame.sprite.Sprite):
         game (Game): The game instance.
         x (int): The x-coordinate of the block.
         y (int): The y-coordinate of the block.
-        Spritesheet (list): The spritesheet used for the block.
+        image (Surface): The surface of the block, shared by every block of its kind.
 
     """
 
-    def __init__(self, game, x, y, Spritesheet):
+    def __init__(self, game, x, y, image):
         """
         Initializes a new instance of the Block class.
 
@@ -489,908 +736,626 @@ class Block(pygame.sprite.Sprite):
             game (Game): The game instance.
             x (int): The x-coordinate of the block.
             y (int): The y-coordinate of the block.
-            Spritesheet (list): The spritesheet used for the block.
+            image (Surface): The tile surface of the block, see Tile_registry.
 
         """
         self.game = game
         self._layer = BLOCK_LAYER
-        self.groups = self.game.all_sprites, self.game.blocks
-        pygame.sprite.Sprite.__init__(self, self.groups)
+        # Blocks are drawn by the terrain chunks and collided with through the collision
+        # map, which is compiled with the level
+        pygame.sprite.Sprite.__init__(self)
 
         self.x = x * TILESIZE
         self.y = y * TILESIZE
         self.width = TILESIZE
         self.height = TILESIZE
 
-        self.image = pygame.transform.scale(Spritesheet[0], Spritesheet[1])
+        self.image = image
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
+        self.game.terrain.add(self)
 
 
 class Boundary_blocks(Block):
-    def __init__(self, game, x, y, Spritesheet):
-        Block.__init__(self, game, x, y, Spritesheet)
-        self.image = pygame.transform.scale(self.image, (TILESIZE, TILESIZE))
+    def __init__(self, game, x, y, image):
+        Block.__init__(self, game, x, y, image)
 
 
 class Ground(pygame.sprite.Sprite):
     """
     A class representing the ground in the game.
 
+    Ground tiles are painted on the terrain chunks and do not belong to any group.
+
     Attributes:
         game (Game): The instance of the Game class.
         x (int): The x-coordinate of the ground.
         y (int): The y-coordinate of the ground.
-        Spritesheet[0] (Surface): The spritesheet used for the ground.
-        Spritesheet[1] (tuple): The size of the ground.
+        image (Surface): The surface of the ground, shared by every tile of its kind.
     """
 
-    def __init__(self, game, x, y, Spritesheet):
+    def __init__(self, game, x, y, image):
         self.game = game
         self._layer = GROUND_LAYER
-        self.groups = self.game.all_sprites
-        pygame.sprite.Sprite.__init__(self, self.groups)
+        pygame.sprite.Sprite.__init__(self)
         self.id = (x, y)
         self.x = x * TILESIZE
         self.y = y * TILESIZE
         self.width = TILESIZE
         self.height = TILESIZE
 
-        self.image = pygame.transform.scale(Spritesheet[0], Spritesheet[1])
+        self.image = image
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
+        self.game.terrain.add(self)
 
 
-class Attack(pygame.sprite.Sprite):
+class Attack:
     """
-    Represents an attack in the game.
+    Represents the basic attack of the player.
+
+    Attacks are not sprites, they are records of the game's Projectile_pool, which
+    moves and animates all of them at once. This class launches them and applies
+    their hits.
 
     Attributes:
-        game (Game): The game instance.
-        x (int): The x-coordinate of the attack.
-        y (int): The y-coordinate of the attack.
-        width (int): The width of the attack.
-        height (int): The height of the attack.
-        direction (str): The direction the attack is facing.
-        animation_loop (float): The current animation frame of the attack.
-        damage (int): The damage inflicted by the attack.
-        dx (float): The horizontal movement speed of the attack.
-        dy (float): The vertical movement speed of the attack.
-        image (Surface): The image of the attack.
-        rect (Rect): The rectangular area occupied by the attack.
-        animations (list): The list of animation frames for the attack.
+        tiers (dict): The animation frames of every tier already built, shared by all attacks.
+        max_tier (int): The last tier with its own frames.
+        owner (str): Who launches the attacks, they hit the enemies.
+        pace (int): How many times its direction the attack moves every frame.
 
     Methods:
-        __init__(self, game, x, y): Initializes a new instance of the Attack class.
-        update(self): Updates the attack.
-        collide(self): Handles collision with enemies.
-        animate(self): Animates the attack.
-        movement(self): Moves the attack.
-        upgrade_attack_tier(self, tier): Upgrades the attack to a higher tier.
+        launch(game, x, y): Launches an attack from a position towards the mouse.
+        aim(game, x, y): Returns the movement of an attack towards the mouse.
+        limit(game): Returns the number of enemies an attack hits before vanishing.
+        strike(game, damage, sprites): Damages the enemies hit by an attack.
+        play_hit_sounds(game, sprites): Plays the sound of every enemy hit.
+        tier_animations(game, tier): Returns the animation frames of a tier, building them if needed.
+        build_tier(game, tier): Slices the animation frames of a tier from its spritesheet.
     """
 
-    def __init__(self, game, x, y):
-        self.game = game
-        self._layer = PLAYER_LAYER
-        self.groups = self.game.attacks
-        pygame.sprite.Sprite.__init__(self, self.groups)
-        self.x = x
-        self.y = y
-        self.width = TILESIZE
-        self.height = TILESIZE
-        self.direction = self.game.player.facing
-        self.animation_loop = 0
-
-        self.damage = (
-            self.game.player.basic_attack_damage
-            + 3 * self.game.player.basic_attack_level
+    # The animation frames of every tier already built, shared by all attacks
+    tiers = {}
+    max_tier = 4
+    owner = "player"
+    pace = 1
+
+    @classmethod
+    def launch(cls, game, x, y):
+        damage = game.player.basic_attack_damage + 3 * game.player.basic_attack_level
+        dx, dy = cls.aim(game, x, y)
+        # The frames of the current tier are prepared by the player on level up
+        animations = game.player.attack_animations
+        return game.projectiles.launch(
+            cls,
+            x,
+            y,
+            (TILESIZE, TILESIZE),
+            int(dx) * cls.pace,
+            int(dy) * cls.pace,
+            animations,
+            0.1,
+            len(animations),
+            damage,
         )
-        mouse_position = pygame.mouse.get_pos()
+
+    @staticmethod
+    def aim(game, x, y):
+        # The attack flies in the world, so aim at the world position of the mouse
+        mouse_position = game.camera.to_world(pygame.mouse.get_pos())
 
         # Calculate the angle between the player and the mouse
         # The angle is used to determine the direction of the attack
         # and the speed of the attack
         # The attack moves towards the mouse
-        # The attack moves faster if the mouse is further away
-        # The attack moves slower if the mouse is closer
-
-        angle = math.atan2(mouse_position[1] - self.y, mouse_position[0] - self.x)
-        # Calculate the horizontal movement speed of the attack
-        self.dx = math.cos(angle) * self.game.player.player_speed
-        # Calculate the vertical movement speed of the attack
-        self.dy = math.sin(angle) * self.game.player.player_speed
-
-        self.image = self.game.attack_spritesheet.get_sprite(
-            0, 0, self.width, self.height, BLACK
+        angle = math.atan2(mouse_position[1] - y, mouse_position[0] - x)
+        # Calculate the horizontal and vertical movement speed of the attack
+        return (
+            math.cos(angle) * game.player.player_speed,
+            math.sin(angle) * game.player.player_speed,
         )
 
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
-        # Base attack animations
-        self.animations = [
-            self.game.attack_spritesheet.get_sprite(
-                20, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                80, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                140, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                200, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                265, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                330, 30, self.width, self.height * 0.75, BLACK
-            ),
-            self.game.attack_spritesheet.get_sprite(
-                390, 30, self.width, self.height * 0.75, BLACK
-            ),
-        ] * (self.game.player.speed_level + 1)
-        if self.__class__.__name__ == "Attack":
-            self.upgrade_attack_tier(self.game.player.basic_attack_level // 3)
-
-    def update(self):
-
-        self.collide()
-        self.movement()
-        self.animate()
-
-    def collide(self):
-        # Check for collisions with enemies
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
-        if hits:
-            # If the player's basic attack level is less than 3
-            if self.game.player.basic_attack_level < 3:
-                for sprite in hits:
-                    sprite.health -= self.damage
-
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-                    # If the player's basic attack level is between 3 and 6
-            elif (
-                self.game.player.basic_attack_level >= 3
-                and self.game.player.basic_attack_level < 6
-            ):
-                for sprite in hits:
-                    sprite.health -= self.damage * 2
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage * 2,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-                    # If the player's basic attack level is between 6 and 9
-            elif (
-                self.game.player.basic_attack_level >= 6
-                and self.game.player.basic_attack_level < 9
-            ):
-                for sprite in hits:
-                    sprite.health -= self.damage * 2
-                    sprite.speed -= 0.05
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage * 2,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-                    # If the player's basic attack level is between 9 and 12
-            elif (
-                self.game.player.basic_attack_level >= 9
-                and self.game.player.basic_attack_level < 12
-            ):
-                for sprite in hits:
-                    sprite.health -= self.damage * 3
-                    sprite.speed -= 0.1
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage * 3,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-                    # If the player's basic attack level is between 12 and 15
-            elif (
-                self.game.player.basic_attack_level >= 12
-                and self.game.player.basic_attack_level < 15
-            ):
-                for sprite in hits:
-                    sprite.health -= self.damage * 4
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage * 3,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-                    # If the player's basic attack level is greater than 15
-            else:
-                for sprite in hits:
-                    sprite.health -= self.damage * 5
-                    sprite.speed -= 0.25
-                    self.kill()
-                    Temporary_text_damage(
-                        self.game,
-                        self.damage * 3,
-                        "red",
-                        sprite.rect.x,
-                        sprite.rect.y + 32,
-                        pygame.font.Font(
-                            "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                        ),
-                    )
-            # Play the sound effect for the attack based on the enemy type
-            for sprite in hits:
-                if sprite.name[-5:] == "Mouse":
-                    self.game.music.play_sound("mouse_sound")
-                elif sprite.name[:6] == "Desert":
-                    if sprite.name[-4:] != "Boss":
-                        self.game.music.play_sound("desert_sound")
-                    else:
-                        self.game.music.play_sound("desert_boss_sound")
-                elif sprite.name[:5] == "Burnt":
-                    if sprite.name[-8:] == "Succubus":
-                        self.game.music.play_sound("succubus_sound")
-                    elif sprite.name[-5:] == "Angel":
-                        self.game.music.play_sound("fallen_angel_sound")
-                    else:
-                        self.game.music.play_sound("burnt_sound")
-                elif sprite.name == "Dragon":
-                    self.game.music.play_sound("dragon_sound")
+    @staticmethod
+    def limit(game):
+        return 1
 
-    def animate(self):
-        self.image = self.animations[math.floor(self.animation_loop)]
-        self.animation_loop += 0.1
-        if self.animation_loop >= len(self.animations):
-            self.kill()
+    @classmethod
+    def strike(cls, game, damage, sprites):
+        # If the player's basic attack level is less than 3
+        if game.player.basic_attack_level < 3:
+            for sprite in sprites:
+                sprite.hit(damage)
 
-    def movement(self):
-        self.rect.x = self.rect.x + int(self.dx)
-        self.rect.y = self.rect.y + int(self.dy)
-
-    def upgrade_attack_tier(self, tier):
-        # Upgrade the attack to a higher tier based on the player's basic attack level and speed level (speed level affects the number of attack animations) and
-        # the tier of the attack (tier 1, 2, 3, or 4)
-        if tier == 1:
-            self.animations = [
-                self.game.attack_spritesheet.get_sprite(
-                    0, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    64, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    128, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    192, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    256, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    320, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    384, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    448, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    512, 84, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    576, 84, self.width, self.height * 0.75, BLACK
-                ),
-            ] * (self.game.player.speed_level + 1)
-        if tier == 2:
-            self.animations = [
-                self.game.attack_spritesheet.get_sprite(
-                    0, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    64, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    128, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    192, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    256, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    320, 148, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    384, 148, self.width, self.height * 0.75, BLACK
-                ),
-            ] * (self.game.player.speed_level + 1)
-        if tier == 3:
-            self.animations = [
-                self.game.attack_spritesheet.get_sprite(
-                    0, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    64, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    128, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    192, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    256, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    320, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    384, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    448, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    512, 212, self.width, self.height * 0.75, BLACK
-                ),
-                self.game.attack_spritesheet.get_sprite(
-                    576, 212, self.width, self.height * 0.75, BLACK
-                ),
-            ] * (self.game.player.speed_level + 1)
-        elif tier >= 4:
-            attack_spritesheet = Spritesheet("images/missles/icetacle.png")
-            self.animations = [
-                attack_spritesheet.get_sprite(
-                    0, 0, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    128, 0, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    256, 0, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    384, 0, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    0, 128, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    128, 128, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    256, 128, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    384, 128, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    0, 256, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    128, 256, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    256, 256, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    384, 256, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    0, 384, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    128, 384, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    256, 384, self.width * 2, self.height * 2, BLACK
-                ),
-                attack_spritesheet.get_sprite(
-                    384, 384, self.width * 2, self.height * 2, BLACK
-                ),
-            ] * (self.game.player.speed_level + 1)
-            self.image = pygame.transform.scale(
-                self.image, (TILESIZE * 2, TILESIZE * 2)
+                Temporary_text_damage(
+                    game,
+                    damage,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+                # If the player's basic attack level is between 3 and 6
+        elif game.player.basic_attack_level >= 3 and game.player.basic_attack_level < 6:
+            for sprite in sprites:
+                sprite.hit(damage * 2)
+                Temporary_text_damage(
+                    game,
+                    damage * 2,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+                # If the player's basic attack level is between 6 and 9
+        elif game.player.basic_attack_level >= 6 and game.player.basic_attack_level < 9:
+            for sprite in sprites:
+                sprite.hit(damage * 2, 0.05)
+                Temporary_text_damage(
+                    game,
+                    damage * 2,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+                # If the player's basic attack level is between 9 and 12
+        elif (
+            game.player.basic_attack_level >= 9 and game.player.basic_attack_level < 12
+        ):
+            for sprite in sprites:
+                sprite.hit(damage * 3, 0.1)
+                Temporary_text_damage(
+                    game,
+                    damage * 3,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+                # If the player's basic attack level is between 12 and 15
+        elif (
+            game.player.basic_attack_level >= 12 and game.player.basic_attack_level < 15
+        ):
+            for sprite in sprites:
+                sprite.hit(damage * 4)
+                Temporary_text_damage(
+                    game,
+                    damage * 3,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+                # If the player's basic attack level is greater than 15
+        else:
+            for sprite in sprites:
+                sprite.hit(damage * 5, 0.25)
+                Temporary_text_damage(
+                    game,
+                    damage * 3,
+                    "red",
+                    sprite.rect.x - game.camera.x,
+                    sprite.rect.y + 32 - game.camera.y,
+                    Font_manager.get(12 + int(damage * 0.5)),
+                )
+        cls.play_hit_sounds(game, sprites)
+
+    @staticmethod
+    def play_hit_sounds(game, sprites):
+        # Play the sound effect for the attack based on the enemy type
+        for sprite in sprites:
+            if sprite.name[-5:] == "Mouse":
+                game.music.play_sound("mouse_sound")
+            elif sprite.name[:6] == "Desert":
+                if sprite.name[-4:] != "Boss":
+                    game.music.play_sound("desert_sound")
+                else:
+                    game.music.play_sound("desert_boss_sound")
+            elif sprite.name[:5] == "Burnt":
+                if sprite.name[-8:] == "Succubus":
+                    game.music.play_sound("succubus_sound")
+                elif sprite.name[-5:] == "Angel":
+                    game.music.play_sound("fallen_angel_sound")
+                else:
+                    game.music.play_sound("burnt_sound")
+            elif sprite.name == "Dragon":
+                game.music.play_sound("dragon_sound")
+
+    @classmethod
+    def tier_animations(cls, game, tier):
+        tier = min(tier, cls.max_tier)
+        animations = cls.tiers.get(tier)
+        if animations is None:
+            animations = Frame_cache.get(
+                (cls.__name__, tier),
+                lambda: {"frames": tuple(cls.build_tier(game, tier))},
+            )["frames"]
+            cls.tiers[tier] = animations
+        return animations
+
+    @staticmethod
+    def build_tier(game, tier):
+        # The tier of the attack (tier 0, 1, 2, 3 or 4) depends on the player's basic attack level
+        if tier == 0:
+            return [
+                game.attack_spritesheet.get_sprite(
+                    x, 30, TILESIZE, TILESIZE * 0.75, BLACK
+                )
+                for x in (20, 80, 140, 200, 265, 330, 390)
+            ]
+        if tier >= 4:
+            attack_spritesheet = Spritesheet_registry.get("images/missles/icetacle.png")
+            return [
+                attack_spritesheet.get_sprite(x, y, TILESIZE * 2, TILESIZE * 2, BLACK)
+                for y in range(0, 512, 128)
+                for x in range(0, 512, 128)
+            ]
+        # Rows of the spritesheet and number of frames of tiers 1, 2 and 3
+        row, count = {1: (84, 10), 2: (148, 7), 3: (212, 10)}[tier]
+        return [
+            game.attack_spritesheet.get_sprite(
+                TILESIZE * i, row, TILESIZE, TILESIZE * 0.75, BLACK
             )
+            for i in range(count)
+        ]
 
 
 class Ultimate_attack(Attack):
     """
     Represents the ultimate attack in the game.
 
-    Inherits from the Attack class.
+    Inherits from the Attack class. Ultimate attacks are larger, move faster and go
+    through several enemies.
 
     Attributes:
-    - game (Game): The game instance.
-    - x (int): The x-coordinate of the ultimate attack.
-    - y (int): The y-coordinate of the ultimate attack.
-    - width (int): The width of the ultimate attack.
-    - height (int): The height of the ultimate attack.
-    - animations (list): List of animation frames for the ultimate attack.
-    - image (Surface): The current image of the ultimate attack.
-    - damage (int): The damage caused by the ultimate attack.
-    - rect (Rect): The rectangular area occupied by the ultimate attack.
-    - count (int): The count of how many times the ultimate attack has hit an enemy.
+    - tiers (dict): The animation frames of every tier already built, shared by all ultimate attacks.
+    - max_tier (int): The last tier with its own frames.
+    - pace (int): How many times its direction the ultimate attack moves every frame.
 
     Methods:
-    - __init__(self, game, x, y): Initializes the Ultimate_attack instance.
-    - upgrade_attack_tier(self, tier): Upgrades the attack tier of the ultimate attack.
-    - collide(self): Handles collision detection and damage calculation for the ultimate attack.
-    - animate(self): Animates the ultimate attack by updating the current image.
+    - launch(game, x, y): Launches an ultimate attack from a position towards the mouse.
+    - limit(game): Returns the number of enemies an ultimate attack hits before vanishing.
+    - build_tier(game, tier): Slices and scales the animation frames of an ultimate attack tier.
+    - strike(game, damage, sprites): Damages the enemies hit by an ultimate attack.
     """
 
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y)
-        self.width *= 2
-        self.height *= 2
-        self.animations = [
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                0, 0, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                128, 0, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                256, 0, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                384, 0, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                0, 128, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                128, 128, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                256, 128, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                384, 128, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                0, 256, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                128, 256, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                256, 256, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                384, 256, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                0, 384, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                128, 384, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                256, 384, self.width, self.height, BLACK
-            ),
-            self.game.ultimate_attack_spritesheet.get_sprite(
-                384, 384, self.width, self.height, BLACK
-            ),
-        ] * (self.game.player.speed_level + 1)
-        # Upgrade the ultimate attack based on the player's ultimate attack level
-        self.upgrade_attack_tier(self.game.player.ultimate_attack_level // 3)
-        self.image = self.animations[0]
-        self.damage = (
-            self.game.player.ultimate_attack_damage
-            + self.game.player.ultimate_attack_level * 5
-        )
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
-        self.count = 0
-
-    def upgrade_attack_tier(self, tier):
+    tiers = {}
+    max_tier = 3
+    pace = 2
 
-        if tier == 1:
-            for i in range(len(self.animations)):
-                self.animations[i] = pygame.transform.scale(
-                    self.animations[i], (256, 256)
-                )
-            self.height *= 2
-            self.width *= 2
+    @classmethod
+    def launch(cls, game, x, y):
+        damage = (
+            game.player.ultimate_attack_damage + game.player.ultimate_attack_level * 5
+        )
+        dx, dy = cls.aim(game, x, y)
+        animations = game.player.ultimate_attack_animations
+        # Higher tiers of the ultimate attack are larger
+        return game.projectiles.launch(
+            cls,
+            x,
+            y,
+            animations[0].get_size(),
+            int(dx) * cls.pace,
+            int(dy) * cls.pace,
+            animations,
+            0.1,
+            16,
+            damage,
+        )
 
+    @staticmethod
+    def limit(game):
+        # The ultimate attack goes through more enemies at higher levels
+        return 1 + 1 * game.player.ultimate_attack_level
+
+    @staticmethod
+    def build_tier(game, tier):
+        # The tier of the ultimate attack (tier 0, 1, 2 or 3) depends on the player's ultimate attack level
+        if tier == 0:
+            spritesheet = game.ultimate_attack_spritesheet
+            colorkey, size = BLACK, None
+        elif tier == 1:
+            # Tier 1 is a larger version of the tier 0 tornado
+            return [
+                pygame.transform.scale(animation, (256, 256))
+                for animation in Ultimate_attack.tier_animations(game, 0)
+            ]
         elif tier == 2:
-            # Upgrade the ultimate attack to tier 2
-            self.game.ultimate_attack_spritesheet = Spritesheet(
-                "images/missles/lightningclaw.png"
+            spritesheet = Spritesheet_registry.get("images/missles/lightningclaw.png")
+            colorkey, size = BLACK, (256, 256)
+        else:
+            spritesheet = Spritesheet_registry.get(
+                "images/missles/ultimate_tornado_thunderclaw.png"
+            )
+            colorkey, size = WHITE, (512, 512)
+        animations = [
+            spritesheet.get_sprite(x, y, TILESIZE * 2, TILESIZE * 2, colorkey)
+            for y in range(0, 512, 128)
+            for x in range(0, 512, 128)
+        ]
+        if size:
+            animations = [
+                pygame.transform.scale(animation, size) for animation in animations
+            ]
+        return animations
+
+    @classmethod
+    def strike(cls, game, damage, sprites):
+        for sprite in sprites:
+            sprite.hit(damage)
+            Temporary_text_damage(
+                game,
+                damage,
+                "blue",
+                sprite.rect.x - game.camera.x,
+                sprite.rect.y + 32 - game.camera.y,
+                Font_manager.get(12 + int(damage * 0.5)),
             )
+        cls.play_hit_sounds(game, sprites)
 
-            self.animations = [
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 0, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 0, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 0, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 0, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 128, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 128, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 128, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 128, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 256, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 256, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 256, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 256, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 384, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 384, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 384, self.width, self.height, BLACK
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 384, self.width, self.height, BLACK
-                ),
-            ] * (self.game.player.speed_level + 1)
-            # Scale the ultimate attack to a larger size
-            for i in range(len(self.animations)):
-                self.animations[i] = pygame.transform.scale(
-                    self.animations[i], (256, 256)
-                )
-            self.height *= 2
-            self.width *= 2
-
-        elif tier >= 3:
-            self.game.ultimate_attack_spritesheet = Spritesheet(
-                "images/missles/ultimate_tornado_thunderclaw.png"
-            )
-
-            self.animations = [
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 0, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 0, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 0, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 0, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 128, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 128, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 128, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 128, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 256, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 256, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 256, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 256, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    0, 384, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    128, 384, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    256, 384, self.width, self.height, WHITE
-                ),
-                self.game.ultimate_attack_spritesheet.get_sprite(
-                    384, 384, self.width, self.height, WHITE
-                ),
-            ] * (self.game.player.speed_level + 1)
-            self.height *= 4
-            self.width *= 4
-            for i in range(len(self.animations)):
-                self.animations[i] = pygame.transform.scale(
-                    self.animations[i], (512, 512)
-                )
-
-    def collide(self):
-        self.max_count = 1 + 1 * self.game.player.ultimate_attack_level
-
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
-        if hits:
-            for sprite in hits:
-                sprite.health -= self.damage
-                self.count += 1
-                if self.count >= self.max_count:
-                    self.kill()
-                Temporary_text_damage(
-                    self.game,
-                    self.damage,
-                    "blue",
-                    sprite.rect.x,
-                    sprite.rect.y + 32,
-                    pygame.font.Font(
-                        "font/pixel_font.ttf", 12 + int(self.damage * 0.5)
-                    ),
-                )
-            # Play the appropriate sound effect based on the enemy type
-            for sprite in hits:
-                if sprite.name[-5:] == "Mouse":
-                    self.game.music.play_sound("mouse_sound")
-                elif sprite.name[:6] == "Desert":
-                    if sprite.name[-4:] != "Boss":
-                        self.game.music.play_sound("desert_sound")
-                    else:
-                        self.game.music.play_sound("desert_boss_sound")
-                elif sprite.name[:5] == "Burnt":
-                    if sprite.name[-8:] == "Succubus":
-                        self.game.music.play_sound("succubus_sound")
-                    elif sprite.name[-5:] == "Angel":
-                        self.game.music.play_sound("fallen_angel_sound")
-                    else:
-                        self.game.music.play_sound("burnt_sound")
-                elif sprite.name == "Dragon":
-                    self.game.music.play_sound("dragon_sound")
 
-    def animate(self):
-        self.image = self.animations[math.floor(self.animation_loop)]
-        self.animation_loop += 0.1
-        if self.animation_loop >= 16:
-            self.kill()
-
-    def movement(self):
-        self.rect.x = self.rect.x + int(self.dx) * 2
-        self.rect.y = self.rect.y + int(self.dy) * 2
-
-
-class Enemy_attack(pygame.sprite.Sprite):
+class Enemy_attack:
     """
     Represents an enemy attack in the game.
 
-    Attributes:
-        game (Game): The game instance.
-        x (int): The x-coordinate of the attack.
-        y (int): The y-coordinate of the attack.
-        enemy (Enemy): The enemy that initiated the attack.
-        width (int): The width of the attack.
-        height (int): The height of the attack.
-        animation_loop (int): The current animation frame.
-        direction (str): The direction the attack is facing.
-        damage (int): The damage inflicted by the attack.
-        angle (float): The angle between the player and the enemy.
-        dx (float): The change in x-coordinate per update.
-        dy (float): The change in y-coordinate per update.
-        spritesheet (Spritesheet): The spritesheet for the attack.
-        animation_speed (float): The speed of the animation.
-        rect (Rect): The rectangle representing the attack's position and size.
-    """
+    Enemy attacks are records of the game's Projectile_pool, like the attacks of the
+    player. This class launches them towards the player and applies their hits.
 
-    def __init__(self, game, x, y, enemy):
-        self.game = game
-        self._layer = PLAYER_LAYER
-        self.groups = self.game.attacks
-        pygame.sprite.Sprite.__init__(self, self.groups)
+    Attributes:
+        owner (str): Who launches the attacks, they hit the player.
+        pace (float): How many times its direction the attack moves every frame.
+        frames (dict): The projectile frames of every enemy archetype, shared by all attacks.
+        rotated (dict): The frames of an archetype that get rotated towards the player,
+            when they are not just the first one.
+        rotation_scales (dict): The size the rotated frames of an archetype are scaled to.
 
-        self.enemy = enemy
-        self.x = x
-        self.y = y
-        self.width = TILESIZE
-        self.height = TILESIZE
+    Methods:
+        launch(game, x, y, enemy): Launches an attack of an enemy towards the player.
+        prepare(name, spritesheet): Gets the projectile frames of an archetype.
+        cut(name, spritesheet): Cuts the projectile frames of an archetype.
+        release(name): Releases the projectile frames of an archetype.
+        personalize(enemy, angle): Returns the image, animation frames, animation
+            speed and damage of an attack.
+        limit(game): Returns the number of hits an attack lands before vanishing.
+        strike(game, damage, sprites): Hurts the player hit by an attack.
+    """
 
-        self.animation_loop = 0
-        self.direction = self.enemy.facing
-        self.damage = self.enemy.damage
+    owner = "enemy"
+    pace = 2
+    frames = {}
+    rotated = {
+        "Grey Mouse": (),
+        "Desert Boss": (),
+        "Burnt Fallen Angel": (),
+        "Dragon": (1, 2, 3),
+    }
+    rotation_scales = {}
+
+    @classmethod
+    def launch(cls, game, x, y, enemy):
         # Calculate the angle between the player and the enemy
-        self.angle = math.atan2(
-            self.game.player.rect.y - self.y, self.game.player.rect.x - self.x
-        )
+        angle = math.atan2(game.player.rect.y - y, game.player.rect.x - x)
         # Calculate the horizontal and vertical movement speed of the attack
-        self.dx = math.cos(self.angle) * self.enemy.speed * 2
-        self.dy = math.sin(self.angle) * self.enemy.speed * 2
+        dx = math.cos(angle) * enemy.speed * 2
+        dy = math.sin(angle) * enemy.speed * 2
+        image, animations, animation_speed, damage = cls.personalize(enemy, angle)
+        # Faster enemies have shorter lived attacks, the animation speed is taken
+        # from the enemy's speed when the attack is launched
+        return game.projectiles.launch(
+            cls,
+            x,
+            y,
+            image.get_size(),
+            int(dx) * cls.pace,
+            int(dy) * cls.pace,
+            animations,
+            animation_speed + enemy.speed * 0.05,
+            len(animations),
+            damage,
+        )
 
-        self.spritesheet = self.enemy.enemy_attack_spritesheet
-        self.animation_speed = 0.15
-        self.personalize(self.enemy.name)
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+    @classmethod
+    def prepare(cls, name, spritesheet):
+        """
+        Gets the projectile frames of an enemy archetype and pre-warms their rotations.
 
-    def personalize(self, name):
+        Runs once per archetype, when its zone is loaded (or when one of its enemies
+        attacks while the zone is released). The frames come from the frame cache on
+        disk when they were already cut on a previous launch.
 
-        if name == "Grey Mouse":
-            self.image = self.spritesheet.get_sprite(
-                0, 0, self.width, self.height // 2, WHITE
-            )
-            self.image = pygame.transform.scale(self.image, (16, 8))
-            self.animations = [self.image] * 35
+        Args:
+            name (str): The name of the enemy archetype.
+            spritesheet (Spritesheet): The attack spritesheet of the enemy.
 
+        Returns:
+            tuple: The projectile frames of the archetype.
+        """
+        if name in cls.frames:
+            return cls.frames[name]
+        archetype = (cls.__name__, name)
+        frames = Frame_cache.get(
+            archetype, lambda: {"frames": tuple(cls.cut(name, spritesheet))}
+        )["frames"]
+        cls.frames[name] = frames
+        if frames:
+            for i in cls.rotated.get(name, (0,)):
+                Rotation_cache.register(
+                    archetype, i, frames[i], cls.rotation_scales.get(name)
+                )
+        Rotation_cache.warm(archetype)
+        return frames
+
+    @staticmethod
+    def cut(name, spritesheet):
+        """
+        Cuts the projectile frames of an enemy archetype from its attack spritesheet.
+
+        Args:
+            name (str): The name of the enemy archetype.
+            spritesheet (Spritesheet): The attack spritesheet of the enemy.
+
+        Returns:
+            list: The projectile frames of the archetype.
+        """
+        if name == "Grey Mouse":
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, TILESIZE, TILESIZE // 2, WHITE),
+                    (16, 8),
+                )
+            ]
         elif name == "Brown Mouse":
-            self.image = self.spritesheet.get_sprite(0, 0, 16, 8, WHITE)
-            self.image = pygame.transform.scale(self.image, (32, 16))
-            self.animations = [
-                pygame.transform.rotate(self.image, i * 15) for i in range(24)
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 16, 8, WHITE), (32, 16)
+                )
             ]
         elif name == "White Mouse":
-            self.image = self.spritesheet.get_sprite(0, 0, 55, 5, WHITE)
-            self.image = pygame.transform.scale(self.image, (64, 8))
-
-            self.image = pygame.transform.rotate(
-                self.image, 180 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 35
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 55, 5, WHITE), (64, 8)
+                )
+            ]
         elif name == "Boss Mouse":
-            self.image = self.spritesheet.get_sprite(0, 0, 44, 30, WHITE)
-            self.image = pygame.transform.scale(self.image, (32, 32))
-            self.image = pygame.transform.rotate(
-                self.image, 290 - math.degrees(self.angle)
-            )
-
-            self.animations = [self.image] * 30
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 44, 30, WHITE), (32, 32)
+                )
+            ]
         elif name == "Desert Boarman":
-            self.image = self.spritesheet.get_sprite(0, 0, 24, 22, WHITE)
-            self.image = pygame.transform.scale(self.image, (32, 32))
-            self.image = pygame.transform.rotate(
-                self.image, 180 - math.degrees(self.angle)
-            )
-            self.animation_speed = 1
-            self.animations = [
-                pygame.transform.rotate(self.image, i * 5) for i in range(60)
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 24, 22, WHITE), (32, 32)
+                )
             ]
         elif name == "Desert Wolf":
-            self.image = self.spritesheet.get_sprite(0, 0, 85, 5, WHITE)
-            self.image = pygame.transform.scale(self.image, (96, 8))
-            self.image = pygame.transform.rotate(
-                self.image, 180 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 30
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 85, 5, WHITE), (96, 8)
+                )
+            ]
         elif name == "Desert Wartotaur":
-            self.image = self.spritesheet.get_sprite(0, 0, 60, 47, WHITE)
-            self.image = pygame.transform.scale(self.image, (32, 32))
-            self.image = pygame.transform.rotate(
-                self.image, 240 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 30
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 60, 47, WHITE), (32, 32)
+                )
+            ]
         elif name == "Desert Boss":
-            self.image = self.enemy.enemy_attack_spritesheet.get_sprite(
-                0, 0, 64, 64, WHITE
-            )
-            self.image = pygame.transform.scale(self.image, (32, 32))
-            self.animation_speed = 1.25
-            self.animations = [
-                self.enemy.enemy_attack_spritesheet.get_sprite(0, 0, 64, 64, WHITE),
-                self.enemy.enemy_attack_spritesheet.get_sprite(0, 64, 64, 64, WHITE),
-                self.enemy.enemy_attack_spritesheet.get_sprite(0, 128, 64, 64, WHITE),
-                self.enemy.enemy_attack_spritesheet.get_sprite(0, 192, 64, 64, WHITE),
-            ] * 20
+            # The first frame is the initial image, the rest are the animation
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 64, 64, WHITE), (32, 32)
+                ),
+                spritesheet.get_sprite(0, 0, 64, 64, WHITE),
+                spritesheet.get_sprite(0, 64, 64, 64, WHITE),
+                spritesheet.get_sprite(0, 128, 64, 64, WHITE),
+                spritesheet.get_sprite(0, 192, 64, 64, WHITE),
+            ]
         elif name == "Burnt Imp":
-            self.image = self.spritesheet.get_sprite(0, 0, 95, 19, WHITE)
-            self.image = pygame.transform.scale(self.image, (96, 16))
-            self.image = pygame.transform.rotate(
-                self.image, 180 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 30
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 95, 19, WHITE), (96, 16)
+                )
+            ]
         elif name == "Burnt Succubus":
-            self.image = self.spritesheet.get_sprite(0, 0, 93, 13, WHITE)
-            self.image = pygame.transform.scale(self.image, (96, 16))
-            self.image = pygame.transform.rotate(
-                self.image, 180 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 30
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 93, 13, WHITE), (96, 16)
+                )
+            ]
         elif name == "Burnt Fallen Angel":
-            self.image = self.spritesheet.get_sprite(0, 11, 11, 11, WHITE)
-            self.animations = [
-                self.spritesheet.get_sprite(0, 11, 11, 11, WHITE),
-                self.spritesheet.get_sprite(16, 7, 18, 18, WHITE),
-                self.spritesheet.get_sprite(46, 4, 22, 22, WHITE),
-                self.spritesheet.get_sprite(76, 1, 28, 28, WHITE),
-                self.spritesheet.get_sprite(106, 0, 31, 31, WHITE),
-            ] * 6
+            frames = [
+                spritesheet.get_sprite(0, 11, 11, 11, WHITE),
+                spritesheet.get_sprite(16, 7, 18, 18, WHITE),
+                spritesheet.get_sprite(46, 4, 22, 22, WHITE),
+                spritesheet.get_sprite(76, 1, 28, 28, WHITE),
+                spritesheet.get_sprite(106, 0, 31, 31, WHITE),
+            ]
         elif name == "Dragon":
-            self.image = self.spritesheet.get_sprite(0, 0, 17, 10, WHITE)
-            self.animations = [
-                self.spritesheet.get_sprite(0, 0, 17, 10, WHITE),
-                self.spritesheet.get_sprite(18, 0, 18, 10, WHITE),
-                self.spritesheet.get_sprite(16, 0, 16, 10, WHITE),
-            ] * 10
-            for i in range(len(self.animations)):
-                self.animations[i] = pygame.transform.scale(
-                    self.animations[i], (64, 32)
-                )
-                self.animations[i] = pygame.transform.rotate(
-                    self.animations[i], 180 - math.degrees(self.angle)
+            # The first frame is the initial image, the rest are rotated
+            frames = [spritesheet.get_sprite(0, 0, 17, 10, WHITE)] + [
+                pygame.transform.scale(sprite, (64, 32))
+                for sprite in (
+                    spritesheet.get_sprite(0, 0, 17, 10, WHITE),
+                    spritesheet.get_sprite(18, 0, 18, 10, WHITE),
+                    spritesheet.get_sprite(16, 0, 16, 10, WHITE),
                 )
+            ]
+        else:
+            frames = []
+        return frames
+
+    @classmethod
+    def release(cls, name):
+        cls.frames.pop(name, None)
+        Rotation_cache.release((cls.__name__, name))
+
+    @staticmethod
+    def personalize(enemy, angle):
+        name = enemy.name
+        frames = Enemy_attack.prepare(name, enemy.enemy_attack_spritesheet)
+        archetype = ("Enemy_attack", name)
+        # The rotation that points the projectile at the player
+        rotation = 180 - math.degrees(angle)
+        animation_speed = 0.15
 
-    def collide(self):
-        hits = pygame.sprite.spritecollide(self, self.game.all_sprites, False)
-        if hits:
-            for sprite in hits:
-                # If the player is hit by the enemy attack
-                if sprite.__class__.__name__ == "Player":
-                    self.game.music.play_sound("player_hurt")
-                    self.game.health_bar.lose(self.damage)
-                    self.kill()
+        if name == "Grey Mouse":
+            image = frames[0]
+            animations = [image] * 35
 
-    def update(self):
-        self.collide()
-        self.movement()
-        self.animate()
+        elif name == "Brown Mouse":
+            image = frames[0]
+            animations = [Rotation_cache.get(archetype, 0, i * 15) for i in range(24)]
+        elif name == "White Mouse":
+            image = Rotation_cache.get(archetype, 0, rotation)
+            animations = [image] * 35
+        elif name == "Boss Mouse":
+            image = Rotation_cache.get(archetype, 0, 290 - math.degrees(angle))
+            animations = [image] * 30
+        elif name == "Desert Boarman":
+            image = Rotation_cache.get(archetype, 0, rotation)
+            animation_speed = 1
+            animations = [
+                Rotation_cache.get(archetype, 0, rotation + i * 5) for i in range(60)
+            ]
+        elif name == "Desert Wolf":
+            image = Rotation_cache.get(archetype, 0, rotation)
+            animations = [image] * 30
+        elif name == "Desert Wartotaur":
+            image = Rotation_cache.get(archetype, 0, 240 - math.degrees(angle))
+            animations = [image] * 30
+        elif name == "Desert Boss":
+            image = frames[0]
+            animation_speed = 1.25
+            animations = list(frames[1:]) * 20
+        elif name == "Burnt Imp":
+            image = Rotation_cache.get(archetype, 0, rotation)
+            animations = [image] * 30
+        elif name == "Burnt Succubus":
+            image = Rotation_cache.get(archetype, 0, rotation)
+            animations = [image] * 30
+        elif name == "Burnt Fallen Angel":
+            image = frames[0]
+            animations = list(frames) * 6
+        elif name == "Dragon":
+            image = frames[0]
+            animations = [
+                Rotation_cache.get(archetype, i % 3 + 1, rotation) for i in range(30)
+            ]
+        return image, animations, animation_speed, enemy.damage
 
-    def animate(self):
-        self.image = self.animations[math.floor(self.animation_loop)]
-        self.animation_loop += self.animation_speed + (self.enemy.speed * 0.05)
-        if self.animation_loop >= len(self.animations):
-            self.kill()
+    @staticmethod
+    def limit(game):
+        return 1
 
-    def movement(self):
-        # Move the attack in the direction of the player
-        self.rect.x = self.rect.x + int(self.dx) * 2
-        self.rect.y = self.rect.y + int(self.dy) * 2
+    @staticmethod
+    def strike(game, damage, sprites):
+        # Enemy attacks only hit the player
+        game.player.hurt(damage)
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -1408,9 +1373,25 @@ class Enemy(pygame.sprite.Sprite):
         health (int): The current health of the enemy.
         exp (int): The amount of experience points the enemy gives when defeated.
         speed (int): The movement speed of the enemy.
-        respawn_id (Optional[int]): The ID of the enemy's respawn point (if applicable).
+        respawn_id (Optional[tuple]): The ID of the enemy's respawn point (if applicable).
+        reach (int): The distance the enemy chases and attacks the player from.
+        slot (int): The slot of the enemy in the game's Enemy_simulation, or None.
     """
 
+    reach = (WIDTH + HEIGHT) // 4
+    # Set while the enemy is updated by the game's Enemy_simulation
+    slot = None
+    # The attributes that change during the game, kept while the enemy is stored away
+    streamed = (
+        "health",
+        "speed",
+        "facing",
+        "animation_loop",
+        "dist",
+        "shoot_cooldown_count",
+        "respawn_id",
+    )
+
     def __init__(
         self,
         game,
@@ -1437,72 +1418,117 @@ class Enemy(pygame.sprite.Sprite):
 
         self.facing = random.choice(["up", "down", "right", "left"])
         self.animation_loop = 0
-        self.enemy_spritesheet = Spritesheet(enemy_spritesheet_path)
-        self.enemy_attack_spritesheet = Spritesheet(enemy_attack_spritesheet_path)
-        self.dist = 1000
-        self.image = self.enemy_spritesheet.get_sprite(
-            1, 128, self.width, self.height, WHITE
+        self.enemy_spritesheet = Spritesheet_registry.get(enemy_spritesheet_path)
+        self.enemy_attack_spritesheet = Spritesheet_registry.get(
+            enemy_attack_spritesheet_path
         )
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+        self.dist = 1000
+        self.name = name
+        # The zone of the tile the enemy was placed on, wherever it walks to
+        self.zone = self.game.zone_map.zone_at((self.x, self.y))
+        # Sets the image, the frames are only prepared if the zone is loaded
+        self.game.zones.register(self)
+        # The rect is the size of the idle frame
+        self.rect = pygame.Rect(self.x, self.y, TILESIZE, TILESIZE)
         self.respawn_id = respawn_id
         self.animate_speed = 0.15
         self.speed = speed
-        self.name = name
         self.damage = damage
         self.health = health
         self.experience = exp
         self.shoot_cooldown_count = 0
-        self.up_animations = [
-            self.enemy_spritesheet.get_sprite(0, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(64, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(128, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(192, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(256, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(320, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(384, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(448, 0, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(512, 0, self.width, self.height, WHITE),
-        ]
-
-        self.down_animations = [
-            self.enemy_spritesheet.get_sprite(0, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(64, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(128, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(192, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(256, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(320, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(384, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(448, 128, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(512, 128, self.width, self.height, WHITE),
-        ]
-
-        self.right_animations = [
-            self.enemy_spritesheet.get_sprite(0, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(64, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(128, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(192, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(256, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(320, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(384, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(448, 192, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(512, 192, self.width, self.height, WHITE),
-        ]
+        self.personalize(self.name)
 
-        self.left_animations = [
-            self.enemy_spritesheet.get_sprite(0, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(64, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(128, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(192, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(256, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(320, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(384, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(448, 64, self.width, self.height, WHITE),
-            self.enemy_spritesheet.get_sprite(512, 64, self.width, self.height, WHITE),
+    @property
+    def animations(self):
+        # Frames are shared by every enemy of the same archetype and are
+        # released with their zone, so they are looked up when needed
+        return Animation_bank.get(self.name, self.enemy_spritesheet)
+
+    def store(self):
+        # The compact state kept by the entity stream while the enemy's chunk is far
+        # from the player, the slows applied by the attacks live in its speed
+        if self.slot is not None:
+            self.game.simulation.sync(self)
+        state = {name: getattr(self, name) for name in self.streamed}
+        state["position"] = self.rect.topleft
+        return state
+
+    def restore(self, state):
+        for name, value in state.items():
+            if name == "position":
+                self.rect.topleft = value
+            else:
+                setattr(self, name, value)
+        if self.slot is not None:
+            self.game.simulation.load(self)
+
+    def hit(self, damage, slow=0):
+        # Attacks go through here, the state of a simulated enemy is in the simulation
+        self.game.activation.wake(self)
+        if self.slot is not None:
+            self.game.simulation.hit(self, damage, slow)
+        else:
+            self.health -= damage
+            self.speed -= slow
+
+    def simulated(self):
+        # Enemies join the game's simulation on their first update, once they are
+        # fully set up, and from then on are updated with all the others at once
+        if self.game.simulation is None:
+            return False
+        if self.slot is None:
+            self.game.simulation.add(self)
+        return True
+
+    def kill(self):
+        self.game.activation.remove(self)
+        if self.slot is not None:
+            self.game.simulation.remove(self)
+        super().kill()
+
+    def place(self, position):
+        # Moves the enemy outside of its update, in the spatial hash of the sprites too
+        self.rect.topleft = position
+        self.game.all_sprites.index.move(self)
+        if self.slot is not None:
+            self.game.simulation.place(self, position)
+
+    @classmethod
+    def separate(cls, game, radius=ENEMY_SEPARATION):
+        # Runs after all the enemies moved. The awake enemies within reach of the
+        # player step one pixel away from every enemy less than radius pixels from
+        # their center, unless a block is in the way. The neighbours are
+        # found through the spatial hash of the sprites, so the cost depends on the
+        # size of the crowd around the player, not on the number of enemies
+        sprites = game.all_sprites
+        sprites.place()
+        crowd = [
+            sprite
+            for sprite in sprites.index.within(game.player.rect.center, cls.reach)
+            if game.enemies.has_internal(sprite) and sprite.awake()
         ]
-        self.personalize(self.name)
-        self.attack = self.enemy_attack_spritesheet.get_sprite(0, 0, 64, 32, BLACK)
+        crowd.sort(key=sprites.order.__getitem__)
+        for enemy in crowd:
+            x, y = enemy.rect.center
+            push_x = push_y = 0
+            for other in sprites.index.within((x, y), radius):
+                if other is enemy or not game.enemies.has_internal(other):
+                    continue
+                push_x += (x > other.rect.centerx) - (x < other.rect.centerx)
+                push_y += (y > other.rect.centery) - (y < other.rect.centery)
+                if (x, y) == other.rect.center:
+                    # Enemies on the same spot part on the diagonal, the older one
+                    # up and to the left
+                    older = sprites.order[enemy] < sprites.order[other]
+                    push_x += -1 if older else 1
+                    push_y += -1 if older else 1
+            step = ((push_x > 0) - (push_x < 0), (push_y > 0) - (push_y < 0))
+            if step == (0, 0):
+                continue
+            rect = enemy.rect.move(step)
+            if not game.collision_map.hits(rect):
+                enemy.place(rect.topleft)
 
     def personalize(self, name):
         # Personalize the enemy based on its name
@@ -1516,129 +1542,6 @@ class Enemy(pygame.sprite.Sprite):
             self.max_cooldown_count = 80
         elif name == "Desert Wolf":
             self.max_cooldown_count = 60
-            self.image = self.enemy_spritesheet.get_sprite(
-                0, 0, self.width * 2, self.height, WHITE
-            )
-
-            self.up_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 0, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.down_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 140, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 140, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.right_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 223, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 223, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.left_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 64, self.width * 2, self.height, WHITE
-                ),
-            ]
         elif name == "Desert Wartotaur":
             self.max_cooldown_count = 80
         elif (
@@ -1647,176 +1550,16 @@ class Enemy(pygame.sprite.Sprite):
             or name == "Burnt Fallen Angel"
         ):
             self.max_cooldown_count = 60
-            self.image = self.enemy_spritesheet.get_sprite(
-                0, 0, self.width * 2, self.height, WHITE
-            )
-            self.up_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 0, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 0, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.down_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 128, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 128, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.right_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 192, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 192, self.width * 2, self.height, WHITE
-                ),
-            ]
-
-            self.left_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    640, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    768, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    896, 64, self.width * 2, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    1024, 64, self.width * 2, self.height, WHITE
-                ),
-            ]
 
         elif name == "Burnt Fallen Angel":
             self.max_cooldown_count = 25
 
     def update(self):
         # Update the enemy's position, animation, and attack cooldown
-        # based on the player's position
-        # and the enemy's name
-        # If the enemy is a Mouse... and the player is in the first area
-
-        if (
-            self.name[-5:] == "Mouse"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 > -37
-        ):
-
-            self.cooldown()
-            self.collide("x")
-            self.movement()
-            self.collide("y")
-            self.animate()
-
-            self.check_health()
-            if self.shoot_cooldown_count == 0:
-                self.attack_player()
-        # If the enemy is a Desert... and the player is in the second area
-        elif (
-            self.name[:6] == "Desert"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 < -36
-        ):
-
-            self.cooldown()
-            self.collide("x")
-            self.movement()
-            self.collide("y")
-            self.animate()
-
-            self.check_health()
-            if self.shoot_cooldown_count == 0:
-                self.attack_player()
-        # If the enemy is a Burnt... and the player is in the third area
-        elif (
-            self.name[:5] == "Burnt"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 < -54
-        ):
-
+        # while the player is in the enemy's area
+        if self.simulated():
+            return
+        if self.awake():
             self.cooldown()
             self.collide("x")
             self.movement()
@@ -1826,38 +1569,56 @@ class Enemy(pygame.sprite.Sprite):
             self.check_health()
             if self.shoot_cooldown_count == 0:
                 self.attack_player()
+        self.game.activation.settle(self)
+
+    def idle(self):
+        # Whether the updates of the enemy change nothing until the player comes
+        # within reach or enters another zone, see Enemy_activation
+        if not self.alive():
+            return False
+        if not self.awake():
+            return True
+        return self.dist >= self.reach and self.shoot_cooldown_count == 0
+
+    def awake(self):
+        # Enemies act while the player is in their zone, desert enemies also keep
+        # chasing the player into the burnt lands
+        zone = self.game.player.zone
+        if zone == self.zone:
+            return True
+        return self.zone == ZONES.index("desert") and zone == ZONES.index("burnt")
 
     def collide(self, direction):
         # Check for collisions with blocks in the game
         if self.dist < (WIDTH + HEIGHT) // 4:
             if direction == "x":
-                hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+                hits = self.game.collision_map.hits(self.rect)
                 if hits:
                     if self.facing == "right":
-                        self.rect.x = hits[0].rect.left - self.rect.width
+                        self.rect.x = hits[0].left - self.rect.width
                     if self.facing == "left":
-                        self.rect.x = hits[0].rect.right
+                        self.rect.x = hits[0].right
 
             if direction == "y":
-                hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+                hits = self.game.collision_map.hits(self.rect)
                 if hits:
                     if self.facing == "up":
-                        self.rect.y = hits[0].rect.bottom
+                        self.rect.y = hits[0].bottom
                     if self.facing == "down":
-                        self.rect.y = hits[0].rect.top - self.rect.height
+                        self.rect.y = hits[0].top - self.rect.height
 
     def attack_player(self):
         # Attack the player if the enemy is within range
-        if self.dist < (WIDTH + HEIGHT) // 4:
+        if self.dist < self.reach:
             self.shoot_cooldown_count += 1
             if self.facing == "up":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
+                Enemy_attack.launch(self.game, self.rect.x, self.rect.y, self)
             if self.facing == "down":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
+                Enemy_attack.launch(self.game, self.rect.x, self.rect.y, self)
             if self.facing == "left":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
+                Enemy_attack.launch(self.game, self.rect.x, self.rect.y, self)
             if self.facing == "right":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
+                Enemy_attack.launch(self.game, self.rect.x, self.rect.y, self)
 
     def movement(self):
         # Move the enemy towards the player
@@ -1866,7 +1627,7 @@ class Enemy(pygame.sprite.Sprite):
             self.game.player.rect.y - self.rect.y,
         )
 
-        if self.dist < (WIDTH + HEIGHT) // 4:
+        if self.dist < self.reach:
             if self.game.player.rect.x > self.rect.x:
 
                 self.rect.x += self.speed
@@ -1889,43 +1650,46 @@ class Enemy(pygame.sprite.Sprite):
 
     def animate(self):
         # Animate the enemy based on its direction
-        if self.dist < (WIDTH + HEIGHT) // 4:
+        if self.dist < self.reach:
+            animations = self.animations
             if self.facing == "down":
 
-                self.image = self.down_animations[math.floor(self.animation_loop)]
+                self.image = animations["down"][math.floor(self.animation_loop)]
                 self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.down_animations):
+                if self.animation_loop >= len(animations["down"]):
                     self.animation_loop = 1
 
             if self.facing == "up":
 
-                self.image = self.up_animations[math.floor(self.animation_loop)]
+                self.image = animations["up"][math.floor(self.animation_loop)]
                 self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.up_animations):
+                if self.animation_loop >= len(animations["up"]):
                     self.animation_loop = 1
 
             if self.facing == "left":
 
-                self.image = self.left_animations[math.floor(self.animation_loop)]
+                self.image = animations["left"][math.floor(self.animation_loop)]
                 self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.left_animations):
+                if self.animation_loop >= len(animations["left"]):
                     self.animation_loop = 1
 
             if self.facing == "right":
 
-                self.image = self.right_animations[math.floor(self.animation_loop)]
+                self.image = animations["right"][math.floor(self.animation_loop)]
                 self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.right_animations):
+                if self.animation_loop >= len(animations["right"]):
                     self.animation_loop = 1
-        else:
+        elif self.zone in self.game.zones.resident:
+            # Out of range enemies of released zones keep their placeholder
+            animations = self.animations
             if self.facing == "up":
-                self.image = self.up_animations[0]
+                self.image = animations["up"][0]
             elif self.facing == "down":
-                self.image = self.down_animations[0]
+                self.image = animations["down"][0]
             elif self.facing == "right":
-                self.image = self.right_animations[0]
+                self.image = animations["right"][0]
             else:
-                self.image = self.left_animations[0]
+                self.image = animations["left"][0]
 
     def check_health(self):
         # Check if the enemy's health is less than or equal to 0
@@ -1939,10 +1703,10 @@ class Enemy(pygame.sprite.Sprite):
                 "yellow",
                 self.game.experience_bar.x + 325,
                 self.game.experience_bar.y + 12,
-                pygame.font.Font("font/pixel_font.ttf", 12),
+                Font_manager.get(12),
             )
 
-            self.game.spawner.add(self.respawn_id)
+            self.game.spawner.add(self)
             if self.name == "Dragon":
                 self.game.active_game = 0
                 self.game.win = 1
@@ -1972,7 +1736,7 @@ class Boss(Enemy):
         health (int): The health of the boss.
         exp (int): The experience points gained by defeating the boss.
         speed (int): The movement speed of the boss.
-        respawn_id (int, optional): The ID of the boss's respawn point.
+        respawn_id (tuple, optional): The ID of the boss's respawn point.
 
     Attributes:
         boss_attack_spritesheet (Spritesheet): The spritesheet for boss attacks.
@@ -1986,6 +1750,8 @@ class Boss(Enemy):
         personalize(name): Personalizes the boss's attributes based on its name.
     """
 
+    streamed = Enemy.streamed + ("ultimate_cooldown_count",)
+
     def __init__(
         self,
         game,
@@ -2001,6 +1767,9 @@ class Boss(Enemy):
         speed,
         respawn_id=None,
     ):
+        self.boss_attack_spritesheet = Spritesheet_registry.get(
+            boss_attack_spritesheet_path
+        )
         super().__init__(
             game,
             x,
@@ -2014,53 +1783,16 @@ class Boss(Enemy):
             speed,
             respawn_id=respawn_id,
         )
-        self.boss_attack_spritesheet = Spritesheet(boss_attack_spritesheet_path)
         self.max_cooldown_count = 75
         self.ultimate_cooldown_count = 0
         self.ultimate_cooldown_max = 100
         self.personalize(self.name)
 
     def update(self):
-        if (
-            self.name[-5:] == "Mouse"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 > -37
-        ):
-            self.cooldown()
-            self.cooldown_ultimate()
-            self.collide("x")
-            self.movement()
-            self.collide("y")
-            self.animate()
-
-            self.check_health()
-            if self.shoot_cooldown_count == 0:
-                self.attack_player()
-            if self.ultimate_cooldown_count == 0:
-                self.ultimate_attack_player()
-        elif (
-            self.name[:6] == "Desert"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 > -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 < -36
-        ):
-
-            self.cooldown()
-            self.cooldown_ultimate()
-            self.collide("x")
-            self.movement()
-            self.collide("y")
-            self.animate()
-
-            self.check_health()
-            if self.shoot_cooldown_count == 0:
-                self.attack_player()
-            if self.ultimate_cooldown_count == 0:
-                self.ultimate_attack_player()
-        elif (
-            self.name[:5] == "Burnt"
-            and self.game.player.absolute_sprite_moved_value[0] / 69268 // 16 < -80
-            and self.game.player.absolute_sprite_moved_value[1] / 69268 // 16 < -55
-        ):
+        if self.simulated():
+            return
+        # The dragon is always awake
+        if self.name == "Dragon" or self.awake():
             self.cooldown()
             self.cooldown_ultimate()
             self.collide("x")
@@ -2073,25 +1805,18 @@ class Boss(Enemy):
                 self.attack_player()
             if self.ultimate_cooldown_count == 0:
                 self.ultimate_attack_player()
-        # If the boss is a Dragon... and the player is in the final area
-        elif self.name == "Dragon":
-            self.cooldown()
-            self.cooldown_ultimate()
-            self.collide("x")
-            self.movement()
-            self.collide("y")
-            self.animate()
+        self.game.activation.settle(self)
 
-            self.check_health()
-            if self.shoot_cooldown_count == 0:
-                self.attack_player()
-            if self.ultimate_cooldown_count == 0:
-                self.ultimate_attack_player()
+    def idle(self):
+        # The ultimate attack of an awake boss never stops cooling down
+        if self.name == "Dragon" or self.awake():
+            return False
+        return super().idle()
 
     def ultimate_attack_player(self):
         self.ultimate_cooldown_count += 1
         if self.dist < ((WIDTH + HEIGHT) // 4) + 100:
-            Boss_attack(self.game, self.rect.x, self.rect.y, self)
+            Boss_attack.launch(self.game, self.rect.x, self.rect.y, self)
 
     def personalize(self, name):
         if name == "Boss Mouse":
@@ -2101,175 +1826,10 @@ class Boss(Enemy):
             self.max_cooldown_count = 25
             self.ultimate_cooldown_max = 200
 
-            self.up_animations = [
-                self.enemy_spritesheet.get_sprite(0, 0, self.width, self.height, WHITE),
-                self.enemy_spritesheet.get_sprite(
-                    64, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    192, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    320, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    448, 0, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 0, self.width, self.height, WHITE
-                ),
-            ]
-
-            self.down_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    64, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    192, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    320, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    448, 128, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 128, self.width, self.height, WHITE
-                ),
-            ]
-
-            self.right_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    64, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    192, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    320, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    448, 192, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 192, self.width, self.height, WHITE
-                ),
-            ]
-
-            self.left_animations = [
-                self.enemy_spritesheet.get_sprite(
-                    0, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    64, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    128, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    192, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    256, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    320, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    384, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    448, 64, self.width, self.height, WHITE
-                ),
-                self.enemy_spritesheet.get_sprite(
-                    512, 64, self.width, self.height, WHITE
-                ),
-            ]
-            # Scale the animations
-            for i in range(9):
-                self.left_animations[i] = pygame.transform.scale(
-                    self.left_animations[i], (128, 128)
-                )
-                self.right_animations[i] = pygame.transform.scale(
-                    self.right_animations[i], (128, 128)
-                )
-                self.up_animations[i] = pygame.transform.scale(
-                    self.up_animations[i], (128, 128)
-                )
-                self.down_animations[i] = pygame.transform.scale(
-                    self.down_animations[i], (128, 128)
-                )
         elif name == "Dragon":
             self.max_cooldown_count = 40
             self.ultimate_cooldown_max = 350
             self.animate_speed = 0.05
-            self.up_animations = [
-                self.enemy_spritesheet.get_sprite(0, 0, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(144, 0, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(288, 0, 144, 128, BLACK),
-            ]
-            self.right_animations = [
-                self.enemy_spritesheet.get_sprite(0, 128, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(144, 128, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(288, 128, 144, 128, BLACK),
-            ]
-            self.down_animations = [
-                self.enemy_spritesheet.get_sprite(0, 256, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(144, 256, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(288, 256, 144, 128, BLACK),
-            ]
-            self.left_animations = [
-                self.enemy_spritesheet.get_sprite(0, 384, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(144, 384, 144, 128, BLACK),
-                self.enemy_spritesheet.get_sprite(288, 384, 144, 128, BLACK),
-            ]
-            # Scale the animations
-            for i in range(3):
-                self.left_animations[i] = pygame.transform.scale(
-                    self.left_animations[i], (288, 256)
-                )
-                self.right_animations[i] = pygame.transform.scale(
-                    self.right_animations[i], (288, 256)
-                )
-                self.up_animations[i] = pygame.transform.scale(
-                    self.up_animations[i], (288, 256)
-                )
-                self.down_animations[i] = pygame.transform.scale(
-                    self.down_animations[i], (288, 256)
-                )
 
     def cooldown_ultimate(self):
 
@@ -2283,67 +1843,83 @@ class Boss_attack(Enemy_attack):
     """
     Represents a boss attack in the game.
 
+    Boss attacks are launched like enemy attacks, with the ultimate projectile frames
+    of the boss, and move faster and hit harder.
+
     Attributes:
-        game (Game): The game instance.
-        x (int): The x-coordinate of the attack.
-        y (int): The y-coordinate of the attack.
-        enemy (Enemy): The enemy that initiated the attack.
-        damage (int): The damage inflicted by the attack.
-        image (pygame.Surface): The image of the attack.
-        animations (list): The list of animation frames for the attack.
+        pace (float): How many times its direction the attack moves every frame.
+        frames (dict): The ultimate projectile frames of every boss, shared by all attacks.
+        rotated (dict): The frames of a boss that get rotated, when they are not just the first one.
+        rotation_scales (dict): The size the rotated frames of a boss are scaled to.
     """
 
-    def __init__(self, game, x, y, enemy):
-        super().__init__(game, x, y, enemy)
-        self.damage = self.enemy.damage * 3
-        self.personalize(self.enemy.name)
+    pace = 2.5
+    frames = {}
+    rotated = {"Dragon": (0, 1, 2, 3)}
+    # The dragon's fireballs are scaled after being rotated
+    rotation_scales = {"Dragon": (128, 128)}
 
-    def personalize(self, name):
-        if name == "Boss Mouse":
+    @staticmethod
+    def cut(name, spritesheet):
+        """
+        Cuts the ultimate projectile frames of a boss from its attack spritesheet.
 
-            self.image = self.enemy.boss_attack_spritesheet.get_sprite(
-                0, 0, 44, 30, WHITE
-            )
-            self.image = pygame.transform.scale(self.image, (128, 64))
-            self.image = pygame.transform.rotate(
-                self.image, 290 - math.degrees(self.angle)
-            )
-            self.animations = [self.image] * 35
+        Args:
+            name (str): The name of the boss.
+            spritesheet (Spritesheet): The boss attack spritesheet.
+
+        Returns:
+            list: The ultimate projectile frames of the boss.
+        """
+        if name == "Boss Mouse":
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 44, 30, WHITE), (128, 64)
+                )
+            ]
         elif name == "Desert Boss":
-            self.image = self.enemy.boss_attack_spritesheet.get_sprite(
-                0, 0, 45, 23, WHITE
-            )
-            self.image = pygame.transform.scale(self.image, (128, 64))
-            self.animation_speed = 1
-            self.animations = [
-                pygame.transform.rotate(self.image, i * 5) for i in range(60)
+            # The second frame is the initial image
+            frames = [
+                pygame.transform.scale(
+                    spritesheet.get_sprite(0, 0, 45, 23, WHITE), (128, 64)
+                ),
+                spritesheet.get_sprite(0, 0, 64, 64, WHITE),
             ]
-            self.damage = self.enemy.damage * 5
-            self.image = self.enemy.boss_attack_spritesheet.get_sprite(
-                0, 0, 64, 64, WHITE
-            )
         elif name == "Dragon":
-            self.image = self.enemy.boss_attack_spritesheet.get_sprite(
-                0, 0, 32, 32, BLACK
-            )
-            self.animations = [
-                self.enemy.boss_attack_spritesheet.get_sprite(0, 0, 32, 32, BLACK),
-                self.enemy.boss_attack_spritesheet.get_sprite(32, 0, 32, 32, BLACK),
-                self.enemy.boss_attack_spritesheet.get_sprite(64, 0, 32, 32, BLACK),
-                self.enemy.boss_attack_spritesheet.get_sprite(96, 0, 32, 32, BLACK),
-            ] * 5
-            self.damage = self.enemy.damage * 10
-            for i in range(len(self.animations)):
-                self.animations[i] = pygame.transform.rotate(
-                    self.animations[i], 90 - math.degrees(self.angle)
-                )
-                self.animations[i] = pygame.transform.scale(
-                    self.animations[i], (128, 128)
-                )
+            frames = [
+                spritesheet.get_sprite(0, 0, 32, 32, BLACK),
+                spritesheet.get_sprite(32, 0, 32, 32, BLACK),
+                spritesheet.get_sprite(64, 0, 32, 32, BLACK),
+                spritesheet.get_sprite(96, 0, 32, 32, BLACK),
+            ]
+        else:
+            frames = []
+        return frames
+
+    @staticmethod
+    def personalize(enemy, angle):
+        name = enemy.name
+        frames = Boss_attack.prepare(name, enemy.boss_attack_spritesheet)
+        archetype = ("Boss_attack", name)
+        animation_speed = 0.15
+        damage = enemy.damage * 3
+        if name == "Boss Mouse":
 
-    def movement(self):
-        self.rect.x = self.rect.x + int(self.dx) * 2.5
-        self.rect.y = self.rect.y + int(self.dy) * 2.5
+            image = Rotation_cache.get(archetype, 0, 290 - math.degrees(angle))
+            animations = [image] * 35
+        elif name == "Desert Boss":
+            animation_speed = 1
+            animations = [Rotation_cache.get(archetype, 0, i * 5) for i in range(60)]
+            damage = enemy.damage * 5
+            image = frames[1]
+        elif name == "Dragon":
+            image = frames[0]
+            animations = [
+                Rotation_cache.get(archetype, i % 4, 90 - math.degrees(angle))
+                for i in range(20)
+            ]
+            damage = enemy.damage * 10
+        return image, animations, animation_speed, damage
 
 
 class Last_boss(Boss):
@@ -2362,9 +1938,13 @@ class Last_boss(Boss):
         health (int): The health points of the boss.
         exp (int): The experience points gained by defeating the boss.
         speed (int): The movement speed of the boss.
-        respawn_id (int, optional): The ID used for boss respawn. Defaults to None.
+        respawn_id (tuple, optional): The ID used for boss respawn. Defaults to None.
+
+    The dragon chases, attacks and is animated from further away than other enemies.
     """
 
+    reach = 1200
+
     def __init__(
         self,
         game,
@@ -2395,85 +1975,6 @@ class Last_boss(Boss):
             respawn_id,
         )
 
-    def attack_player(self):
-
-        if self.dist < 1200:
-            self.shoot_cooldown_count += 1
-            if self.facing == "up":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
-            if self.facing == "down":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
-            if self.facing == "left":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
-            if self.facing == "right":
-                Enemy_attack(self.game, self.rect.x, self.rect.y, self)
-
-    def movement(self):
-        self.dist = math.hypot(
-            self.game.player.rect.x - self.rect.x,
-            self.game.player.rect.y - self.rect.y,
-        )
-
-        if self.dist < 1200:
-            if self.game.player.rect.x > self.rect.x:
-
-                self.rect.x += self.speed
-                self.facing = "right"
-
-            elif self.game.player.rect.x < self.rect.x:
-
-                self.rect.x -= self.speed
-                self.facing = "left"
-
-            elif self.game.player.rect.y > self.rect.y:
-
-                self.rect.y += self.speed
-                self.facing = "down"
-
-            elif self.game.player.rect.y < self.rect.y:
-
-                self.rect.y -= self.speed
-                self.facing = "up"
-
-    def animate(self):
-        if self.dist < 1200:
-            if self.facing == "down":
-
-                self.image = self.down_animations[math.floor(self.animation_loop)]
-                self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.down_animations):
-                    self.animation_loop = 1
-
-            if self.facing == "up":
-
-                self.image = self.up_animations[math.floor(self.animation_loop)]
-                self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.up_animations):
-                    self.animation_loop = 1
-
-            if self.facing == "left":
-
-                self.image = self.left_animations[math.floor(self.animation_loop)]
-                self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.left_animations):
-                    self.animation_loop = 1
-
-            if self.facing == "right":
-
-                self.image = self.right_animations[math.floor(self.animation_loop)]
-                self.animation_loop += self.animate_speed
-                if self.animation_loop >= len(self.right_animations):
-                    self.animation_loop = 1
-        else:
-            if self.facing == "up":
-                self.image = self.up_animations[0]
-            elif self.facing == "down":
-                self.image = self.down_animations[0]
-            elif self.facing == "right":
-                self.image = self.right_animations[0]
-            else:
-                self.image = self.left_animations[0]
-
 
 class Bar(pygame.sprite.Sprite):
     """
@@ -2530,7 +2031,7 @@ class Bar(pygame.sprite.Sprite):
             BLACK,
             self.x + 150,
             self.y + 12,
-            pygame.font.Font("font/pixel_font.ttf", 12),
+            Font_manager.get(12),
         ).draw(screen)
         for i in range(4):
             pygame.draw.rect(
@@ -2705,7 +2206,8 @@ class Music:
 
     Attributes:
         music (dict): A dictionary mapping music names to their file paths.
-        sound (dict): A dictionary mapping sound effect names to their file paths.
+        sound_files (dict): A dictionary mapping sound effect names to their file paths.
+        sound (dict): A dictionary mapping sound effect names to the sounds played so far.
     """
 
     def __init__(self):
@@ -2717,23 +2219,24 @@ class Music:
             "boss_room": "sounds/Music/boss_room_music.flac",
             "victory": "sounds/Music/victory_music.mp3",
         }
+        self.sound_files = {
+            "button_click": "sounds/Sound/button_sound.flac",
+            "level_up": "sounds/Sound/level_up_sound.mp3",
+            "mouse_sound": "sounds/Sound/mouse_sound.mp3",
+            "desert_sound": "sounds/Sound/desert_sound.mp3",
+            "desert_boss_sound": "sounds/Sound/desert_boss_sound.mp3",
+            "burnt_sound": "sounds/Sound/burnt_sound.mp3",
+            "succubus_sound": "sounds/Sound/succubus_sound.mp3",
+            "fallen_angel_sound": "sounds/Sound/fallen_angel_sound.mp3",
+            "player_hurt": "sounds/Sound/player_hurt_sound.mp3",
+            "player_death": "sounds/Sound/player_death_sound.mp3",
+            "dragon_sound": "sounds/Sound/dragon_sound.mp3",
+            "game_over": "sounds/Sound/game_over_sound.mp3",
+        }
+        # The menu needs the button sound right away, the other sounds are
+        # loaded in the background while the menu is shown
         self.sound = {
-            "button_click": pygame.mixer.Sound("sounds/Sound/button_sound.flac"),
-            "level_up": pygame.mixer.Sound("sounds/Sound/level_up_sound.mp3"),
-            "mouse_sound": pygame.mixer.Sound("sounds/Sound/mouse_sound.mp3"),
-            "desert_sound": pygame.mixer.Sound("sounds/Sound/desert_sound.mp3"),
-            "desert_boss_sound": pygame.mixer.Sound(
-                "sounds/Sound/desert_boss_sound.mp3"
-            ),
-            "burnt_sound": pygame.mixer.Sound("sounds/Sound/burnt_sound.mp3"),
-            "succubus_sound": pygame.mixer.Sound("sounds/Sound/succubus_sound.mp3"),
-            "fallen_angel_sound": pygame.mixer.Sound(
-                "sounds/Sound/fallen_angel_sound.mp3"
-            ),
-            "player_hurt": pygame.mixer.Sound("sounds/Sound/player_hurt_sound.mp3"),
-            "player_death": pygame.mixer.Sound("sounds/Sound/player_death_sound.mp3"),
-            "dragon_sound": pygame.mixer.Sound("sounds/Sound/dragon_sound.mp3"),
-            "game_over": pygame.mixer.Sound("sounds/Sound/game_over_sound.mp3"),
+            "button_click": Asset_loader.load_sound(self.sound_files["button_click"])
         }
 
     def play_music(self, name):
@@ -2741,6 +2244,8 @@ class Music:
         pygame.mixer.music.play(-1)
 
     def play_sound(self, name):
+        if name not in self.sound:
+            self.sound[name] = Asset_loader.load_sound(self.sound_files[name])
         self.sound[name].play()
         if name == "level_up":
             self.sound[name].set_volume(0.25)
@@ -2766,6 +2271,149 @@ class Music:
             self.sound[name].set_volume(0.2)
 
 
+class Zone_assets:
+    """
+    Keeps the assets of the zones around the player loaded and releases the others.
+
+    The zones are visited in order (mouse, desert, burnt and dragon). The zone the
+    player is in and the zones up to ZONE_PREFETCH_DISTANCE away from it are resident:
+    the animations and projectile frames of their enemies are prepared and their sound
+    effects are loaded. When the player changes zone, the zones that fall out of that
+    distance are released and their enemies show a placeholder until the zone is
+    loaded again. Anything still requested from a released zone is loaded on the spot.
+
+    Attributes:
+        game (Game): The game instance.
+        current (int): The zone the player is in.
+        resident (set): The zones whose assets are loaded.
+        archetypes (dict): A dictionary mapping zones to an enemy of every archetype seen there.
+        placeholder (Surface): The image of the enemies of released zones.
+        loads (int): The number of times a zone was loaded.
+        releases (int): The number of times a zone was released.
+
+    Methods:
+        zones_near(zone): Returns the zones that are resident while the player is in a zone.
+        register(enemy): Records the archetype of a new enemy and sets its image.
+        enter(zone): Loads and releases zones after the player entered a zone.
+        load(zone): Loads the assets of a zone.
+        release(zone): Releases the assets of a zone.
+        far_directories(): Returns the image directories of the zones that are not resident.
+        far_sounds(): Returns the sound effects of the zones that are not resident.
+        stats(): Returns the resident zones and the load/release counters.
+    """
+
+    # The music played in each zone
+    music = ("level_1", "level_2", "level_3", "boss_room")
+    # The sound effects played when the enemies of each zone are hit
+    sounds = (
+        ("mouse_sound",),
+        ("desert_sound", "desert_boss_sound"),
+        ("burnt_sound", "succubus_sound", "fallen_angel_sound"),
+        ("dragon_sound",),
+    )
+
+    def __init__(self, game, zone=0):
+        self.game = game
+        self.current = zone
+        self.resident = self.zones_near(zone)
+        self.archetypes = {zone: {} for zone in range(len(ZONES))}
+        self.placeholder = pygame.Surface((TILESIZE, TILESIZE), pygame.SRCALPHA)
+        self.loads = 0
+        self.releases = 0
+
+    @staticmethod
+    def zones_near(zone):
+        return {
+            near
+            for near in range(len(ZONES))
+            if abs(near - zone) <= ZONE_PREFETCH_DISTANCE
+        }
+
+    def register(self, enemy):
+        self.archetypes[enemy.zone].setdefault(enemy.name, enemy)
+        if enemy.zone in self.resident:
+            self.prepare(enemy)
+            enemy.image = enemy.animations["image"]
+        else:
+            enemy.image = self.placeholder
+
+    @staticmethod
+    def prepare(enemy):
+        # Builds the shared frames of the enemy's archetype, if they are not built yet
+        Animation_bank.get(enemy.name, enemy.enemy_spritesheet)
+        Enemy_attack.prepare(enemy.name, enemy.enemy_attack_spritesheet)
+        if isinstance(enemy, Boss):
+            Boss_attack.prepare(enemy.name, enemy.boss_attack_spritesheet)
+
+    def enter(self, zone):
+        if zone == self.current:
+            return
+        self.current = zone
+        resident = self.zones_near(zone)
+        for far in self.resident - resident:
+            self.release(far)
+        for near in resident - self.resident:
+            self.load(near)
+        self.resident = resident
+
+    def load(self, zone):
+        self.loads += 1
+        for enemy in self.archetypes[zone].values():
+            self.prepare(enemy)
+        for name in self.sounds[zone]:
+            self.game.music.sound[name] = Asset_loader.load_sound(
+                self.game.music.sound_files[name]
+            )
+        for enemy in self.game.enemies:
+            if enemy.zone == zone:
+                enemy.image = enemy.animations["image"]
+
+    def release(self, zone):
+        self.releases += 1
+        for enemy in self.game.enemies:
+            if enemy.zone == zone:
+                enemy.image = self.placeholder
+        # An archetype placed in several zones stays loaded while one of them is
+        resident = self.zones_near(self.current) - {zone}
+        for name, enemy in self.archetypes[zone].items():
+            if any(name in self.archetypes[near] for near in resident):
+                continue
+            Animation_bank.release(name)
+            Enemy_attack.release(name)
+            Boss_attack.release(name)
+            enemy.enemy_spritesheet.release()
+            enemy.enemy_attack_spritesheet.release()
+            if isinstance(enemy, Boss):
+                enemy.boss_attack_spritesheet.release()
+        for name in self.sounds[zone]:
+            self.game.music.sound.pop(name, None)
+            Asset_loader.release_sound(self.game.music.sound_files[name])
+
+    def far_directories(self):
+        # The enemy images of each zone are in their own directory
+        return {
+            f"images/enemies/level_{zone + 1}"
+            for zone in range(len(ZONES))
+            if zone not in self.resident
+        }
+
+    def far_sounds(self):
+        return {
+            name
+            for zone in range(len(ZONES))
+            if zone not in self.resident
+            for name in self.sounds[zone]
+        }
+
+    def stats(self):
+        return {
+            "zone": ZONES[self.current],
+            "resident": [ZONES[zone] for zone in sorted(self.resident)],
+            "loads": self.loads,
+            "releases": self.releases,
+        }
+
+
 class Spawner:
     """
     Initializes a new instance of the Spawner class.
@@ -2777,505 +2425,70 @@ class Spawner:
     - game (Game): The game instance.
     - respawn_time (int): The time it takes for enemies to respawn.
     - current (int): The current respawn time.
-    - hashmap_of_enemies (dict): A dictionary that maps enemy names to their positions.
     - list_of_dead_enemies (list): A list of dead enemy respawn IDs.
-    - list_of_all_enemies (list): A list of all enemy instances in the game.
+
+    The respawn ID of an enemy placed on the map is the index of its archetype in the
+    level with the tile it was placed on. The enemy comes back there with the
+    "respawn" args of its archetype in levels/legend.json, or its "args" if it has
+    none, and never if they are null. With ENEMY_SEPARATION on, an enemy whose
+    respawn point is taken by the player or another enemy waits for the next respawn.
     """
 
+    # The classes named by the enemy archetypes of the level (see Level.enemies)
+    enemy_types = {"Enemy": Enemy, "Boss": Boss, "Last_boss": Last_boss}
+
     def __init__(self, game):
 
         self.game = game
         self.respawn_time = ENEMIES_RESPAWN_TIME
 
         self.current = self.respawn_time
-        # A dictionary that maps enemy names to their positions
-        self.hashmap_of_enemies = {
-            "Grey Mouse": [],
-            "Brown Mouse": [],
-            "White Mouse": [],
-            "Boss Mouse": [],
-            "Desert Boarman": [],
-            "Desert Wolf": [],
-            "Desert Wartotaur": [],
-            "Desert Boss": [],
-            "Burnt Imp": [],
-            "Burnt Succubus": [],
-            "Burnt Fallen Angel": [],
-            "Dragon": [],
-        }
         # A list of dead enemy respawn IDs
         self.list_of_dead_enemies = []
-        # A list of all enemy instances in the game
-        self.list_of_all_enemies = [enemy for enemy in self.game.enemies.sprites()]
-        # Initialize the hashmap of enemies
-        for i in range(len(self.list_of_all_enemies)):
-            if self.list_of_all_enemies[i].name == "Grey Mouse":
-                self.hashmap_of_enemies["Grey Mouse"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "e",
-                    len(self.hashmap_of_enemies["Grey Mouse"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Brown Mouse":
-                self.hashmap_of_enemies["Brown Mouse"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "a",
-                    len(self.hashmap_of_enemies["Brown Mouse"]),
-                )
-            elif self.list_of_all_enemies[i].name == "White Mouse":
-                self.hashmap_of_enemies["White Mouse"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "s",
-                    len(self.hashmap_of_enemies["White Mouse"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Boss Mouse":
-                self.hashmap_of_enemies["Boss Mouse"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "m",
-                    len(self.hashmap_of_enemies["Boss Mouse"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Desert Boarman":
-                self.hashmap_of_enemies["Desert Boarman"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "b",
-                    len(self.hashmap_of_enemies["Desert Boarman"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Desert Wolf":
-                self.hashmap_of_enemies["Desert Wolf"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "w",
-                    len(self.hashmap_of_enemies["Desert Wolf"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Desert Wartotaur":
-                self.hashmap_of_enemies["Desert Wartotaur"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "W",
-                    len(self.hashmap_of_enemies["Desert Wartotaur"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Desert Boss":
-                self.hashmap_of_enemies["Desert Boss"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "M",
-                    len(self.hashmap_of_enemies["Desert Boss"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Burnt Imp":
-                self.hashmap_of_enemies["Burnt Imp"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "i",
-                    len(self.hashmap_of_enemies["Burnt Imp"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Burnt Succubus":
-                self.hashmap_of_enemies["Burnt Succubus"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "u",
-                    len(self.hashmap_of_enemies["Burnt Succubus"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Burnt Fallen Angel":
-                self.hashmap_of_enemies["Burnt Fallen Angel"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "f",
-                    len(self.hashmap_of_enemies["Burnt Fallen Angel"]),
-                )
-            elif self.list_of_all_enemies[i].name == "Dragon":
-                self.hashmap_of_enemies["Dragon"].append(
-                    [
-                        self.list_of_all_enemies[i].rect.x // 64,
-                        self.list_of_all_enemies[i].rect.y // 64,
-                    ]
-                )
-                self.list_of_all_enemies[i].respawn_id = (
-                    "d",
-                    len(self.hashmap_of_enemies["Dragon"]),
-                )
 
-    def add(self, respawn_id):
+    def add(self, enemy):
         # Add the respawn ID to the list of dead enemies
-        self.list_of_dead_enemies.append(respawn_id)
+        self.list_of_dead_enemies.append(enemy.respawn_id)
+
+    def occupied(self, respawn_id):
+        # Whether the player or an enemy stands on the tile of a respawn point, looked
+        # up in the spatial hash of the sprites
+        index, column, row = respawn_id
+        rect = pygame.Rect(column * TILESIZE, row * TILESIZE, TILESIZE, TILESIZE)
+        self.game.all_sprites.place()
+        return any(
+            sprite is self.game.player or sprite in self.game.enemies
+            for sprite in self.game.all_sprites.index.overlapping(rect)
+        )
 
     def update(self):
         # Spawns dead enemies when the respawn time is reached
         if self.current == 0:
             # Checks if there are any dead enemies
             if self.list_of_dead_enemies:
+                waiting = []
+
+                for respawn_id in self.list_of_dead_enemies:
+                    if ENEMY_SEPARATION and self.occupied(respawn_id):
+                        waiting.append(respawn_id)
+                        continue
+                    index, column, row = respawn_id
+                    archetype = self.game.level.enemies[index]
+                    args = archetype.get("respawn", archetype["args"])
+                    if args is None:
+                        continue
+                    # Spawns the dead enemy where it was first placed, it is
+                    # only created once the player comes near
+                    self.game.stream.add(
+                        self.enemy_types[archetype["class"]],
+                        column,
+                        row,
+                        *args,
+                        respawn_id=respawn_id,
+                    )
 
-                for i in range(len(self.list_of_dead_enemies)):
-
-                    for j in range(len(self.list_of_all_enemies)):
-                        # Checks if the dead enemy's respawn ID matches the enemy's respawn ID
-                        if (
-                            self.list_of_dead_enemies[i][0]
-                            == self.list_of_all_enemies[j].respawn_id[0]
-                            and self.list_of_dead_enemies[i][1]
-                            == self.list_of_all_enemies[j].respawn_id[1]
-                        ):
-                            # Spawns the dead enemy relative to the player's position
-                            if self.list_of_dead_enemies[i][0] == "e":
-
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Grey Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Grey Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_1/grey_mouse_child.png",
-                                    "images/enemies/level_1/grey_mouse_child_attack.png",
-                                    "Grey Mouse",
-                                    2,
-                                    10,
-                                    2,
-                                    1.35,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "a":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Brown Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Brown Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_1/brown_mouse_assassin.png",
-                                    "images/enemies/level_1/brown_mouse_assassin_attack.png",
-                                    "Brown Mouse",
-                                    6,
-                                    20,
-                                    5,
-                                    2,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "s":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["White Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["White Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_1/white_mouse_spearman.png",
-                                    "images/enemies/level_1/white_mouse_spearman_attack.png",
-                                    "White Mouse",
-                                    15,
-                                    30,
-                                    10,
-                                    2.25,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "m":
-                                Boss(
-                                    self.game,
-                                    self.hashmap_of_enemies["Boss Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Boss Mouse"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_1/mouse_boss.png",
-                                    "images/enemies/level_1/mouse_boss_attack.png",
-                                    "images/enemies/level_1/mouse_boss_boss_attack.png",
-                                    "Boss Mouse",
-                                    25,
-                                    200,
-                                    100,
-                                    2.5,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "b":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Desert Boarman"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Desert Boarman"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_2/desert_boarman.png",
-                                    "images/enemies/level_2/desert_boarman_attack.png",
-                                    "Desert Boarman",
-                                    25,
-                                    225,
-                                    75,
-                                    2.25,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "w":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Desert Wolf"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Desert Wolf"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_2/desert_wolf.png",
-                                    "images/enemies/level_2/desert_wolf_attack.png",
-                                    "Desert Wolf",
-                                    35,
-                                    250,
-                                    100,
-                                    2.75,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "W":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Desert Wartotaur"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Desert Wartotaur"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_2/desert_wartotaur.png",
-                                    "images/enemies/level_2/desert_wartotaur_attack.png",
-                                    "Desert Wartotaur",
-                                    55,
-                                    500,
-                                    250,
-                                    2.5,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "M":
-                                Boss(
-                                    self.game,
-                                    self.hashmap_of_enemies["Desert Boss"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Desert Boss"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_2/desert_minotaur_boss.png",
-                                    "images/enemies/level_2/skull.png",
-                                    "images/enemies/level_2/desert_minotaur_boss_attack.png",
-                                    "Desert Boss",
-                                    40,
-                                    2500,
-                                    1000,
-                                    3.0,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "i":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Burnt Imp"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Burnt Imp"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_3/burnt_imp.png",
-                                    "images/enemies/level_3/burnt_imp_attack.png",
-                                    "Burnt Imp",
-                                    75,
-                                    750,
-                                    375,
-                                    3.0,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "u":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Burnt Succubus"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Burnt Succubus"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_3/burnt_succubus.png",
-                                    "images/enemies/level_3/burnt_succubus_attack.png",
-                                    "Burnt Succubus",
-                                    100,
-                                    1500,
-                                    750,
-                                    3.25,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                            elif self.list_of_dead_enemies[i][0] == "f":
-                                Enemy(
-                                    self.game,
-                                    self.hashmap_of_enemies["Burnt Fallen Angel"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][0]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[0]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    self.hashmap_of_enemies["Burnt Fallen Angel"][
-                                        self.list_of_all_enemies[j].respawn_id[1] - 1
-                                    ][1]
-                                    + (
-                                        self.game.player.absolute_sprite_moved_value[1]
-                                        / 69268
-                                        // 16
-                                    ),
-                                    "images/enemies/level_3/burnt_fallen_angel.png",
-                                    "images/enemies/level_3/burnt_fallen_angel_attack.png",
-                                    "Burnt Fallen Angel",
-                                    150,
-                                    3500,
-                                    1500,
-                                    3.5,
-                                    respawn_id=self.list_of_dead_enemies[i],
-                                )
-                
-                self.list_of_dead_enemies = []  # Reset the list
+                # Reset the list, keeping the enemies whose respawn point is taken
+                self.list_of_dead_enemies = waiting
                 self.current = self.respawn_time  # Reset the timer
         else:
             # Decrement the timer
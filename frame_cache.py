@@ -0,0 +1,226 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import time
+import pygame
+
+# Where the decoded frames are kept between launches
+FRAME_CACHE_DIRECTORY = "cache/frames"
+# Bump when the way frames are cut or scaled changes, so old caches are rebuilt
+FRAME_CACHE_VERSION = 1
+
+
+class Frame_cache:
+    """
+    A persistent cache of frames that were already cut and scaled.
+
+    Every entry is the result of a frame builder (for example the animations of an
+    enemy archetype) and is stored in its own file as raw BGRA pixels behind a small
+    JSON header. On a warm start the file is memory-mapped and every frame is made
+    with pygame.image.frombuffer, so neither the PNG decoding nor the cutting and
+    scaling run again. The spritesheets a builder cut its frames from are recorded on
+    the way, and the entry is rebuilt as soon as the content of one of them changes.
+
+    Attributes:
+        enabled (bool): Whether builders should go through the cache.
+        directory (str): The directory of the cache files.
+        sources (set): The spritesheets used by the builder running right now, or None.
+        digests (dict): A dictionary mapping file paths to the hash of their content.
+        hits (int): The number of entries loaded from disk.
+        misses (int): The number of entries that had to be built.
+        stale (int): The number of entries rebuilt because a source changed.
+        load_time (float): The time in seconds spent loading entries from disk.
+        build_time (float): The time in seconds spent building missing entries.
+
+    Methods:
+        get(key, build): Returns the frames of an entry, building and storing them if needed.
+        record(file): Records a spritesheet used by the running builder.
+        digest(path): Returns the hash of the content of a file.
+        load(path): Loads an entry and its sources, or returns None if it is missing or stale.
+        store(path, frames, sources): Writes an entry.
+        stats(): Returns the hit/miss counters and timings.
+    """
+
+    enabled = True
+    directory = FRAME_CACHE_DIRECTORY
+    sources = None
+    digests = {}
+    hits = 0
+    misses = 0
+    stale = 0
+    load_time = 0.0
+    build_time = 0.0
+
+    @classmethod
+    def get(cls, key, build):
+        """
+        Returns the frames of an entry, building and storing them if needed.
+
+        Args:
+            key (tuple): The name of the entry, like ("Animation_bank", "Dragon").
+            build (callable): Builds the frames, as a dictionary mapping names to a
+                Surface or a tuple of Surfaces.
+
+        Returns:
+            dict: The frames of the entry.
+        """
+        if not cls.enabled:
+            return build()
+        name = re.sub(r"[^A-Za-z0-9]+", "_", "-".join(str(part) for part in key))
+        path = os.path.join(cls.directory, name + ".bin")
+
+        start = time.perf_counter()
+        loaded = cls.load(path)
+        if loaded is not None:
+            frames, sources = loaded
+            cls.hits += 1
+            cls.load_time += time.perf_counter() - start
+            # A builder using this entry depends on its spritesheets as well
+            if cls.sources is not None:
+                cls.sources.update(sources)
+            return frames
+
+        cls.misses += 1
+        start = time.perf_counter()
+        outer, cls.sources = cls.sources, set()
+        try:
+            frames = build()
+            sources = cls.sources
+        finally:
+            cls.sources = outer
+        if outer is not None:
+            outer.update(sources)
+        cls.store(path, frames, sources)
+        cls.build_time += time.perf_counter() - start
+        return frames
+
+    @classmethod
+    def record(cls, file):
+        if cls.sources is not None:
+            cls.sources.add(file)
+
+    @classmethod
+    def digest(cls, path):
+        digest = cls.digests.get(path)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = hashlib.sha1(file.read()).hexdigest()
+            cls.digests[path] = digest
+        return digest
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            (header_size,) = struct.unpack_from("<I", buffer)
+            header = json.loads(buffer[4 : 4 + header_size])
+            if header["version"] != FRAME_CACHE_VERSION or any(
+                not os.path.exists(source) or cls.digest(source) != digest
+                for source, digest in header["sources"].items()
+            ):
+                cls.stale += 1
+                return None
+
+            pixels = memoryview(buffer)[4 + header_size :]
+            frames = {}
+            for name, entries in header["frames"].items():
+                surfaces = []
+                for offset, width, height, colorkey in entries:
+                    size = width * height * 4
+                    # A truncated file is missing the pixels of its last frames
+                    if offset < 0 or offset + size > len(pixels):
+                        return None
+                    surface = pygame.image.frombuffer(
+                        pixels[offset : offset + size], (width, height), "BGRA"
+                    ).convert()
+                    if colorkey is not None:
+                        surface.set_colorkey(colorkey)
+                    surfaces.append(surface)
+                frames[name] = (
+                    tuple(surfaces) if header["tuples"][name] else surfaces[0]
+                )
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            IndexError,
+            TypeError,
+            struct.error,
+            pygame.error,
+        ):
+            # An unreadable entry is simply built again
+            return None
+        return frames, set(header["sources"])
+
+    @classmethod
+    def store(cls, path, frames, sources):
+        header = {
+            "version": FRAME_CACHE_VERSION,
+            "sources": {source: cls.digest(source) for source in sorted(sources)},
+            "frames": {},
+            "tuples": {},
+        }
+        pixels = []
+        offset = 0
+        for name, surfaces in frames.items():
+            header["tuples"][name] = isinstance(surfaces, (tuple, list))
+            if not header["tuples"][name]:
+                surfaces = (surfaces,)
+            header["frames"][name] = []
+            for surface in surfaces:
+                colorkey = surface.get_colorkey()
+                header["frames"][name].append(
+                    [
+                        offset,
+                        surface.get_width(),
+                        surface.get_height(),
+                        list(colorkey) if colorkey else None,
+                    ]
+                )
+                data = pygame.image.tobytes(surface, "BGRA")
+                pixels.append(data)
+                offset += len(data)
+
+        encoded = json.dumps(header, separators=(",", ":")).encode()
+        os.makedirs(cls.directory, exist_ok=True)
+        # Write to a temporary file first, a half written entry must never be read
+        with open(path + ".tmp", "wb") as file:
+            file.write(struct.pack("<I", len(encoded)))
+            file.write(encoded)
+            for data in pixels:
+                file.write(data)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def stats(cls):
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "stale": cls.stale,
+            "load_time": round(cls.load_time, 3),
+            "build_time": round(cls.build_time, 3),
+        }
+
+
+if __name__ == "__main__":
+    # Fills the cache (or reads it back on a second run) and reports how long it took
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from atlas import request_every_frame
+
+    # The game uses the module's class, not the copy running as __main__
+    from frame_cache import Frame_cache
+
+    request_every_frame()
+    stats = Frame_cache.stats()
+    print(
+        f"{stats['hits']} entries loaded in {stats['load_time']}s, "
+        f"{stats['misses']} built in {stats['build_time']}s "
+        f"({stats['stale']} stale) in {FRAME_CACHE_DIRECTORY}"
+    )
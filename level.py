@@ -0,0 +1,321 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+import pygame
+from config import *
+from world import Collision_map
+
+# Where the compiled levels are kept, one file per tilemap and legend
+LEVEL_DIRECTORY = "cache/levels"
+# The meaning of the characters of the tilemaps
+LEVEL_LEGEND = "levels/legend.json"
+# Bump when the level format or the way levels are compiled changes
+LEVEL_VERSION = 3
+# The seed of the hash the terrain variants are picked with
+LEVEL_SEED = 0
+LEVEL_MAGIC = b"PXLV"
+# Enemy index, column and row of every enemy placed on the map
+SPAWN_FORMAT = "<HHH"
+
+
+class Level:
+    """
+    A compiled level, memory-mapped from its binary file.
+
+    The ASCII tilemap and its legend are compiled once into a file holding everything
+    the world is built from: the terrain layers (the kind of tile painted on every
+    cell, layer after layer), the collision grid, the zone of every tile, the variant
+    map, the table of enemies placed on the map and the seed of the variant map.
+    The file is a small JSON header (the tile kinds, the enemy archetypes and the
+    offsets of the arrays) followed by the raw arrays. Loading it maps the file and
+    hands out views of the arrays, so building the world only walks arrays and looks
+    tile kinds up by index, however many characters the legend has.
+
+    Attributes:
+        path (str): The path of the level file.
+        columns (int): The number of columns of the map.
+        rows (int): The number of rows of the map.
+        layers (int): The number of terrain layers.
+        seed (int): The seed the terrain variants were picked with.
+        kinds (list): The tile kinds, as dictionaries with the type ("Block" or
+            "Ground"), sheet, rect, colorkey and size of the tile.
+        enemies (list): The enemy archetypes, as dictionaries with the class name and
+            the arguments following the position.
+        terrain (memoryview): The kind of every cell plus one (0 for none), layer after
+            layer and row after row.
+        collision (memoryview): The Collision_map state of every tile.
+        zones (memoryview): The zone of every tile.
+        variants (memoryview): The variant hash of every tile, see variant().
+        spawns (memoryview): The enemies placed on the map, in SPAWN_FORMAT.
+        shapes (dict): A dictionary mapping partially blocked tiles to their blocks.
+        load_time (float): The time in seconds spent loading the file.
+
+    Methods:
+        get(tilemap, legend_path, directory, seed): Returns the compiled level of a
+            tilemap, compiling it first if needed.
+        compile(tilemap, legend, path, seed): Compiles a tilemap into a level file.
+        bounds(area, columns, rows): Returns the columns and rows an area of the
+            legend covers.
+        variant(column, row, seed): Returns the variant hash of a tile.
+        tiles(layer, row): Returns the kinds of the cells of a row on a layer.
+        stats(): Returns the size of the map and of the file and the load time.
+    """
+
+    def __init__(self, path):
+        start = time.perf_counter()
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = struct.unpack_from("<4sI", self.buffer)
+        if magic != LEVEL_MAGIC:
+            raise ValueError(f"{path} is not a level file")
+        header = json.loads(self.buffer[8 : 8 + header_size])
+        if header["version"] != LEVEL_VERSION:
+            raise ValueError(f"{path} was compiled by another version")
+
+        self.columns = header["columns"]
+        self.rows = header["rows"]
+        self.layers = header["layers"]
+        self.seed = header["seed"]
+        self.kinds = header["kinds"]
+        self.enemies = header["enemies"]
+        data = memoryview(self.buffer)[8 + header_size :]
+        arrays = {}
+        for name, (offset, size) in header["arrays"].items():
+            arrays[name] = data[offset : offset + size]
+        self.terrain = arrays["terrain"]
+        self.collision = arrays["collision"]
+        self.zones = arrays["zones"]
+        self.variants = arrays["variants"]
+        self.spawns = arrays["spawns"]
+        # Blocks spanning several tiles are shared by them, like in Collision_map.add
+        rects = [pygame.Rect(rect) for rect in header["shapes"]["rects"]]
+        self.shapes = {
+            (column, row): [rects[index] for index in indices]
+            for column, row, indices in header["shapes"]["tiles"]
+        }
+        self.load_time = time.perf_counter() - start
+
+    @classmethod
+    def get(
+        cls,
+        tilemap,
+        legend_path=LEVEL_LEGEND,
+        directory=LEVEL_DIRECTORY,
+        seed=LEVEL_SEED,
+    ):
+        with open(legend_path, "rb") as file:
+            legend = file.read()
+        # The file is named after what it was compiled from, so it is never stale
+        digest = hashlib.sha1(
+            b"\n".join(
+                [str(LEVEL_VERSION).encode(), str(seed).encode(), legend]
+                + [row.encode() for row in tilemap]
+            )
+        ).hexdigest()
+        path = os.path.join(directory, digest + ".level")
+        if os.path.exists(path):
+            try:
+                return cls(path)
+            except (OSError, ValueError, KeyError, struct.error):
+                # An unreadable level is simply compiled again
+                pass
+        cls.compile(tilemap, json.loads(legend), path, seed)
+        return cls(path)
+
+    @staticmethod
+    def compile(tilemap, legend, path, seed=LEVEL_SEED):
+        """
+        Compiles a tilemap into a level file.
+
+        Args:
+            tilemap (list): The rows of the map, one character per tile.
+            legend (dict): The legend, like levels/legend.json.
+            path (str): The path of the level file.
+            seed (int): The seed the terrain variants are picked with.
+        """
+        rows = len(tilemap)
+        columns = max(len(row) for row in tilemap)
+        # Tiles with variants use the one picked by the hash of their position, so
+        # the terrain only depends on the seed, not on the order tiles are compiled in
+        variants = bytes(
+            Level.variant(column, row, seed) & 0xFF
+            for row in range(rows)
+            for column in range(columns)
+        )
+        enemies = list(legend["enemies"])
+        kinds = []
+        kind_ids = {}
+
+        def resolve(entry):
+            # A tile kind id, ("enemy", index) or a list of variants
+            if "variants" in entry:
+                return [resolve(variant) for variant in entry["variants"]]
+            if "enemy" in entry:
+                return ("enemy", enemies.index(entry["enemy"]))
+            kind = dict(entry, sheet=legend["sheets"][entry["sheet"]])
+            key = json.dumps(kind, sort_keys=True)
+            if key not in kind_ids:
+                kind_ids[key] = len(kinds)
+                kinds.append(kind)
+            return kind_ids[key]
+
+        layers = []
+        depths = bytearray(rows * columns)
+        spawns = []
+        collision = Collision_map(columns, rows)
+        # The regions are applied one after the other, so the tiles of a cell are
+        # still layered in the order of the legend
+        for region in legend["regions"]:
+            base = [resolve(entry) for entry in region["base"]]
+            entries = {
+                character: base + [resolve(entry) for entry in tiles]
+                for character, tiles in region["tiles"].items()
+            }
+            first_column, last_column, first_row, last_row = Level.bounds(
+                region, columns, rows
+            )
+            for row in range(first_row, last_row):
+                line = tilemap[row]
+                for column in range(first_column, min(last_column, len(line))):
+                    cell = row * columns + column
+                    for item in entries.get(line[column], base):
+                        if isinstance(item, list):
+                            item = item[variants[cell] % len(item)]
+                        if isinstance(item, tuple):
+                            spawns.append((item[1], column, row))
+                            continue
+                        if depths[cell] == len(layers):
+                            layers.append(bytearray(rows * columns))
+                        # A byte per cell and layer, 0 is kept for empty cells
+                        layers[depths[cell]][cell] = item + 1
+                        depths[cell] += 1
+                        if kinds[item]["type"] == "Block":
+                            collision.add(
+                                (
+                                    column * TILESIZE,
+                                    row * TILESIZE,
+                                    *kinds[item]["size"],
+                                )
+                            )
+        if len(kinds) > 255:
+            raise ValueError("A level can not use more than 255 tile kinds")
+        # Enemies are created in the order they are read, row after row
+        spawns.sort(key=lambda spawn: (spawn[2], spawn[1]))
+
+        # The zone of a tile is the one of the last area of the legend covering it
+        zones = bytearray(rows * columns)
+        for area in legend["zones"]:
+            zone = bytes([ZONES.index(area["zone"])])
+            first_column, last_column, first_row, last_row = Level.bounds(
+                area, columns, rows
+            )
+            for row in range(first_row, last_row):
+                start = row * columns
+                zones[start + first_column : start + last_column] = zone * (
+                    last_column - first_column
+                )
+
+        rects = []
+        indices = {}
+        tiles = []
+        for (column, row), shapes in collision.shapes.items():
+            for shape in shapes:
+                if id(shape) not in indices:
+                    indices[id(shape)] = len(rects)
+                    rects.append(list(shape))
+            tiles.append([column, row, [indices[id(shape)] for shape in shapes]])
+        arrays = {
+            "terrain": b"".join(layers),
+            "collision": bytes(collision.cells),
+            "zones": bytes(zones),
+            "variants": variants,
+            "spawns": b"".join(struct.pack(SPAWN_FORMAT, *spawn) for spawn in spawns),
+        }
+
+        header = {
+            "version": LEVEL_VERSION,
+            "columns": columns,
+            "rows": rows,
+            "layers": len(layers),
+            "seed": seed,
+            "kinds": kinds,
+            "enemies": [legend["enemies"][name] for name in enemies],
+            "shapes": {"rects": rects, "tiles": tiles},
+            "arrays": {},
+        }
+        offset = 0
+        for name, data in arrays.items():
+            header["arrays"][name] = [offset, len(data)]
+            offset += len(data)
+
+        encoded = json.dumps(header, separators=(",", ":")).encode()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, a half written level must never be read
+        with open(path + ".tmp", "wb") as file:
+            file.write(struct.pack("<4sI", LEVEL_MAGIC, len(encoded)))
+            file.write(encoded)
+            for data in arrays.values():
+                file.write(data)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def bounds(area, columns, rows):
+        # The first and last (excluded) column and row of an area of the legend, an
+        # open bound reaches the edge of the map
+        first_column, last_column = area["columns"]
+        first_row, last_row = area["rows"]
+        return (
+            min(first_column, columns),
+            columns if last_column is None else min(last_column, columns),
+            min(first_row, rows),
+            rows if last_row is None else min(last_row, rows),
+        )
+
+    @staticmethod
+    def variant(column, row, seed=LEVEL_SEED):
+        # A 32 bit integer hash (murmur3's finalizer) of the position and the seed,
+        # made of integer operations only so it can be computed for whole grids at once
+        value = (
+            column * 0x9E3779B1 + row * 0x85EBCA77 + seed * 0xC2B2AE3D
+        ) & 0xFFFFFFFF
+        value ^= value >> 16
+        value = (value * 0x85EBCA6B) & 0xFFFFFFFF
+        value ^= value >> 13
+        value = (value * 0xC2B2AE35) & 0xFFFFFFFF
+        value ^= value >> 16
+        return value
+
+    def tiles(self, layer, row):
+        start = (layer * self.rows + row) * self.columns
+        return self.terrain[start : start + self.columns]
+
+    def stats(self):
+        return {
+            "columns": self.columns,
+            "rows": self.rows,
+            "layers": self.layers,
+            "kinds": len(self.kinds),
+            "enemies": len(self.spawns) // struct.calcsize(SPAWN_FORMAT),
+            "KB": round(len(self.buffer) / 1024, 1),
+            "load_time": round(self.load_time, 4),
+        }
+
+
+if __name__ == "__main__":
+    # Compiles the map of config.py again and reports how long it takes to load
+    start = time.perf_counter()
+    with open(LEVEL_LEGEND) as file:
+        legend = json.load(file)
+    path = os.path.join(LEVEL_DIRECTORY, "benchmark.level")
+    Level.compile(tilemap, legend, path)
+    compile_time = time.perf_counter() - start
+    stats = Level(path).stats()
+    print(
+        f"Compiled {stats['columns']}x{stats['rows']} tiles ({stats['layers']} layers, "
+        f"{stats['kinds']} tile kinds, {stats['enemies']} enemies, {stats['KB']} KB) "
+        f"in {compile_time:.3f}s, loaded in {stats['load_time'] * 1000:.2f} ms"
+    )
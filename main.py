@@ -1,10 +1,18 @@
 import pygame
 import os
 import sys
+import time
 from config import *
 from entities import *
-from text import Text
-import random
+from text import Text, Font_manager
+from assets import Asset_loader, image_files
+from atlas import Atlas, ATLAS_DIRECTORY
+from camera import Camera, Culled_group
+from world import Zone_map, Collision_map, Chunk_map, Entity_stream, Enemy_activation
+from level import Level, LEVEL_LEGEND, SPAWN_FORMAT
+from simulation import Enemy_simulation
+from projectiles import Projectile_pool
+import struct
 
 # Setting the position of the window to left top corner
 os.environ["SDL_VIDEO_WINDOW_POS"] = "%d, %d" % (0, 30)
@@ -15,596 +23,176 @@ flags = pygame.FULLSCREEN | pygame.DOUBLEBUF
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, show_intro=True, tilemap=tilemap, legend=LEVEL_LEGEND):
 
         pygame.init()
         pygame.mixer.init()
         self.music = Music()
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font("font/pixel_font.ttf", 50)
+        self.font = Font_manager.get(50)
         self.win = 0
         self.window_open = 1
         self.active_game = 0
         self.paused_game = 0
+        self.starting = 0
 
         self.buttons = [
             Text("START", AZURE, 400, 100, self.font),
             Text("EXIT", DARK_GREY, 400, 200, self.font),
         ]
 
+        self.character_spritesheet = Spritesheet_registry.get(
+            "images/player/player.png"
+        )
+        self.terrain_spritesheet = Spritesheet_registry.get(
+            "images/terrain/terrain.png"
+        )
+        self.attack_spritesheet = Spritesheet_registry.get("images/missles/spikes.png")
+        self.ultimate_attack_spritesheet = Spritesheet_registry.get(
+            "images/missles/tornado.png"
+        )
+        self.skull_spritesheet = Spritesheet_registry.get(
+            "images/enemies/level_2/skull.png"
+        )
+        # The map and its legend, other maps (like the ones of mapgen.py) can be played
+        self.tilemap = tilemap
+        self.legend = legend
+        # Loads the assets and builds the world step by step, see load()
+        self.loading = self.load()
+        self.loading_progress = 0
+
         pygame.mouse.set_visible(False)
-        self.intro_screen()
+        if show_intro:
+            self.intro_screen()
+        else:
+            # Used by the asset tools to build the world without the menu
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+            self.load_cursor()
         self.FPS = Show_FPS(
             self,
             pygame.time.Clock.get_fps(self.clock),
             WHITE,
             WIDTH - WIDTH * 0.05,
             HEIGHT * 0.05,
-            pygame.font.Font("font/pixel_font.ttf", 30),
+            Font_manager.get(30),
         )
         self.shoot_cooldown_count = 0
         self.max_cooldown = 50
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
-        self.character_spritesheet = Spritesheet("images/player/player.png")
-        self.terrain_spritesheet = Spritesheet("images/terrain/terrain.png")
-        self.attack_spritesheet = Spritesheet("images/missles/spikes.png")
-        self.ultimate_attack_spritesheet = Spritesheet("images/missles/tornado.png")
-        self.skull_spritesheet = Spritesheet("images/enemies/level_2/skull.png")
         self.mana_cost = 10
 
     def create_tilemap(self):
+        """
+        Builds the world from the compiled level, one row at a time.
 
+        The meaning of every character of the map is in levels/legend.json.
+
+        Yields:
+            int: The number of rows built so far.
+        """
         self.health_bar = Health_bar(self, 10, 10, 300, 30, 10, "red", "green")
         self.mana_bar = Bar(self, 10, 60, 300, 30, 10, "grey", LIGHTBLUE)
         self.experience_bar = Exp_bar(self, 10, 105, 300, 30, 10, "grey", "yellow")
-        """
-        1 level:
-        B - BLock
-        P - Player
-        O - Object(Tree, water sticks etc.)
-        D - Decorations
-        A - Water
-        T - Trail
-        Enemies:
-        e - Grey Mouse
-        a - Brown Mouse
-        s - White Mouse
-        b - Boss Mouse
-        2 level:
-        T- Trail
-        r - Small Rock
-        R - Big Rock
-        Enemies:
-        b - Desert Boarman
-        w - Desert Wolf
-        W - Desert Wartotaur
-        M - Desert Minotaur Boss
-        3 level:
-        T- Trail
-        s - Skull
-        H - Hole
-        L - Lava
-        Enemies:
-        i - Burnt Imp
-        u - Burnt Succubus
-        f - Burnt Fallen Angel
-        4 level:
-        T- Trail
-        s - Skull
-        Enemies:
-        E - Dragon
-        """
-        for i, row in enumerate(tilemap):
-            for j, column in enumerate(row):
-
-                random_terrain = random.randint(0, 2)
-                if column == "B":
-                    Block(
-                        self,
-                        j,
-                        i,
-                        (
-                            self.terrain_spritesheet.get_sprite(
-                                994, 643, 25, 64, WHITE
-                            ),
-                            (64, 64),
-                        ),
-                    )
-                    # 288 575
-
-                if i < 48 and j < 100:
-
-                    if random_terrain == 1:
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    64, 352, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif random_terrain == 2:
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    96, 352, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-
-                    else:
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    1, 352, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
 
-                    if column == "T":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    27, 89, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif column == "O":
-                        Block(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    43, 832, 64, 64, BLACK
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    if column == "D":
-                        Block(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    96, 202, 32, 54, WHITE
-                                ),
-                                (32, 64),
-                            ),
-                        )
-                    elif column == "e":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_1/grey_mouse_child.png",
-                            "images/enemies/level_1/grey_mouse_child_attack.png",
-                            "Grey Mouse",
-                            2,
-                            10,
-                            2,
-                            1.35,
-                        )
-                    elif column == "a":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_1/brown_mouse_assassin.png",
-                            "images/enemies/level_1/brown_mouse_assassin_attack.png",
-                            "Brown Mouse",
-                            6,
-                            20,
-                            5,
-                            2,
-                        )
-                    elif column == "s":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_1/white_mouse_spearman.png",
-                            "images/enemies/level_1/white_mouse_spearman_attack.png",
-                            "White Mouse",
-                            15,
-                            50,
-                            30,
-                            2.25,
-                        )
-                    elif column == "b":
-                        Boss(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_1/mouse_boss.png",
-                            "images/enemies/level_1/mouse_boss_attack.png",
-                            "images/enemies/level_1/mouse_boss_boss_attack.png",
-                            "Boss Mouse",
-                            25,
-                            200,
-                            100,
-                            2.5,
-                        )
-
-                    elif column == "A":
-                        Block(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    891, 90, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-
-                elif i >= 48 and i < 71 and j < 99:
-                    Ground(
-                        self,
-                        j,
-                        i,
-                        (
-                            self.terrain_spritesheet.get_sprite(
-                                576 + 32 * random.randint(0, 2), 352, 32, 32, WHITE
-                            ),
-                            (64, 64),
-                        ),
-                    )
-                    if column == "b":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_2/desert_boarman.png",
-                            "images/enemies/level_2/desert_boarman_attack.png",
-                            "Desert Boarman",
-                            25,
-                            225,
-                            75,
-                            2.25,
-                        )
-                    elif column == "w":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_2/desert_wolf.png",
-                            "images/enemies/level_2/desert_wolf_attack.png",
-                            "Desert Wolf",
-                            35,
-                            250,
-                            125,
-                            2.75,
-                        )
-                    elif column == "W":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_2/desert_wartotaur.png",
-                            "images/enemies/level_2/desert_wartotaur_attack.png",
-                            "Desert Wartotaur",
-                            55,
-                            500,
-                            250,
-                            2.5,
-                        )
-                    elif column == "M":
-                        Boss(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_2/desert_minotaur_boss.png",
-                            "images/enemies/level_2/skull.png",
-                            "images/enemies/level_2/desert_minotaur_boss_attack.png",
-                            "Desert Boss",
-                            40,
-                            2500,
-                            1000,
-                            3.0,
-                        )
-                    elif column == "T":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    120, 86, 50, 50, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
+        level = self.level
+        tile_types = {"Block": Block, "Ground": Ground}
+        # Every kind of tile (like each of the grass variants) is cut and scaled once,
+        # all the tiles of a kind share its surface
+        kinds = [
+            (
+                tile_types[kind["type"]],
+                Tile_registry.get(
+                    kind["sheet"], kind["rect"], kind["colorkey"], kind["size"]
+                ),
+            )
+            for kind in level.kinds
+        ]
+        for row in range(level.rows):
+            # Let the caller do other work (like drawing the menu) between rows
+            yield row
+            for layer in range(level.layers):
+                for column, kind in enumerate(level.tiles(layer, row)):
+                    if kind:
+                        tile_type, image = kinds[kind - 1]
+                        tile_type(self, column, row, image)
+
+        for enemy, column, row in struct.iter_unpack(SPAWN_FORMAT, level.spawns):
+            archetype = level.enemies[enemy]
+            # The spawner brings the enemy back on this tile (see Spawner)
+            self.stream.add(
+                Spawner.enemy_types[archetype["class"]],
+                column,
+                row,
+                *archetype["args"],
+                respawn_id=(enemy, column, row),
+            )
 
-                    elif column == "r":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    0, 0, 32, 64, WHITE
-                                ),
-                                (32, 64),
-                            ),
-                        )
-                    elif column == "R":
-                        r = random.randint(1, 3)
-                        if r == 1:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        768, 624, 64, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                        elif r == 2:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        832, 624, 64, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                        elif r == 3:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        897, 624, 30, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                    elif column == "s":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.skull_spritesheet.get_sprite(
-                                    0, 128, 64, 64, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
+        self.player = Player(self, WIDTH // 128, HEIGHT // 128)
+        self.spawner = Spawner(self)
+        # Creates the enemies around the player
+        self.stream.update(self.player.rect.center)
 
-                elif i >= 71 and j < 99:
-
-                    # Base
-                    Ground(
-                        self,
-                        j,
-                        i,
-                        (
-                            self.terrain_spritesheet.get_sprite(
-                                288 + 32 * random.randint(0, 2), 160, 32, 32, WHITE
-                            ),
-                            (64, 64),
-                        ),
-                    )
+    def load(self):
+        """
+        Loads the assets and builds the world, one small step at a time.
 
-                    # Enemies
-                    if column == "i":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_3/burnt_imp.png",
-                            "images/enemies/level_3/burnt_imp_attack.png",
-                            "Burnt Imp",
-                            75,
-                            750,
-                            375,
-                            3.0,
-                        )
-                    elif column == "u":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_3/burnt_succubus.png",
-                            "images/enemies/level_3/burnt_succubus_attack.png",
-                            "Burnt Succubus",
-                            100,
-                            1500,
-                            750,
-                            3.25,
-                        )
-                    elif column == "f":
-                        Enemy(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_3/burnt_fallen_angel.png",
-                            "images/enemies/level_3/burnt_fallen_angel_attack.png",
-                            "Burnt Fallen Angel",
-                            150,
-                            3500,
-                            1500,
-                            3.5,
-                        )
+        The images and sounds are decoded on a worker thread, then the decoded images
+        are converted and the compiled level is built row by row. The intro screen
+        advances this generator between two frames of the menu and new() finishes
+        whatever is left, so the game starts without a long freeze.
 
-                    # Blocks and decorations
-                    elif column == "H":
-
-                        Block(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    512, 0, 64, 64, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif column == "L":
-                        Block(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    480 + 32 * random.randint(0, 2), 160, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif column == "T":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    416 + 32 * random.randint(0, 1), 160, 32, 32, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif column == "R":
-                        r = random.randint(1, 3)
-                        if r == 1:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        768, 690, 64, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                        elif r == 2:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        832, 690, 64, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                        elif r == 3:
-                            Block(
-                                self,
-                                j,
-                                i,
-                                (
-                                    self.terrain_spritesheet.get_sprite(
-                                        897, 690, 30, 50, WHITE
-                                    ),
-                                    (64, 64),
-                                ),
-                            )
-                    elif column == "s":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.skull_spritesheet.get_sprite(
-                                    0, 128, 64, 64, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                if i > 45 and j > 98:
-
-                    Ground(
-                        self,
-                        j,
-                        i,
-                        (
-                            self.terrain_spritesheet.get_sprite(
-                                96 + 32 * random.randint(0, 2), 544, 32, 32, WHITE
-                            ),
-                            (64, 64),
-                        ),
-                    )
-                    if column == "S":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.terrain_spritesheet.get_sprite(
-                                    288, 575, 64, 64, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    elif column == "s":
-                        Ground(
-                            self,
-                            j,
-                            i,
-                            (
-                                self.skull_spritesheet.get_sprite(
-                                    0, 128, 64, 64, WHITE
-                                ),
-                                (64, 64),
-                            ),
-                        )
-                    # Final Boss
-                    elif column == "E":
-                        Last_boss(
-                            self,
-                            j,
-                            i,
-                            "images/enemies/level_4/dragon.png",
-                            "images/enemies/level_4/dragon_basic.png",
-                            "images/enemies/level_4/dragon_ultimate.png",
-                            "Dragon",
-                            300,
-                            9999,
-                            19999,
-                            7,
-                        )
+        Yields:
+            float: The fraction of the loading done so far.
+        """
+        # The player starts in the first zone, the far zones are loaded later
+        self.zones = Zone_assets(self)
+        # Spritesheets packed into the texture atlas never have to be opened
+        pages, sources = Atlas.files()
+        skip = set(sources) | {ATLAS_DIRECTORY} | self.zones.far_directories()
+        sounds = [
+            path
+            for name, path in self.music.sound_files.items()
+            if name not in self.zones.far_sounds()
+        ]
+        Asset_loader.start(pages + image_files(skip=skip), sounds)
+        self.level = Level.get(self.tilemap, self.legend)
+        steps = Asset_loader.total + self.level.rows
+        while not Asset_loader.done():
+            Asset_loader.finalize()
+            yield (Asset_loader.total - Asset_loader.pending) / steps
+
+        self.all_sprites = Culled_group()
+        self.enemies = pygame.sprite.LayeredUpdates()
+        self.text = pygame.sprite.LayeredUpdates()
+        self.camera = Camera()
+        self.zone_map = Zone_map(self.level.columns, self.level.rows, self.level.zones)
+        self.terrain = Chunk_map()
+        self.collision_map = Collision_map(
+            self.level.columns, self.level.rows, self.level.collision, self.level.shapes
+        )
+        self.stream = Entity_stream(self)
+        self.activation = Enemy_activation(self)
+        self.projectiles = Projectile_pool(self)
+        if ENEMY_SIMULATION:
+            self.simulation = Enemy_simulation(self)
+        else:
+            self.simulation = None
+        for rows_built in self.create_tilemap():
+            yield (Asset_loader.total + rows_built) / steps
+        yield 1
 
-        self.player = Player(self, WIDTH // 128, HEIGHT // 128)
-        self.spawner = Spawner(self)
+    def advance_loading(self, budget=LOADING_BUDGET):
+        # Loads for about budget seconds, the loading must not hold up the menu
+        start = time.perf_counter()
+        while self.loading_progress < 1 and time.perf_counter() - start < budget:
+            self.loading_progress = next(self.loading, 1)
 
     def new(self):
 
         self.active_game = 1
-        self.all_sprites = pygame.sprite.LayeredUpdates()
-        self.blocks = pygame.sprite.LayeredUpdates()
-        self.enemies = pygame.sprite.LayeredUpdates()
-        self.attacks = pygame.sprite.LayeredUpdates()
-        self.text = pygame.sprite.LayeredUpdates()
-        self.create_tilemap()
+        # Finish whatever the intro screen did not have time to load
+        for self.loading_progress in self.loading:
+            pass
 
     def events_game_over(self):
         """
@@ -660,6 +248,7 @@ class Game:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     self.music.play_sound("button_click")
                     self.player.basic_attack_level += 1
+                    self.player.prepare_attacks()
 
                     self.health_bar.remaining = self.health_bar.full
                     self.mana_bar.remaining = self.mana_bar.full
@@ -677,6 +266,7 @@ class Game:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     self.music.play_sound("button_click")
                     self.player.ultimate_attack_level += 1
+                    self.player.prepare_attacks()
 
                     self.mana_cost = int(self.mana_cost * 1.25)
                     self.health_bar.remaining = self.health_bar.full
@@ -698,6 +288,7 @@ class Game:
                     self.player.player_speed = (
                         PLAYER_SPEED + self.player.speed_level // 4
                     )
+                    self.player.prepare_attacks()
                     self.max_cooldown -= 2
                     self.health_bar.remaining = self.health_bar.full
                     self.mana_bar.remaining = self.mana_bar.full
@@ -763,7 +354,8 @@ class Game:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     self.music.play_sound("button_click")
                     pygame.mixer.music.stop()
-                    self.active_game = 1
+                    # The game starts as soon as the loading is done
+                    self.starting = 1
 
             else:
                 self.buttons[0].color = DARK_GREY
@@ -813,19 +405,19 @@ class Game:
                     self.shoot_cooldown_count += 1
                     if self.player.facing == "up":
 
-                        Attack(
+                        Attack.launch(
                             self, self.player.rect.x, self.player.rect.y - TILESIZE // 2
                         )
                     if self.player.facing == "down":
-                        Attack(
+                        Attack.launch(
                             self, self.player.rect.x, self.player.rect.y + TILESIZE // 2
                         )
                     if self.player.facing == "left":
-                        Attack(
+                        Attack.launch(
                             self, self.player.rect.x - TILESIZE // 2, self.player.rect.y
                         )
                     if self.player.facing == "right":
-                        Attack(
+                        Attack.launch(
                             self, self.player.rect.x + TILESIZE // 2, self.player.rect.y
                         )
 
@@ -837,19 +429,19 @@ class Game:
                     self.mana_bar.lose(self.mana_cost)
 
                     if self.player.facing == "up":
-                        Ultimate_attack(
+                        Ultimate_attack.launch(
                             self, self.player.rect.x, self.player.rect.y - TILESIZE
                         )
                     if self.player.facing == "down":
-                        Ultimate_attack(
+                        Ultimate_attack.launch(
                             self, self.player.rect.x, self.player.rect.y + TILESIZE
                         )
                     if self.player.facing == "left":
-                        Ultimate_attack(
+                        Ultimate_attack.launch(
                             self, self.player.rect.x - TILESIZE, self.player.rect.y
                         )
                     if self.player.facing == "right":
-                        Ultimate_attack(
+                        Ultimate_attack.launch(
                             self, self.player.rect.x + TILESIZE, self.player.rect.y
                         )
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -888,8 +480,14 @@ class Game:
     def update(self):
         # Update everything
         self.cooldown()
+        self.stream.update(self.player.rect.center)
+        self.activation.update()
         self.all_sprites.update()
-        self.attacks.update()
+        if self.simulation is not None:
+            self.simulation.update()
+        if ENEMY_SEPARATION:
+            Enemy.separate(self)
+        self.projectiles.update()
         self.health_bar.update()
         self.mana_bar.update()
         self.experience_bar.update()
@@ -901,8 +499,9 @@ class Game:
     def draw(self):
         # Draw everything
         self.screen.fill(LIGHTBLUE)
-        self.all_sprites.draw(self.screen)
-        self.attacks.draw(self.screen)
+        self.terrain.draw(self.screen, self.camera)
+        self.camera.draw(self.all_sprites, self.screen)
+        self.projectiles.draw(self.screen, self.camera)
         self.health_bar.draw(self.screen)
         self.mana_bar.draw(self.screen)
         self.experience_bar.draw(self.screen)
@@ -936,21 +535,21 @@ class Game:
                 DARK_GREY,
                 WIDTH // 2,
                 HEIGHT * 0.65,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Text(
                 "EXIT",
                 DARK_GREY,
                 WIDTH // 2,
                 HEIGHT * 0.85,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Text(
                 "GAME OVER",
                 RED,
                 WIDTH // 2,
                 HEIGHT * 0.3,
-                pygame.font.Font("font/pixel_font.ttf", 170),
+                Font_manager.get(170),
             ),
         ]
 
@@ -967,14 +566,15 @@ class Game:
             self.clock.tick(FPS)
             self.events_game_over()
 
+    def load_cursor(self):
+        self.cursor_spritesheet = Spritesheet_registry.get("images/cursor/cursor.jpg")
+        self.cursor = Cursor(self)
+
     def intro_screen(self):
         self.screen = pygame.display.set_mode((800, 400))
-        self.sky_surface = pygame.image.load("images/backgrounds/clouds.jpg").convert()
-        self.ground_surface = pygame.image.load(
-            "images/backgrounds/ground.png"
-        ).convert()
-        self.cursor_spritesheet = Spritesheet("images/cursor/cursor.jpg")
-        self.cursor = Cursor(self)
+        self.sky_surface = Asset_loader.load_image("images/backgrounds/clouds.jpg")
+        self.ground_surface = Asset_loader.load_image("images/backgrounds/ground.png")
+        self.load_cursor()
         sky_x_position = 600
 
         self.music.play_music("main_menu")
@@ -992,6 +592,14 @@ class Game:
             self.cursor.draw(self.screen)
             self.cursor.update()
             self.events_main_menu()
+            if self.starting:
+                # Load faster once the player is waiting, START shows the progress
+                self.advance_loading(LOADING_BUDGET * 4)
+                self.buttons[0].text = f"LOADING {int(self.loading_progress * 100)}%"
+                if self.loading_progress >= 1:
+                    self.active_game = 1
+            else:
+                self.advance_loading()
             pygame.display.update()
             self.clock.tick(FPS)
 
@@ -1051,7 +659,7 @@ class Game:
                 AZURE,
                 WIDTH * 0.85,
                 HEIGHT // 8,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Level_up_text(
                 self,
@@ -1059,7 +667,7 @@ class Game:
                 AZURE,
                 WIDTH * 0.85,
                 HEIGHT // 4 + HEIGHT // 8,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Level_up_text(
                 self,
@@ -1067,7 +675,7 @@ class Game:
                 AZURE,
                 WIDTH * 0.85,
                 HEIGHT // 2 + HEIGHT // 8,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Level_up_text(
                 self,
@@ -1075,7 +683,7 @@ class Game:
                 AZURE,
                 WIDTH * 0.85,
                 HEIGHT // 2 + HEIGHT // 4 + HEIGHT // 8 + 5,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Level_up_text(
                 self,
@@ -1083,7 +691,7 @@ class Game:
                 AZURE,
                 WIDTH // 16 + WIDTH * 0.375,
                 HEIGHT // 32 - 5,
-                pygame.font.Font("font/pixel_font.ttf", 50),
+                Font_manager.get(50),
             ),
             Level_up_text(
                 self,
@@ -1091,7 +699,7 @@ class Game:
                 AZURE,
                 WIDTH // 16 + WIDTH * 0.375,
                 HEIGHT // 4 + HEIGHT // 32 - 5,
-                pygame.font.Font("font/pixel_font.ttf", 50),
+                Font_manager.get(50),
             ),
             Level_up_text(
                 self,
@@ -1099,7 +707,7 @@ class Game:
                 AZURE,
                 WIDTH // 16 + WIDTH * 0.375,
                 HEIGHT // 2 + HEIGHT // 32 - 5,
-                pygame.font.Font("font/pixel_font.ttf", 50),
+                Font_manager.get(50),
             ),
             Level_up_text(
                 self,
@@ -1107,7 +715,7 @@ class Game:
                 AZURE,
                 WIDTH // 16 + WIDTH * 0.375,
                 HEIGHT // 2 + HEIGHT // 4 + HEIGHT // 32 - 5,
-                pygame.font.Font("font/pixel_font.ttf", 50),
+                Font_manager.get(50),
             ),
         ]
         for i in range(4):
@@ -1143,14 +751,14 @@ class Game:
                 FIRE,
                 WIDTH // 2,
                 HEIGHT * 0.85,
-                pygame.font.Font("font/pixel_font.ttf", 100),
+                Font_manager.get(100),
             ),
             Text(
                 "YOU                          WIN!",
                 FIRE,
                 WIDTH // 2,
                 HEIGHT * 0.3,
-                pygame.font.Font("font/pixel_font.ttf", 170),
+                Font_manager.get(170),
             ),
         ]
         pygame.time.wait(1000)
@@ -1158,9 +766,7 @@ class Game:
         pygame.mixer.music.unload()
         self.music.play_music("victory")
         pygame.mixer.music.set_volume(0.5)
-        self.image = pygame.image.load(
-            "images/enemies/level_4/dragon_skull.png"
-        ).convert()
+        self.image = Asset_loader.load_image("images/enemies/level_4/dragon_skull.png")
 
         while self.window_open:
             self.screen.fill(BLACK)
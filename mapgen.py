@@ -0,0 +1,216 @@
+import json
+import os
+import random
+import sys
+import time
+from config import *
+from level import Level, LEVEL_LEGEND
+
+# Where the generated legends are written
+MAP_DIRECTORY = "cache/maps"
+# Enemies per 1000 tiles of every zone, about the density of the map of config.py
+MAP_DENSITY = {"mouse": 14.5, "desert": 20.0, "burnt": 15.0, "dragon": 0.0}
+# The share of the tiles of every zone taken by each kind of terrain
+MAP_TERRAIN = {
+    "mouse": {"T": 0.08, "O": 0.03, "A": 0.03, "D": 0.005},
+    "desert": {"T": 0.08, "R": 0.03, "r": 0.005, "s": 0.01},
+    "burnt": {"T": 0.08, "L": 0.05, "H": 0.01, "R": 0.02, "s": 0.015},
+    "dragon": {"s": 0.03, "S": 0.0005},
+}
+# How often each enemy of a zone is picked, like in the map of config.py
+MAP_ENEMIES = {
+    "mouse": {"e": 15, "a": 26, "s": 27, "b": 1},
+    "desert": {"b": 14, "w": 19, "W": 12, "M": 1},
+    "burnt": {"i": 9, "u": 18, "f": 13},
+    "dragon": {"E": 1},
+}
+
+
+class Map_generator:
+    """
+    Generates maps of any size to measure how the game scales with its world.
+
+    The maps keep the layout of the map of config.py, scaled to the requested size:
+    the mouse meadows on top, the desert and the burnt lands below them and the
+    dragon's lair on the right, behind walls with an opening every few tiles and
+    inside a border. Every zone is scattered with its own terrain and with enemies at
+    the requested density, around a clearing where the player starts, and the lair
+    always holds the dragon. The map uses the characters of levels/legend.json, whose
+    regions and zones are moved to the new layout, so it is loaded like the map of
+    config.py, for example with Game(tilemap=rows, legend=legend_path).
+
+    Attributes:
+        columns (int): The number of columns of the map.
+        rows (int): The number of rows of the map.
+        density (dict): A dictionary mapping zones to their enemies per 1000 tiles.
+        seed (int): The seed of the map.
+        desert_row (int): The first row of the desert.
+        burnt_row (int): The first row of the burnt lands.
+        dragon_column (int): The first column of the dragon's lair.
+
+    Methods:
+        zone_of(column, row): Returns the zone of a tile.
+        tilemap(): Returns the rows of the map.
+        legend(): Returns the legend of the map.
+        save(directory): Writes the legend and returns the map and the legend's path.
+    """
+
+    def __init__(self, columns, rows, density=None, seed=0):
+        self.columns = columns
+        self.rows = rows
+        self.density = dict(MAP_DENSITY, **(density or {}))
+        self.seed = seed
+        # The proportions of the map of config.py (98 rows, 151 columns)
+        self.desert_row = rows * 48 // 98
+        self.burnt_row = rows * 71 // 98
+        self.dragon_column = columns * 99 // 151
+
+    def zone_of(self, column, row):
+        if column >= self.dragon_column:
+            return "dragon"
+        if row >= self.burnt_row:
+            return "burnt"
+        if row >= self.desert_row:
+            return "desert"
+        return "mouse"
+
+    def tilemap(self):
+        generator = random.Random(self.seed)
+        columns, rows = self.columns, self.rows
+        cells = [["."] * columns for row in range(rows)]
+
+        # The border and the walls between the zones, with an opening every 32 tiles
+        for column in range(columns):
+            cells[0][column] = cells[rows - 1][column] = "B"
+            if column < self.dragon_column and column % 32 > 3:
+                cells[self.desert_row][column] = "B"
+                cells[self.burnt_row][column] = "B"
+        for row in range(rows):
+            cells[row][0] = cells[row][columns - 1] = "B"
+            if row % 32 > 3:
+                cells[row][self.dragon_column] = "B"
+
+        # The cumulated shares of every zone's terrain and enemies
+        picks = {}
+        for zone in ZONES:
+            total = sum(MAP_ENEMIES[zone].values())
+            chance = self.density[zone] / 1000
+            choices = []
+            for character, share in MAP_TERRAIN[zone].items():
+                choices.append((share, character))
+            for character, weight in MAP_ENEMIES[zone].items():
+                choices.append((chance * weight / total, character))
+            cumulated = 0
+            picks[zone] = []
+            for share, character in choices:
+                cumulated += share
+                picks[zone].append((cumulated, character))
+
+        spawn = (WIDTH // 128, HEIGHT // 128)
+        for row in range(1, rows - 1):
+            line = cells[row]
+            for column in range(1, columns - 1):
+                if line[column] != "." or (
+                    abs(column - spawn[0]) <= 3 and abs(row - spawn[1]) <= 3
+                ):
+                    continue
+                roll = generator.random()
+                for cumulated, character in picks[self.zone_of(column, row)]:
+                    if roll < cumulated:
+                        line[column] = character
+                        break
+
+        # The dragon waits in the middle of its lair
+        lair = ((self.dragon_column + columns) // 2, rows // 2)
+        if lair[0] < columns - 1 and cells[lair[1]][lair[0]] != "B":
+            cells[lair[1]][lair[0]] = "E"
+        return ["".join(line) for line in cells]
+
+    def legend(self):
+        with open(LEVEL_LEGEND) as file:
+            legend = json.load(file)
+        areas = {
+            "mouse": ([0, self.desert_row], [0, self.dragon_column]),
+            "desert": ([self.desert_row, self.burnt_row], [0, self.dragon_column]),
+            "burnt": ([self.burnt_row, None], [0, self.dragon_column]),
+            "dragon": ([0, None], [self.dragon_column, None]),
+        }
+        for region in legend["regions"]:
+            if region["name"] in areas:
+                region["rows"], region["columns"] = areas[region["name"]]
+        legend["zones"] = [
+            {"zone": zone, "rows": areas[zone][0], "columns": areas[zone][1]}
+            for zone in ZONES
+        ]
+        return legend
+
+    def save(self, directory=MAP_DIRECTORY):
+        # The legend only depends on the size of the map
+        path = os.path.join(directory, f"legend_{self.columns}x{self.rows}.json")
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.legend(), file, indent=1)
+        return self.tilemap(), path
+
+
+if __name__ == "__main__":
+    # Measures the game on maps of the given sizes, like: python mapgen.py 150 500 1000
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import gc
+    import resource
+    import pygame
+    from main import Game
+
+    sizes = [int(size) for size in sys.argv[1:]] or [150, 300, 600, 1000]
+    print(
+        "size        tiles  enemies  generate  compile  build  player.update  "
+        "game.update  asleep  hits x1000   RSS"
+    )
+    for size in sizes:
+        start = time.perf_counter()
+        rows, legend = Map_generator(size, size).save()
+        generate = time.perf_counter() - start
+        # Compiles the level the first time, later runs only load it
+        start = time.perf_counter()
+        Level.get(rows, legend)
+        compile_time = time.perf_counter() - start
+        game = Game(show_intro=False, tilemap=rows, legend=legend)
+        start = time.perf_counter()
+        game.new()
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for frame in range(100):
+            game.player.update()
+        player = (time.perf_counter() - start) * 10
+        start = time.perf_counter()
+        for frame in range(100):
+            game.update()
+        update = (time.perf_counter() - start) * 10
+        probes = random.Random(0)
+        rects = [
+            pygame.Rect(
+                probes.randrange(size * TILESIZE),
+                probes.randrange(size * TILESIZE),
+                TILESIZE,
+                TILESIZE,
+            )
+            for probe in range(1000)
+        ]
+        start = time.perf_counter()
+        for rect in rects:
+            game.collision_map.hits(rect)
+        hits = (time.perf_counter() - start) * 1000
+
+        stream = game.stream.stats()
+        asleep = game.activation.stats()["dormant"]
+        memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+        print(
+            f"{size}x{size:<6}{size * size:>9} {stream['live'] + stream['dormant']:>8} "
+            f"{generate:>8.2f}s {compile_time:>7.2f}s {build:>5.2f}s "
+            f"{player:>12.2f}ms {update:>10.2f}ms {asleep:>7} {hits:>9.2f}ms "
+            f"{memory:>5}MB"
+        )
+        del game
+        gc.collect()
@@ -0,0 +1,292 @@
+import time
+import numpy
+import pygame
+from config import *
+
+# Who launched a projectile, in the order of their codes in the pool
+OWNERS = ("player", "enemy")
+
+
+def to_pixels(values):
+    # Rounds coordinates like pygame's Rect does, halves away from zero
+    return numpy.where(
+        values >= 0, numpy.floor(values + 0.5), numpy.ceil(values - 0.5)
+    ).astype("int64")
+
+
+class Projectile_pool:
+    """
+    The projectiles of the player and of the enemies, kept as records in arrays.
+
+    A projectile is a slot of the pool, not a sprite: its position, size, velocity,
+    animation phase and the phase it ends at, damage, owner and the number of hits
+    it landed are values in arrays, and only its kind (the class that launched it,
+    like Attack or Enemy_attack) and its animation frames are kept in lists. Every
+    frame, the hits of the enemies' projectiles are found at once against the
+    player's hitbox, the player's projectiles only look for enemies in the cells of
+    the spatial hash they overlap, and all the projectiles move and animate with a
+    few array operations. Python code only runs for the projectiles that hit
+    something, through the strike() of their kind. The slots of finished projectiles
+    are reused by the next launches, the arrays only grow when every slot is in use.
+
+    Attributes:
+        game (Game): The game instance.
+        capacity (int): The number of slots, doubled whenever they are all used.
+        kinds (list): The class that launched the projectile of every slot, or None.
+        animations (list): The animation frames of the projectile of every slot.
+        free (list): The free slots, the last one is used first.
+        launched (int): The number of projectiles launched so far.
+        update_time (float): The time in seconds spent updating the projectiles.
+
+    Methods:
+        grow(): Doubles the number of slots.
+        launch(kind, x, y, size, dx, dy, animations, step, end, damage): Launches
+            a projectile and returns its slot.
+        remove(slot): Frees the slot of a projectile.
+        strike(slot, sprites): Applies the hits of a projectile.
+        strike_enemies(slots): Resolves the hits of the player's projectiles.
+        strike_player(slots): Resolves the hits of the enemies' projectiles.
+        update(): Resolves the hits, then moves and animates every projectile.
+        draw(surface, camera): Draws the projectiles in view.
+        stats(): Returns the number of projectiles and slots and the timings.
+    """
+
+    # The arrays of the pool and their types, one value per slot
+    fields = {
+        "used": "bool",
+        "x": "int64",
+        "y": "int64",
+        "width": "int64",
+        "height": "int64",
+        "dx": "float64",
+        "dy": "float64",
+        "animation_loop": "float64",
+        "step": "float64",
+        "end": "float64",
+        "frame": "int64",
+        "damage": "int64",
+        "owner": "int8",
+        "struck": "int64",
+        "order": "int64",
+    }
+
+    def __init__(self, game, capacity=64):
+        self.game = game
+        self.capacity = 0
+        self.kinds = []
+        self.animations = []
+        self.free = []
+        for name, kind in self.fields.items():
+            setattr(self, name, numpy.zeros(0, kind))
+        self.launched = 0
+        self.update_time = 0.0
+        while self.capacity < capacity:
+            self.grow()
+
+    def grow(self):
+        capacity = max(self.capacity * 2, 1)
+        for name, kind in self.fields.items():
+            array = numpy.zeros(capacity, kind)
+            array[: self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.kinds.extend([None] * (capacity - self.capacity))
+        self.animations.extend([None] * (capacity - self.capacity))
+        # The lowest slots are used first
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def launch(self, kind, x, y, size, dx, dy, animations, step, end, damage):
+        """
+        Launches a projectile.
+
+        Args:
+            kind (type): The class launching the projectile, it decides what a hit does.
+            x (int): The x-coordinate of the projectile.
+            y (int): The y-coordinate of the projectile.
+            size (tuple): The width and height of the projectile's rectangle.
+            dx (float): The distance the projectile moves along x every frame.
+            dy (float): The distance the projectile moves along y every frame.
+            animations (list): The animation frames of the projectile.
+            step (float): How much the animation advances every frame.
+            end (float): The animation phase the projectile vanishes at.
+            damage (int): The damage of the projectile.
+
+        Returns:
+            int: The slot of the projectile.
+        """
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.kinds[slot] = kind
+        self.animations[slot] = animations
+        self.used[slot] = True
+        self.x[slot] = x
+        self.y[slot] = y
+        self.width[slot], self.height[slot] = size
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.animation_loop[slot] = 0
+        self.step[slot] = step
+        self.end[slot] = end
+        self.frame[slot] = 0
+        self.damage[slot] = damage
+        self.owner[slot] = OWNERS.index(kind.owner)
+        self.struck[slot] = 0
+        # Projectiles are resolved and drawn in the order they were launched
+        self.order[slot] = self.launched
+        self.launched += 1
+        return slot
+
+    def remove(self, slot):
+        self.used[slot] = False
+        self.kinds[slot] = None
+        self.animations[slot] = None
+        self.free.append(slot)
+
+    def strike(self, slot, sprites):
+        kind = self.kinds[slot]
+        kind.strike(self.game, int(self.damage[slot]), sprites)
+        self.struck[slot] += len(sprites)
+        if self.struck[slot] >= kind.limit(self.game):
+            self.remove(slot)
+
+    def strike_enemies(self, slots):
+        # Every projectile only looks at the sprites of the cells of the spatial hash
+        # it overlaps, the enemies it hits are struck in the order they were added
+        enemies = self.game.enemies
+        sprites = self.game.all_sprites
+        sprites.place()
+        for slot, x, y, width, height in zip(
+            slots.tolist(),
+            self.x[slots].tolist(),
+            self.y[slots].tolist(),
+            self.width[slots].tolist(),
+            self.height[slots].tolist(),
+        ):
+            hits = [
+                sprite
+                for sprite in sprites.index.overlapping(
+                    pygame.Rect(x, y, width, height)
+                )
+                if enemies.has_internal(sprite)
+            ]
+            if hits:
+                hits.sort(key=sprites.order.__getitem__)
+                self.strike(slot, hits)
+
+    def strike_player(self, slots):
+        # One rectangle test of every enemy projectile against the player's hitbox,
+        # the enemies and the terrain are never looked at
+        player = self.game.player
+        if player.invincible:
+            return
+        rect = player.hitbox()
+        x = self.x[slots]
+        y = self.y[slots]
+        hits = (
+            (x < rect.right)
+            & (rect.x < x + self.width[slots])
+            & (y < rect.bottom)
+            & (rect.y < y + self.height[slots])
+        )
+        for slot in slots[hits]:
+            # A hit can make the player invincible, the next projectiles fly through
+            if player.invincible:
+                break
+            self.strike(slot, [player])
+
+    def update(self):
+        start = time.perf_counter()
+        slots = numpy.flatnonzero(self.used)
+        slots = slots[numpy.argsort(self.order[slots])]
+        owner = self.owner[slots]
+        self.strike_enemies(slots[owner == OWNERS.index("player")])
+        self.strike_player(slots[owner == OWNERS.index("enemy")])
+
+        slots = slots[self.used[slots]]
+        self.x[slots] = to_pixels(self.x[slots] + self.dx[slots])
+        self.y[slots] = to_pixels(self.y[slots] + self.dy[slots])
+        # The frame shown is the one before the animation advances
+        animation_loop = self.animation_loop[slots]
+        self.frame[slots] = numpy.floor(animation_loop)
+        animation_loop += self.step[slots]
+        self.animation_loop[slots] = animation_loop
+        for slot in slots[animation_loop >= self.end[slots]]:
+            self.remove(slot)
+        self.update_time += time.perf_counter() - start
+
+    def draw(self, surface, camera):
+        view = camera.view(surface)
+        slots = numpy.flatnonzero(self.used)
+        x = self.x[slots]
+        y = self.y[slots]
+        slots = slots[
+            (x < view.right)
+            & (view.x < x + self.width[slots])
+            & (y < view.bottom)
+            & (view.y < y + self.height[slots])
+        ]
+        slots = slots[numpy.argsort(self.order[slots])]
+        surface.blits(
+            [
+                (
+                    self.animations[slot][self.frame[slot]],
+                    (int(self.x[slot]) - camera.x, int(self.y[slot]) - camera.y),
+                )
+                for slot in slots
+            ],
+            False,
+        )
+
+    def stats(self):
+        return {
+            "live": self.capacity - len(self.free),
+            "capacity": self.capacity,
+            "launched": self.launched,
+            "update_time": round(self.update_time, 3),
+        }
+
+
+if __name__ == "__main__":
+    # Keeps that many enemy attacks flying around the player and reports how long
+    # they take to update and draw, like: python projectiles.py 200 1000 5000
+    import os
+    import random
+    import sys
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from main import Game
+    from entities import Enemy_attack
+
+    random.seed(0)
+    game = Game(show_intro=False)
+    game.new()
+    # The player is not hurt, every attack lives its whole life
+    game.health_bar.lose = lambda amount: None
+    enemy = next(iter(game.enemies))
+    x, y = game.player.rect.topleft
+    frames = 100
+    print("projectiles  launch   update     draw")
+    for count in [int(count) for count in sys.argv[1:]] or [200, 1000, 5000]:
+        launch = update = draw = 0
+        for frame in range(frames):
+            start = time.perf_counter()
+            while game.projectiles.stats()["live"] < count:
+                Enemy_attack.launch(
+                    game,
+                    x + random.randint(-WIDTH // 2, WIDTH // 2),
+                    y + random.randint(-HEIGHT // 2, HEIGHT // 2),
+                    enemy,
+                )
+            launched = time.perf_counter()
+            game.projectiles.update()
+            updated = time.perf_counter()
+            game.projectiles.draw(game.screen, game.camera)
+            launch += launched - start
+            update += updated - launched
+            draw += time.perf_counter() - updated
+        print(
+            f"{count:>11} {launch * 1000 / frames:>6.2f}ms {update * 1000 / frames:>6.2f}ms "
+            f"{draw * 1000 / frames:>6.2f}ms"
+        )
@@ -0,0 +1,400 @@
+import random
+import sys
+import time
+import numpy
+from config import *
+from entities import Enemy, Boss, Enemy_attack, Boss_attack
+from projectiles import to_pixels
+
+# The directions enemies face, in the order of their codes in the simulation
+FACINGS = ("up", "down", "left", "right")
+
+
+class Enemy_simulation:
+    """
+    Updates all the enemies of the game at once, from arrays instead of sprite by sprite.
+
+    The state that changes every frame (position, speed, health, distance to the
+    player, facing, animation phase and cooldowns) is kept in NumPy arrays, one slot
+    per enemy, and every frame the cooldowns, the chase towards the player, the
+    animation and the deaths are computed for all the awake enemies with a handful of
+    array operations. Enemies only run Python code for what touches the rest of the
+    game: the few standing on a tile with a block are pushed out by Enemy.collide, the
+    dying ones go through Enemy.check_health and the shooting ones create their
+    attacks. The sprites only read their draw state (rect and image) back, and only
+    when it changed. The rules are the ones of Enemy.update and Boss.update, applied
+    in the same order, so the game plays the same with and without the simulation.
+
+    Enemies join the simulation on their first update (see Enemy.simulated) and leave
+    it when they are killed. The sleeping enemies (see Enemy_activation) are left out,
+    and the idle ones far from the player are put to sleep at the end of the update. While an enemy is simulated its arrays are authoritative:
+    attacks hit it through Enemy.hit and sync() writes its state back to the sprite
+    when something needs it, like Enemy.store or the creation of an attack.
+
+    Attributes:
+        game (Game): The game instance.
+        capacity (int): The number of slots, doubled whenever they are all used.
+        enemies (list): The enemy of every slot, or None for free slots.
+        free (list): The free slots, the last one is used first.
+        grid (numpy.ndarray): The states of the collision map, as rows and columns.
+        resident (set): The resident zones at the last update.
+        updates (int): The number of updates so far.
+        update_time (float): The time in seconds spent updating the enemies.
+
+    Methods:
+        grow(): Doubles the number of slots.
+        add(enemy): Adds an enemy to the simulation.
+        remove(enemy): Removes an enemy from the simulation.
+        load(enemy): Copies the state of an enemy into its slot.
+        sync(enemy): Copies the state of the slot of an enemy back to the enemy.
+        hit(enemy, damage, slow): Damages and slows an enemy.
+        place(enemy, position): Moves an enemy.
+        touching(x, y, width, height): Returns which rectangles touch a tile with a block.
+        collide(slots, x, y, facing, dist, direction): Pushes enemies out of blocks.
+        update(): Updates all the awake enemies.
+        stats(): Returns the number of simulated enemies, the slots and the timings.
+    """
+
+    # The arrays of the simulation and their types, one value per slot
+    fields = {
+        "used": "bool",
+        "x": "int64",
+        "y": "int64",
+        "width": "int64",
+        "height": "int64",
+        "speed": "float64",
+        "health": "int64",
+        "dist": "float64",
+        "facing": "int8",
+        "animation_loop": "float64",
+        "animate_speed": "float64",
+        "cooldown": "int64",
+        "max_cooldown": "int64",
+        "ultimate": "bool",
+        "ultimate_cooldown": "int64",
+        "ultimate_cooldown_max": "int64",
+        "zone": "int8",
+        "always_awake": "bool",
+        "reach": "float64",
+        "shown": "int64",
+        "dormant": "bool",
+    }
+
+    def __init__(self, game, capacity=256):
+        self.game = game
+        self.capacity = 0
+        self.enemies = []
+        self.free = []
+        for name, kind in self.fields.items():
+            setattr(self, name, numpy.zeros(0, kind))
+        # The number of frames of every slot's animations, by facing (0 until known)
+        self.frames = numpy.zeros((0, len(FACINGS)), "int64")
+        collision_map = game.collision_map
+        self.grid = numpy.frombuffer(collision_map.cells, "uint8").reshape(
+            collision_map.rows, collision_map.columns
+        )
+        self.resident = set(game.zones.resident)
+        self.updates = 0
+        self.update_time = 0.0
+        while self.capacity < capacity:
+            self.grow()
+
+    def grow(self):
+        capacity = max(self.capacity * 2, 1)
+        for name, kind in self.fields.items():
+            array = numpy.zeros(capacity, kind)
+            array[: self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        frames = numpy.zeros((capacity, len(FACINGS)), "int64")
+        frames[: self.capacity] = self.frames
+        self.frames = frames
+        self.enemies.extend([None] * (capacity - self.capacity))
+        # The lowest slots are used first
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def add(self, enemy):
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        enemy.slot = slot
+        self.enemies[slot] = enemy
+        self.used[slot] = True
+        self.width[slot] = enemy.rect.width
+        self.height[slot] = enemy.rect.height
+        self.animate_speed[slot] = enemy.animate_speed
+        self.max_cooldown[slot] = enemy.max_cooldown_count
+        self.ultimate[slot] = isinstance(enemy, Boss)
+        if self.ultimate[slot]:
+            self.ultimate_cooldown_max[slot] = enemy.ultimate_cooldown_max
+        self.zone[slot] = enemy.zone
+        # Like in Boss.update
+        self.always_awake[slot] = isinstance(enemy, Boss) and enemy.name == "Dragon"
+        self.reach[slot] = enemy.reach
+        self.dormant[slot] = False
+        self.frames[slot] = 0
+        self.load(enemy)
+
+    def remove(self, enemy):
+        slot = enemy.slot
+        self.sync(enemy)
+        self.used[slot] = False
+        self.enemies[slot] = None
+        self.free.append(slot)
+        enemy.slot = None
+
+    def load(self, enemy):
+        slot = enemy.slot
+        self.x[slot], self.y[slot] = enemy.rect.topleft
+        self.speed[slot] = enemy.speed
+        self.health[slot] = enemy.health
+        self.dist[slot] = enemy.dist
+        self.facing[slot] = FACINGS.index(enemy.facing)
+        self.animation_loop[slot] = enemy.animation_loop
+        self.cooldown[slot] = enemy.shoot_cooldown_count
+        if self.ultimate[slot]:
+            self.ultimate_cooldown[slot] = enemy.ultimate_cooldown_count
+        # The image is set again at the next update
+        self.shown[slot] = -1
+
+    def sync(self, enemy):
+        slot = enemy.slot
+        enemy.rect.topleft = (int(self.x[slot]), int(self.y[slot]))
+        enemy.speed = float(self.speed[slot])
+        enemy.health = int(self.health[slot])
+        enemy.dist = float(self.dist[slot])
+        enemy.facing = FACINGS[self.facing[slot]]
+        enemy.animation_loop = float(self.animation_loop[slot])
+        enemy.shoot_cooldown_count = int(self.cooldown[slot])
+        if self.ultimate[slot]:
+            enemy.ultimate_cooldown_count = int(self.ultimate_cooldown[slot])
+
+    def hit(self, enemy, damage, slow=0):
+        self.health[enemy.slot] -= damage
+        self.speed[enemy.slot] -= slow
+
+    def place(self, enemy, position):
+        self.x[enemy.slot], self.y[enemy.slot] = position
+
+    def touching(self, x, y, width, height):
+        # Whether the corners of the rectangles are on a tile that is not free, which
+        # finds every rectangle Collision_map.hits could return blocks for as long as
+        # the rectangles are no larger than a tile
+        rows, columns = self.grid.shape
+        left = numpy.clip(x // TILESIZE, 0, columns - 1)
+        right = numpy.clip((x + width - 1) // TILESIZE, 0, columns - 1)
+        top = numpy.clip(y // TILESIZE, 0, rows - 1)
+        bottom = numpy.clip((y + height - 1) // TILESIZE, 0, rows - 1)
+        grid = self.grid
+        return (
+            (
+                (grid[top, left] | grid[top, right] | grid[bottom, left])
+                | grid[bottom, right]
+            ).astype(bool)
+            | (width > TILESIZE)
+            | (height > TILESIZE)
+        )
+
+    def collide(self, slots, x, y, facing, dist, direction):
+        # Enemy.collide on the few enemies close to the player and to a block
+        near = (dist < Enemy.reach) & self.touching(
+            x, y, self.width[slots], self.height[slots]
+        )
+        for index in numpy.flatnonzero(near):
+            enemy = self.enemies[slots[index]]
+            enemy.rect.topleft = (int(x[index]), int(y[index]))
+            enemy.facing = FACINGS[facing[index]]
+            enemy.dist = float(dist[index])
+            enemy.collide(direction)
+            x[index], y[index] = enemy.rect.topleft
+
+    def update(self):
+        start = time.perf_counter()
+        self.updates += 1
+        # Like Enemy.awake, desert enemies also chase the player into the burnt lands
+        zone = self.game.player.zone
+        awake = (self.zone == zone) | self.always_awake
+        if zone == ZONES.index("burnt"):
+            awake |= self.zone == ZONES.index("desert")
+        # Enemy_activation, the enemies waiting for the player to enter their zone
+        # fall asleep when the player is far enough
+        player = self.game.player.rect
+        waiting = numpy.flatnonzero(self.used & ~self.dormant & ~awake)
+        far = numpy.hypot(player.x - self.x[waiting], player.y - self.y[waiting]) >= (
+            self.reach[waiting] + ENEMY_SLEEP_MARGIN
+        )
+        for slot in waiting[far]:
+            self.game.activation.sleep(self.enemies[slot])
+        slots = numpy.flatnonzero(self.used & ~self.dormant & awake)
+        if not len(slots):
+            self.update_time += time.perf_counter() - start
+            return
+
+        # Enemy.cooldown and Boss.cooldown_ultimate
+        cooldown = self.cooldown[slots]
+        cooldown = numpy.where(
+            cooldown >= self.max_cooldown[slots],
+            0,
+            numpy.where(cooldown > 0, cooldown + 1, cooldown),
+        )
+        ultimate = self.ultimate[slots]
+        ultimate_cooldown = self.ultimate_cooldown[slots]
+        ultimate_cooldown = numpy.where(
+            ultimate_cooldown >= self.ultimate_cooldown_max[slots],
+            0,
+            numpy.where(
+                ultimate_cooldown > 0, ultimate_cooldown + 1, ultimate_cooldown
+            ),
+        )
+
+        x = self.x[slots]
+        y = self.y[slots]
+        facing = self.facing[slots].astype("int64")
+        self.collide(slots, x, y, facing, self.dist[slots], "x")
+
+        # Enemy.movement, one step on one axis towards the player
+        dist = numpy.hypot(player.x - x, player.y - y)
+        reach = self.reach[slots]
+        chasing = dist < reach
+        right = chasing & (player.x > x)
+        left = chasing & (player.x < x)
+        down = chasing & (player.x == x) & (player.y > y)
+        up = chasing & (player.x == x) & (player.y < y)
+        speed = self.speed[slots]
+        x = numpy.where(
+            right, to_pixels(x + speed), numpy.where(left, to_pixels(x - speed), x)
+        )
+        y = numpy.where(
+            down, to_pixels(y + speed), numpy.where(up, to_pixels(y - speed), y)
+        )
+        facing = numpy.select([up, down, left, right], [0, 1, 2, 3], facing)
+        self.collide(slots, x, y, facing, dist, "y")
+
+        # Enemy.animate, the frame shown is the one before the loop advances
+        if self.game.zones.resident != self.resident:
+            # The zones changed the images of their enemies
+            self.resident = set(self.game.zones.resident)
+            self.shown[:] = -1
+        frames = self.frames[slots, facing]
+        for index in numpy.flatnonzero(chasing & (frames == 0)):
+            enemy = self.enemies[slots[index]]
+            animations = enemy.animations
+            self.frames[slots[index]] = [len(animations[name]) for name in FACINGS]
+        frames = self.frames[slots, facing]
+        animation_loop = self.animation_loop[slots]
+        frame = numpy.floor(animation_loop).astype("int64")
+        animation_loop = numpy.where(
+            chasing, animation_loop + self.animate_speed[slots], animation_loop
+        )
+        animation_loop = numpy.where(
+            chasing & (animation_loop >= frames), 1, animation_loop
+        )
+        # Out of reach, the enemies of the resident zones show their first frame
+        resident = numpy.isin(self.zone[slots], list(self.resident))
+        shown = numpy.where(
+            chasing, facing * 256 + frame, numpy.where(resident, facing * 256, -1)
+        )
+        redraw = (shown >= 0) & (shown != self.shown[slots])
+        moved = (x != self.x[slots]) | (y != self.y[slots])
+
+        # Enemy.attack_player and Boss.ultimate_attack_player
+        shoot = (cooldown == 0) & chasing
+        cooldown[shoot] += 1
+        blast = ultimate & (ultimate_cooldown == 0)
+        ultimate_cooldown[blast] += 1
+        blast &= dist < Enemy.reach + 100
+
+        self.x[slots] = x
+        self.y[slots] = y
+        self.dist[slots] = dist
+        self.facing[slots] = facing
+        self.animation_loop[slots] = animation_loop
+        self.cooldown[slots] = cooldown
+        self.ultimate_cooldown[slots] = ultimate_cooldown
+        self.shown[slots] = numpy.where(redraw, shown, self.shown[slots])
+        index_of_sprites = self.game.all_sprites.index
+        for index in numpy.flatnonzero(moved | redraw):
+            enemy = self.enemies[slots[index]]
+            if moved[index]:
+                enemy.rect.topleft = (int(x[index]), int(y[index]))
+                # The group moved its sprites in its spatial hash before this update
+                index_of_sprites.move(enemy)
+            if redraw[index]:
+                enemy.image = enemy.animations[FACINGS[facing[index]]][
+                    shown[index] % 256
+                ]
+
+        # Enemy.check_health, then the attacks, dead enemies still fire like they do
+        # when they update themselves
+        attacking = numpy.flatnonzero(shoot | blast)
+        attackers = [self.enemies[slots[index]] for index in attacking]
+        for index in numpy.flatnonzero(self.health[slots] <= 0):
+            enemy = self.enemies[slots[index]]
+            self.sync(enemy)
+            enemy.check_health()
+        for index, enemy in zip(attacking, attackers):
+            if enemy.slot is not None:
+                self.sync(enemy)
+            if shoot[index]:
+                Enemy_attack.launch(self.game, enemy.rect.x, enemy.rect.y, enemy)
+            if blast[index]:
+                Boss_attack.launch(self.game, enemy.rect.x, enemy.rect.y, enemy)
+
+        # Enemy_activation, the enemies out of reach with their attack cooled down
+        # fall asleep when the player is far enough, like in Enemy.idle
+        idle = (
+            (dist >= self.reach[slots] + ENEMY_SLEEP_MARGIN)
+            & (self.cooldown[slots] == 0)
+            & ~ultimate
+            & self.used[slots]
+        )
+        for slot in slots[idle]:
+            if self.enemies[slot].alive():
+                self.game.activation.sleep(self.enemies[slot])
+        self.update_time += time.perf_counter() - start
+
+    def stats(self):
+        return {
+            "simulated": self.capacity - len(self.free),
+            "capacity": self.capacity,
+            "updates": self.updates,
+            "update_time": round(self.update_time, 3),
+        }
+
+
+if __name__ == "__main__":
+    # Compares the enemies updating themselves with the simulation, like:
+    # python simulation.py 100 1000 10000
+    import os
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from main import Game
+    from world import place_crowd
+
+    counts = [int(count) for count in sys.argv[1:]] or [100, 1000, 10000]
+    frames = 100
+    print("enemies  backend   ms/frame  us/enemy")
+    for count in counts:
+        for backend in ("objects", "numpy"):
+            random.seed(0)
+            game = Game(show_intro=False)
+            game.new()
+            if backend == "objects":
+                game.simulation = None
+            # The enemies of the mouse meadows, scattered within reach of the player
+            place_crowd(game, count)
+            # The first update adds the enemies to the simulation
+            game.all_sprites.update()
+            if game.simulation is not None:
+                game.simulation.update()
+            start = time.perf_counter()
+            for frame in range(frames):
+                game.all_sprites.update()
+                if game.simulation is not None:
+                    game.simulation.update()
+            elapsed = (time.perf_counter() - start) / frames
+            print(
+                f"{count:>7}  {backend:<8} {elapsed * 1000:>8.2f} "
+                f"{elapsed * 1e6 / len(game.enemies):>9.2f}"
+            )
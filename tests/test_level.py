@@ -0,0 +1,111 @@
+import json
+import struct
+from collections import Counter
+from config import tilemap
+from level import Level, LEVEL_LEGEND, SPAWN_FORMAT
+from world import Collision_map
+
+# What the characters of the map in config.py stand for, in every area of the map:
+# the rows and columns it covers (None reaches the edge of the map), the characters
+# drawn as a block, the characters drawn over a second ground tile and the enemies.
+# Every cell of an area gets a ground tile and "B" is a block wherever it is.
+AREAS = [
+    (
+        (0, 48, 0, 100),
+        "OAD",
+        "T",
+        {"e": "Grey Mouse", "a": "Brown Mouse", "s": "White Mouse", "b": "Boss Mouse"},
+    ),
+    (
+        (48, 71, 0, 99),
+        "R",
+        "Trs",
+        {
+            "b": "Desert Boarman",
+            "w": "Desert Wolf",
+            "W": "Desert Wartotaur",
+            "M": "Desert Boss",
+        },
+    ),
+    (
+        (71, None, 0, 99),
+        "HLR",
+        "Ts",
+        {"i": "Burnt Imp", "u": "Burnt Succubus", "f": "Burnt Fallen Angel"},
+    ),
+    ((46, None, 99, None), "", "Ss", {"E": "Dragon"}),
+]
+
+
+def expected_world():
+    # The number of blocks and ground tiles of every cell and the enemies placed on
+    # the map, read from the ASCII map
+    blocks = Counter()
+    ground = Counter()
+    spawns = []
+    for row, line in enumerate(tilemap):
+        for column, character in enumerate(line):
+            if character == "B":
+                blocks[(column, row)] += 1
+            for (first_row, last_row, first_column, last_column), *meaning in AREAS:
+                if not first_row <= row < (last_row or len(tilemap)):
+                    continue
+                if not first_column <= column < (last_column or len(line)):
+                    continue
+                block, extra_ground, enemies = meaning
+                blocks[(column, row)] += character in block
+                ground[(column, row)] += 1 + (character in extra_ground)
+                if character in enemies:
+                    spawns.append((enemies[character], column, row))
+    return +blocks, +ground, spawns
+
+
+def compiled_world(level):
+    # The same, read from the arrays of a compiled level
+    blocks = Counter()
+    ground = Counter()
+    for layer in range(level.layers):
+        for row in range(level.rows):
+            for column, kind in enumerate(level.tiles(layer, row)):
+                if not kind:
+                    continue
+                if level.kinds[kind - 1]["type"] == "Block":
+                    blocks[(column, row)] += 1
+                else:
+                    ground[(column, row)] += 1
+    with open(LEVEL_LEGEND) as file:
+        names = list(json.load(file)["enemies"])
+    spawns = [
+        (names[enemy], column, row)
+        for enemy, column, row in struct.iter_unpack(SPAWN_FORMAT, level.spawns)
+    ]
+    return blocks, ground, spawns
+
+
+def test_compiled_level_matches_the_map(tmp_path):
+    level = Level.get(tilemap, directory=str(tmp_path))
+    blocks, ground, spawns = expected_world()
+
+    assert compiled_world(level) == (blocks, ground, spawns)
+    assert (sum(blocks.values()), sum(ground.values()), len(spawns)) == (
+        2133,
+        14466,
+        156,
+    )
+    # Only the tiles holding a block collide
+    blocked = {
+        (column, row)
+        for row in range(level.rows)
+        for column in range(level.columns)
+        if level.collision[row * level.columns + column] != Collision_map.FREE
+    }
+    assert blocked == set(blocks)
+
+
+def test_compiled_level_loads_again(tmp_path):
+    # The second call loads the file the first one compiled
+    first = Level.get(tilemap, directory=str(tmp_path))
+    second = Level.get(tilemap, directory=str(tmp_path))
+
+    assert second.path == first.path
+    assert compiled_world(second) == compiled_world(first)
@@ -1,7 +1,142 @@
 import pygame
+from collections import OrderedDict
 from config import *
 
 
+class Font_manager:
+    """
+    Opens the game's font once per size.
+
+    Attributes:
+        fonts (dict): A dictionary mapping font sizes to opened fonts.
+
+    Methods:
+        get(size): Returns the font of the given size, opening it if needed.
+    """
+
+    fonts = {}
+
+    @classmethod
+    def get(cls, size):
+        size = int(size)
+        font = cls.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(FONT_FILE, size)
+            cls.fonts[size] = font
+        return font
+
+
+class Text_cache:
+    """
+    A least recently used cache of rendered text surfaces.
+
+    Entries are keyed by (text, font, color). Fonts come from Font_manager, which
+    opens one font per size, so the font stands for its size. The cached surfaces
+    are shared and must not be drawn on.
+
+    Attributes:
+        surfaces (OrderedDict): The rendered surfaces, least recently used first.
+        size (int): The maximum number of surfaces kept.
+        hits (int): The number of texts served from the cache.
+        misses (int): The number of texts that had to be rendered.
+
+    Methods:
+        render(text, font, color): Returns the rendered text, rendering it if needed.
+        stats(): Returns the hit/miss counters and the hit rate.
+    """
+
+    surfaces = OrderedDict()
+    size = TEXT_CACHE_SIZE
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def render(cls, text, font, color):
+        key = (text, font, color)
+        surface = cls.surfaces.get(key)
+        if surface is None:
+            cls.misses += 1
+            surface = font.render(text, 1, color)
+            cls.surfaces[key] = surface
+            if len(cls.surfaces) > cls.size:
+                cls.surfaces.popitem(last=False)
+        else:
+            cls.hits += 1
+            cls.surfaces.move_to_end(key)
+        return surface
+
+    @classmethod
+    def stats(cls):
+        total = cls.hits + cls.misses
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / total, 3) if total else 0,
+            "surfaces": len(cls.surfaces),
+        }
+
+
+class Digit_atlas:
+    """
+    Pre-rasterised glyphs for the numbers of the damage and experience popups.
+
+    The glyphs of a font and colour are rendered once, side by side, into a single
+    atlas surface. A number is then composed by blitting its glyph cells, so popups
+    never go through the font rasterizer. Texts with other characters are rendered
+    by the text cache instead.
+
+    Attributes:
+        glyphs (str): The characters held by every atlas.
+        atlases (dict): A dictionary mapping (font, color) to the atlas surface and
+            the cell of every glyph.
+
+    Methods:
+        get(font, color): Returns the atlas and its glyph cells, building them if needed.
+        render(text, font, color): Composes the text from glyph cells.
+    """
+
+    glyphs = "0123456789+-. xp"
+    atlases = {}
+
+    @classmethod
+    def get(cls, font, color):
+        atlas = cls.atlases.get((font, color))
+        if atlas is None:
+            rendered = [font.render(glyph, 1, color) for glyph in cls.glyphs]
+            surface = pygame.Surface(
+                (
+                    sum(glyph.get_width() for glyph in rendered),
+                    max(glyph.get_height() for glyph in rendered),
+                ),
+                pygame.SRCALPHA,
+            )
+            cells = {}
+            x = 0
+            for glyph, image in zip(cls.glyphs, rendered):
+                # Adding to the transparent atlas copies the pixels and their alpha as is
+                surface.blit(image, (x, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                cells[glyph] = pygame.Rect(x, 0, image.get_width(), image.get_height())
+                x += image.get_width()
+            atlas = (surface, cells)
+            cls.atlases[(font, color)] = atlas
+        return atlas
+
+    @classmethod
+    def render(cls, text, font, color):
+        atlas, cells = cls.get(font, color)
+        if any(glyph not in cells for glyph in text):
+            return Text_cache.render(text, font, color)
+        image = pygame.Surface(
+            (sum(cells[glyph].width for glyph in text), atlas.get_height()),
+            pygame.SRCALPHA,
+        )
+        x = 0
+        for glyph in text:
+            image.blit(atlas, (x, 0), cells[glyph], special_flags=pygame.BLEND_RGBA_ADD)
+            x += cells[glyph].width
+        return image
+
+
 class Text:
     """
     A class representing text to be displayed on the screen.
@@ -26,7 +161,7 @@ class Text:
         self.font = font
 
     def update(self):
-        self.image = self.font.render(self.text, 1, self.color)
+        self.image = Text_cache.render(self.text, self.font, self.color)
         self.rect = self.image.get_rect()
         self.rect.center = self.x, self.y
 
@@ -74,14 +209,14 @@ class Temporary_text_experience(pygame.sprite.Sprite):
         self.font = font
         self.end_time = pygame.time.get_ticks() + 5000
         self.amount = 0
+        # The text never changes, so it is composed once
+        self.image = Digit_atlas.render(self.text, self.font, self.color)
+        self.rect = self.image.get_rect(center=(self.x, self.y))
 
     def update(self):
         self.draw(self.game.screen)
 
     def draw(self, screen):
-        self.image = self.font.render(self.text, 1, self.color)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.x, self.y
         screen.blit(self.image, self.rect)
         if pygame.time.get_ticks() > self.end_time:
             self.kill()
@@ -119,14 +254,14 @@ class Temporary_text_damage(pygame.sprite.Sprite):
         self.font = font
         self.end_time = pygame.time.get_ticks() + 1000
         self.amount = 0
+        # The number never changes, so it is composed once
+        self.image = Digit_atlas.render(self.text, self.font, self.color)
+        self.rect = self.image.get_rect(center=(self.x, self.y))
 
     def update(self):
         self.draw(self.game.screen)
 
     def draw(self, screen):
-        self.image = self.font.render(self.text, 1, self.color)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.x, self.y
         screen.blit(self.image, self.rect)
         if pygame.time.get_ticks() > self.end_time:
             self.kill()
@@ -166,7 +301,7 @@ class Level_up_text(pygame.sprite.Sprite):
 
     def draw(self, screen):
         if self.flag:
-            self.image = self.font.render(self.text, 1, self.color)
+            self.image = Text_cache.render(self.text, self.font, self.color)
             self.rect = self.image.get_rect()
             self.rect.center = self.x, self.y
             screen.blit(self.image, self.rect)
@@ -198,7 +333,7 @@ class Show_FPS(Text):
 
     def update(self):
         self.text = str(f"fps: {pygame.time.Clock.get_fps(self.game.clock):.2f}")
-        self.image = self.font.render(self.text, 1, self.color)
+        self.image = Text_cache.render(self.text, self.font, self.color)
         self.rect = self.image.get_rect()
         self.rect.center = self.x, self.y
 
@@ -0,0 +1,614 @@
+import math
+import random
+import pygame
+from collections import OrderedDict
+from config import *
+
+
+class Zone_map:
+    """
+    The zone of every tile of the map.
+
+    The grid is read from the compiled level (the zones are laid out in the legend),
+    so finding the zone of a position is a single lookup, whatever the number of
+    sprites and wherever the camera is.
+
+    Attributes:
+        columns (int): The number of columns of the map.
+        rows (int): The number of rows of the map.
+        zones (bytearray): The zone of every tile, row after row.
+
+    Methods:
+        zone_at(position): Returns the zone of a world position.
+    """
+
+    def __init__(self, columns, rows, zones):
+        self.columns = columns
+        self.rows = rows
+        self.zones = bytearray(zones)
+
+    def zone_at(self, position):
+        # Positions off the map belong to the zone of the nearest tile
+        column = min(max(int(position[0] // TILESIZE), 0), self.columns - 1)
+        row = min(max(int(position[1] // TILESIZE), 0), self.rows - 1)
+        return self.zones[row * self.columns + column]
+
+
+class Collision_map:
+    """
+    The blocks of the map, indexed by tile.
+
+    Every tile holds one byte: FREE, SOLID for a block filling the whole tile, or
+    PARTIAL for blocks that only cover part of it (like the narrow D decorations),
+    whose rectangles are kept aside. Finding the blocks a rectangle touches only looks
+    at the tiles it overlaps, however many blocks the map holds. The grid of a level
+    is filled when the level is compiled (see Level.compile).
+
+    Attributes:
+        columns (int): The number of columns of the map.
+        rows (int): The number of rows of the map.
+        cells (bytearray): The state of every tile, row after row.
+        shapes (dict): A dictionary mapping PARTIAL tiles to the rectangles of their blocks.
+
+    Methods:
+        tiles(rect): Returns the tiles a rectangle overlaps.
+        add(rect): Adds the rectangle of a block.
+        hits(rect): Returns the rectangles of the blocks a rectangle collides with.
+    """
+
+    FREE = 0
+    SOLID = 1
+    PARTIAL = 2
+
+    def __init__(self, columns, rows, cells=None, shapes=None):
+        self.columns = columns
+        self.rows = rows
+        self.cells = (
+            bytearray(cells) if cells is not None else bytearray(rows * columns)
+        )
+        self.shapes = dict(shapes) if shapes is not None else {}
+
+    def tiles(self, rect):
+        # The tiles a rectangle overlaps, row after row, like the blocks were created
+        left = max(rect.left // TILESIZE, 0)
+        right = min((rect.right - 1) // TILESIZE, self.columns - 1)
+        top = max(rect.top // TILESIZE, 0)
+        bottom = min((rect.bottom - 1) // TILESIZE, self.rows - 1)
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                yield column, row
+
+    def add(self, rect):
+        rect = pygame.Rect(rect)
+        for column, row in self.tiles(rect):
+            cell = row * self.columns + column
+            tile = pygame.Rect(column * TILESIZE, row * TILESIZE, TILESIZE, TILESIZE)
+            if self.cells[cell] == self.FREE and rect == tile:
+                self.cells[cell] = self.SOLID
+                continue
+            if self.cells[cell] == self.SOLID:
+                self.shapes[(column, row)] = [tile]
+            self.cells[cell] = self.PARTIAL
+            self.shapes.setdefault((column, row), []).append(rect)
+
+    def hits(self, rect):
+        hits = []
+        for column, row in self.tiles(rect):
+            cell = self.cells[row * self.columns + column]
+            if cell == self.SOLID:
+                hits.append(
+                    pygame.Rect(column * TILESIZE, row * TILESIZE, TILESIZE, TILESIZE)
+                )
+            elif cell == self.PARTIAL:
+                for shape in self.shapes[(column, row)]:
+                    # A block spanning several tiles is only reported once
+                    if shape.colliderect(rect) and not any(
+                        hit is shape for hit in hits
+                    ):
+                        hits.append(shape)
+        return hits
+
+
+class Spatial_hash:
+    """
+    A uniform grid of cells holding the sprites that overlap them.
+
+    A sprite is only moved between cells when its rectangle crosses a cell border, so
+    keeping the hash up to date costs O(1) per moving sprite, and finding the sprites
+    in a rectangle or around a point only looks at the cells they overlap. The cells
+    should be about the size of the sprites: larger cells hold more sprites that are
+    tested for nothing, smaller ones put every sprite in more cells. stats() tells how
+    full the cells are, to tune SPATIAL_CELL_SIZE against TILESIZE.
+
+    Attributes:
+        size (int): The width and height of a cell in pixels.
+        cells (dict): A dictionary mapping cells to the set of sprites overlapping them.
+        spans (dict): A dictionary mapping sprites to the range of cells they overlap.
+
+    Methods:
+        span(rect): Returns the range of cells a rectangle overlaps.
+        move(sprite): Adds a sprite or moves it to the cells of its current rectangle.
+        remove(sprite): Removes a sprite.
+        query(rect): Returns the sprites whose cells overlap a rectangle.
+        overlapping(rect): Returns the sprites overlapping a rectangle.
+        within(position, radius): Returns the sprites within a distance of a point.
+        stats(): Returns the number of sprites and cells and how full the cells are.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.size = cell_size
+        self.cells = {}
+        self.spans = {}
+
+    def span(self, rect):
+        return (
+            rect.left // self.size,
+            rect.top // self.size,
+            (rect.right - 1) // self.size,
+            (rect.bottom - 1) // self.size,
+        )
+
+    def move(self, sprite):
+        span = self.span(sprite.rect)
+        if self.spans.get(sprite) == span:
+            return
+        self.remove(sprite)
+        left, top, right, bottom = span
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self.cells.setdefault((column, row), set()).add(sprite)
+        self.spans[sprite] = span
+
+    def remove(self, sprite):
+        span = self.spans.pop(sprite, None)
+        if span is None:
+            return
+        left, top, right, bottom = span
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells[(column, row)]
+                cell.discard(sprite)
+                if not cell:
+                    del self.cells[(column, row)]
+
+    def query(self, rect):
+        found = set()
+        left, top, right, bottom = self.span(rect)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    found |= cell
+        return found
+
+    def overlapping(self, rect):
+        return [sprite for sprite in self.query(rect) if sprite.rect.colliderect(rect)]
+
+    def within(self, position, radius):
+        # The sprites whose rectangle has a point at most radius pixels from position
+        x, y = position
+        found = []
+        box = pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+        for sprite in self.query(box):
+            rect = sprite.rect
+            if not rect.colliderect(box):
+                continue
+            dx = max(rect.left - x, 0, x - rect.right + 1)
+            dy = max(rect.top - y, 0, y - rect.bottom + 1)
+            if dx * dx + dy * dy <= radius * radius:
+                found.append(sprite)
+        return found
+
+    def stats(self):
+        entries = sum(len(cell) for cell in self.cells.values())
+        return {
+            "size": self.size,
+            "sprites": len(self.spans),
+            "cells": len(self.cells),
+            "per_cell": round(entries / max(len(self.cells), 1), 2),
+            "max_per_cell": max((len(cell) for cell in self.cells.values()), default=0),
+            "cells_per_sprite": round(entries / max(len(self.spans), 1), 2),
+        }
+
+
+class Chunk_map:
+    """
+    The static terrain of the map, baked into chunk surfaces.
+
+    Ground tiles and blocks never move, so instead of being drawn one by one every
+    frame they are painted into surfaces of CHUNK_SIZE x CHUNK_SIZE tiles. A chunk is
+    baked the first time it comes into view and only the chunks overlapping the screen
+    are drawn. At most CHUNK_CACHE_SIZE baked chunks are kept, the least recently
+    drawn ones are baked again when they come back into view.
+
+    Attributes:
+        size (int): The width and height of a chunk in pixels.
+        tiles (dict): A dictionary mapping chunks to the (layer, image, position) of
+            the tiles painted on them.
+        surfaces (OrderedDict): The baked chunks, least recently drawn first.
+        bakes (int): The number of chunks baked so far.
+        drawn (int): The number of chunks drawn in the last frame.
+
+    Methods:
+        add(sprite): Adds a static sprite to the chunks it overlaps.
+        bake(chunk): Paints the tiles of a chunk on a new surface.
+        draw(surface, camera): Draws the chunks overlapping the screen.
+        tile_pixels(): Returns the bytes of the tile surfaces painted on the chunks.
+        stats(): Returns the number of chunks, bakes and draws and the megabytes of
+            the baked chunks and of the tiles.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.size = chunk_size * TILESIZE
+        self.tiles = {}
+        self.surfaces = OrderedDict()
+        self.bakes = 0
+        self.drawn = 0
+
+    def add(self, sprite):
+        rect = sprite.rect
+        for column in range(rect.left // self.size, (rect.right - 1) // self.size + 1):
+            for row in range(rect.top // self.size, (rect.bottom - 1) // self.size + 1):
+                position = (rect.x - column * self.size, rect.y - row * self.size)
+                self.tiles.setdefault((column, row), []).append(
+                    (sprite._layer, sprite.image, position)
+                )
+
+    def bake(self, chunk):
+        surface = pygame.Surface((self.size, self.size)).convert()
+        # The screen is cleared with this colour, so empty tiles look the same
+        surface.fill(LIGHTBLUE)
+        # Lower layers first, tiles of a layer in the order they were added
+        tiles = sorted(self.tiles[chunk], key=lambda tile: tile[0])
+        surface.blits([(image, position) for layer, image, position in tiles], False)
+        self.bakes += 1
+        return surface
+
+    def draw(self, surface, camera):
+        width, height = surface.get_size()
+        blits = []
+        for row in range(
+            camera.y // self.size, (camera.y + height - 1) // self.size + 1
+        ):
+            for column in range(
+                camera.x // self.size, (camera.x + width - 1) // self.size + 1
+            ):
+                chunk = (column, row)
+                if chunk not in self.tiles:
+                    continue
+                baked = self.surfaces.get(chunk)
+                if baked is None:
+                    baked = self.bake(chunk)
+                    self.surfaces[chunk] = baked
+                    if len(self.surfaces) > CHUNK_CACHE_SIZE:
+                        self.surfaces.popitem(last=False)
+                else:
+                    self.surfaces.move_to_end(chunk)
+                blits.append(
+                    (baked, camera.to_screen((column * self.size, row * self.size)))
+                )
+        surface.blits(blits, False)
+        self.drawn = len(blits)
+
+    def tile_pixels(self):
+        # The bytes of the tile surfaces painted on the chunks, shared ones count once
+        images = {
+            id(image): image
+            for tiles in self.tiles.values()
+            for layer, image, position in tiles
+        }
+        return sum(
+            image.get_width() * image.get_height() * image.get_bytesize()
+            for image in images.values()
+        )
+
+    def stats(self):
+        return {
+            "chunks": len(self.tiles),
+            "baked": len(self.surfaces),
+            "bakes": self.bakes,
+            "drawn": self.drawn,
+            "MB": round(len(self.surfaces) * self.size * self.size * 4 / 2**20, 1),
+            "tile_MB": round(self.tile_pixels() / 2**20, 2),
+        }
+
+
+class Entity_stream:
+    """
+    The entities of the map, only instantiated in the chunks around the player.
+
+    The map is split into chunks of CHUNK_SIZE x CHUNK_SIZE tiles. Entities are added
+    as records (the class and the arguments that create them) and are only created
+    when their chunk comes within STREAM_RADIUS chunks of the player. Entities more
+    than one chunk beyond that radius are stored back into the chunk they stand in
+    as their compact state (see Enemy.store) and removed from the game, so the
+    sprites updated every frame and the memory they hold depend on the area around
+    the player, not on the size of the map. The extra chunk keeps an entity standing
+    on the border from being created and stored over and over.
+
+    Attributes:
+        game (Game): The game instance.
+        size (int): The width and height of a chunk in pixels.
+        radius (int): The number of chunks around the player's chunk that are active.
+        dormant (dict): A dictionary mapping chunks to the records of their stored entities.
+        active (set): The chunks within the radius of the player.
+        live (set): The entities created by the stream that are still in the game.
+        center (tuple): The chunk the player was in at the last update, or None.
+        spawns (int): The number of entities created so far.
+        stores (int): The number of entities stored back so far.
+
+    Methods:
+        chunk_of(position): Returns the chunk of a world position.
+        add(factory, column, row, *args, **kwargs): Adds an entity on a tile.
+        spawn(record): Creates the entity of a record.
+        activate(chunk): Creates the entities stored in a chunk.
+        update(position): Activates and deactivates the chunks around a position.
+        stats(): Returns the number of live and stored entities and the counters.
+    """
+
+    def __init__(self, game, chunk_size=CHUNK_SIZE, radius=STREAM_RADIUS):
+        self.game = game
+        self.size = chunk_size * TILESIZE
+        self.radius = radius
+        self.dormant = {}
+        self.active = set()
+        self.live = set()
+        self.center = None
+        self.spawns = 0
+        self.stores = 0
+
+    def chunk_of(self, position):
+        return int(position[0] // self.size), int(position[1] // self.size)
+
+    def add(self, factory, column, row, *args, **kwargs):
+        # The entity is created like factory(game, column, row, *args, **kwargs)
+        record = (factory, (column, row) + args, kwargs, None)
+        chunk = self.chunk_of((column * TILESIZE, row * TILESIZE))
+        if chunk in self.active:
+            self.spawn(record)
+        else:
+            self.dormant.setdefault(chunk, []).append(record)
+
+    def spawn(self, record):
+        factory, args, kwargs, state = record
+        entity = factory(self.game, *args, **kwargs)
+        if state is not None:
+            entity.restore(state)
+        entity.stream_record = (factory, args, kwargs)
+        self.live.add(entity)
+        self.spawns += 1
+        return entity
+
+    def activate(self, chunk):
+        for record in self.dormant.pop(chunk, ()):
+            self.spawn(record)
+
+    def update(self, position):
+        center = self.chunk_of(position)
+        if center == self.center:
+            return
+        self.center = center
+        column, row = center
+        active = {
+            (column + x, row + y)
+            for x in range(-self.radius, self.radius + 1)
+            for y in range(-self.radius, self.radius + 1)
+        }
+        entering = active - self.active
+        self.active = active
+
+        for entity in list(self.live):
+            if not entity.alive():
+                # Killed in the game, the spawner brings it back if it has to
+                self.live.discard(entity)
+                continue
+            chunk = self.chunk_of(entity.rect.center)
+            if max(abs(chunk[0] - column), abs(chunk[1] - row)) > self.radius + 1:
+                factory, args, kwargs = entity.stream_record
+                self.dormant.setdefault(chunk, []).append(
+                    (factory, args, kwargs, entity.store())
+                )
+                entity.kill()
+                self.live.discard(entity)
+                self.stores += 1
+
+        for chunk in entering:
+            self.activate(chunk)
+
+    def stats(self):
+        return {
+            "live": sum(1 for entity in self.live if entity.alive()),
+            "dormant": sum(len(records) for records in self.dormant.values()),
+            "spawns": self.spawns,
+            "stores": self.stores,
+        }
+
+
+class Enemy_activation:
+    """
+    Puts the enemies far from the player to sleep and wakes them up when the player
+    comes back.
+
+    An enemy is idle when its updates change nothing until the player comes within
+    its reach or enters another zone: out of reach with its attack cooled down, or
+    waiting for the player to enter its zone (see Enemy.idle). At the end of its
+    update, an idle enemy more than ENEMY_SLEEP_MARGIN pixels beyond its reach of
+    the player falls asleep: it joins the dormant sprites the game's sprites skip
+    (see Culled_group.update) and leaves the enemies the simulation updates. The
+    sleeping enemies do not move, they are kept in a spatial hash of their own, and
+    every frame the ones less than ENEMY_WAKE_MARGIN pixels beyond their reach of the
+    player are found through it and woken up. The wake margin is smaller than the sleep margin, so an enemy on the border
+    does not fall asleep and wake up over and over, and larger than the distance the
+    player moves in a frame, so enemies are awake before the player reaches them.
+    Hits and the player entering another zone wake enemies up too, so the game plays
+    the same as when every enemy is updated.
+
+    Attributes:
+        game (Game): The game instance.
+        dormant (set): The sleeping enemies, shared with the game's sprites.
+        index (Spatial_hash): The spatial hash of the sleeping enemies.
+        reach (int): The largest reach of the enemies put to sleep so far.
+        sleeps (int): The number of times an enemy fell asleep.
+        wakes (int): The number of times an enemy woke up.
+
+    Methods:
+        settle(enemy): Puts an enemy to sleep if it is idle and far from the player.
+        sleep(enemy): Puts an enemy to sleep.
+        wake(enemy): Wakes an enemy up.
+        wake_all(): Wakes every enemy up.
+        remove(enemy): Forgets an enemy that left the game.
+        update(): Wakes the enemies the player came near.
+        stats(): Returns the number of active and sleeping enemies and the counters.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.dormant = game.all_sprites.dormant
+        self.index = Spatial_hash()
+        self.reach = 0
+        self.sleeps = 0
+        self.wakes = 0
+
+    def settle(self, enemy):
+        x, y = self.game.player.rect.topleft
+        # The distance enemies measure the player's from, see Enemy.movement
+        distance = math.hypot(x - enemy.rect.x, y - enemy.rect.y)
+        if distance >= enemy.reach + ENEMY_SLEEP_MARGIN and enemy.idle():
+            self.sleep(enemy)
+
+    def sleep(self, enemy):
+        self.dormant.add(enemy)
+        self.index.move(enemy)
+        if enemy.slot is not None:
+            self.game.simulation.dormant[enemy.slot] = True
+        self.reach = max(self.reach, enemy.reach)
+        self.sleeps += 1
+
+    def wake(self, enemy):
+        if enemy not in self.dormant:
+            return
+        self.dormant.discard(enemy)
+        self.index.remove(enemy)
+        if enemy.slot is not None:
+            self.game.simulation.dormant[enemy.slot] = False
+        self.wakes += 1
+
+    def wake_all(self):
+        for enemy in list(self.dormant):
+            self.wake(enemy)
+
+    def remove(self, enemy):
+        self.dormant.discard(enemy)
+        self.index.remove(enemy)
+
+    def update(self):
+        if not self.dormant:
+            return
+        x, y = self.game.player.rect.topleft
+        # A sprite's rectangle is never further from a point than its top-left corner
+        for enemy in self.index.within((x, y), self.reach + ENEMY_WAKE_MARGIN):
+            if (
+                math.hypot(x - enemy.rect.x, y - enemy.rect.y)
+                < enemy.reach + ENEMY_WAKE_MARGIN
+            ):
+                self.wake(enemy)
+
+    def stats(self):
+        return {
+            "active": len(self.game.enemies) - len(self.dormant),
+            "dormant": len(self.dormant),
+            "sleeps": self.sleeps,
+            "wakes": self.wakes,
+        }
+
+
+def place_crowd(game, count):
+    """
+    Scatters a crowd of mouse meadow enemies within reach of the player.
+
+    Used by the benchmarks. The enemies are put on free tiles inside the border of the
+    map, with the archetypes picked by the random module, so seed it first to place
+    the same crowd every time.
+
+    Args:
+        game (Game): The game instance.
+        count (int): The number of enemies to place.
+    """
+    from entities import Enemy
+
+    archetypes = [
+        archetype
+        for archetype in game.level.enemies
+        if archetype["class"] == "Enemy" and archetype["args"][2][-5:] == "Mouse"
+    ]
+    column, row = game.player.rect.x // TILESIZE, game.player.rect.y // TILESIZE
+    spread = Enemy.reach // TILESIZE
+    placed = 0
+    while placed < count:
+        x = column + random.randint(-spread, spread)
+        y = row + random.randint(-spread, spread)
+        if not (0 < x < game.level.columns - 1 and 0 < y < game.level.rows - 1):
+            continue
+        if game.collision_map.cells[y * game.level.columns + x]:
+            continue
+        game.stream.add(Enemy, x, y, *random.choice(archetypes)["args"])
+        placed += 1
+
+
+if __name__ == "__main__":
+    # Measures the spatial hash of the sprites with cells of a few sizes, as multiples
+    # of TILESIZE, against testing every enemy: python world.py 1 2 4 8
+    import os
+    import sys
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from main import Game
+    from entities import Enemy
+
+    random.seed(0)
+    game = Game(show_intro=False)
+    game.new()
+    # A crowd of mouse meadow enemies scattered within reach of the player
+    place_crowd(game, 1000)
+    game.all_sprites.update()
+    # Rectangles the size of the player's attacks all over the crowd
+    rects = [
+        pygame.Rect(
+            game.player.rect.x + random.randint(-Enemy.reach, Enemy.reach),
+            game.player.rect.y + random.randint(-Enemy.reach, Enemy.reach),
+            TILESIZE,
+            TILESIZE,
+        )
+        for rect in range(200)
+    ]
+    frames = 20
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        for rect in rects:
+            [enemy for enemy in game.enemies if enemy.rect.colliderect(rect)]
+    every = (time.perf_counter() - start) * 1000 / frames
+    print(f"{len(game.enemies)} enemies, {len(rects)} attacks")
+    print(f"every enemy: {every:.2f}ms")
+    print("cell  sprites  cells  per cell  max  cells/sprite  attacks  separation")
+    for size in [int(size) for size in sys.argv[1:]] or [1, 2, 4, 8]:
+        game.all_sprites.index = Spatial_hash(size * TILESIZE)
+        for sprite in game.all_sprites:
+            game.all_sprites.index.move(sprite)
+        start = time.perf_counter()
+        for frame in range(frames):
+            for rect in rects:
+                game.all_sprites.index.overlapping(rect)
+        attacks = (time.perf_counter() - start) * 1000 / frames
+        start = time.perf_counter()
+        for frame in range(frames):
+            Enemy.separate(game, TILESIZE // 4)
+        separation = (time.perf_counter() - start) * 1000 / frames
+        stats = game.all_sprites.index.stats()
+        print(
+            f"{size:>3}T {stats['sprites']:>8} {stats['cells']:>6} "
+            f"{stats['per_cell']:>9} {stats['max_per_cell']:>4} "
+            f"{stats['cells_per_sprite']:>13} {attacks:>6.2f}ms {separation:>9.2f}ms"
+        )